@@ -68,6 +68,8 @@ class AccountsConfig(AppConfig):
         from .signals import (  # noqa:register the signals
             log_user_login,
             log_user_logout,
+            update_conversation_on_message_delete,
+            update_conversation_on_message_save,
         )
 
         if self._has_run:
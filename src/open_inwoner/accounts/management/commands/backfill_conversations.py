@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from ...models import Conversation, Message
+from ...query import rebuild_conversations
+
+
+class Command(BaseCommand):
+    help = "Rebuild the conversation summaries of the inbox from all messages"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of conversations to write per query.",
+        )
+
+    def handle(self, *args, **options):
+        total = rebuild_conversations(
+            Conversation, Message, batch_size=options["batch_size"]
+        )
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {total} conversations"))
@@ -0,0 +1,147 @@
+# Generated by Django 4.2.16 on 2026-10-19 10:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, F, Max, Q
+from django.db.models.functions import Greatest, Least
+
+
+def backfill_conversations(apps, schema_editor):
+    Conversation = apps.get_model("accounts", "Conversation")
+    Message = apps.get_model("accounts", "Message")
+
+    pairs = (
+        Message.objects.annotate(
+            user_a_id=Least("sender_id", "receiver_id"),
+            user_b_id=Greatest("sender_id", "receiver_id"),
+        )
+        .order_by()
+        .values("user_a_id", "user_b_id")
+        .annotate(
+            last_message_id=Max("id"),
+            unread_a=Count("id", filter=Q(seen=False, receiver_id=F("user_a_id"))),
+            unread_b=Count("id", filter=Q(seen=False, receiver_id=F("user_b_id"))),
+        )
+    )
+
+    batch = []
+    for row in pairs.iterator(chunk_size=1000):
+        batch.append(row)
+        if len(batch) >= 1000:
+            _create_conversations(Conversation, Message, batch)
+            batch = []
+    if batch:
+        _create_conversations(Conversation, Message, batch)
+
+
+def _create_conversations(Conversation, Message, rows):
+    created_on = dict(
+        Message.objects.filter(
+            pk__in=[row["last_message_id"] for row in rows]
+        ).values_list("pk", "created_on")
+    )
+    Conversation.objects.bulk_create(
+        [
+            Conversation(last_message_on=created_on[row["last_message_id"]], **row)
+            for row in rows
+        ]
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0079_digid_eherkenning_configs"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Conversation",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "last_message_on",
+                    models.DateTimeField(verbose_name="Last message on"),
+                ),
+                (
+                    "unread_a",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Unread messages of user A"
+                    ),
+                ),
+                (
+                    "unread_b",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Unread messages of user B"
+                    ),
+                ),
+                (
+                    "last_message",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="accounts.message",
+                        verbose_name="Last message",
+                    ),
+                ),
+                (
+                    "user_a",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="User A",
+                    ),
+                ),
+                (
+                    "user_b",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="User B",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Conversation",
+                "verbose_name_plural": "Conversations",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="conversation",
+            index=models.Index(
+                fields=["user_a", "-last_message"], name="conversation_user_a_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="conversation",
+            index=models.Index(
+                fields=["user_b", "-last_message"], name="conversation_user_b_idx"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="conversation",
+            constraint=models.UniqueConstraint(
+                fields=("user_a", "user_b"), name="unique_conversation_users"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="conversation",
+            constraint=models.CheckConstraint(
+                check=models.Q(("user_a__lte", models.F("user_b"))),
+                name="conversation_users_ordered",
+            ),
+        ),
+        migrations.RunPython(backfill_conversations, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.16 on 2026-10-19 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0080_conversation"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="message",
+            index=models.Index(
+                fields=["sender", "receiver", "created_on"], name="message_thread_idx"
+            ),
+        ),
+    ]
@@ -41,7 +41,7 @@ from .choices import (
     TypeChoices,
 )
 from .managers import ActionQueryset, DigidManager, UserManager, eHerkenningManager
-from .query import InviteQuerySet, MessageQuerySet
+from .query import ConversationQuerySet, InviteQuerySet, MessageQuerySet
 
 ###
 # Configuration
@@ -429,7 +429,7 @@ class User(AbstractBaseUser, PermissionsMixin):
         return ""
 
     def get_new_messages_total(self) -> int:
-        return self.received_messages.filter(seen=False).count()
+        return Conversation.objects.get_unread_total(self)
 
     def get_all_files(self):
         return self.documents.order_by("-created_on")
@@ -823,11 +823,93 @@ class Message(models.Model):
     class Meta:
         verbose_name = _("Message")
         verbose_name_plural = _("Messages")
+        indexes = [
+            models.Index(
+                fields=["sender", "receiver", "created_on"],
+                name="message_thread_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"From: {self.sender}, To: {self.receiver} ({self.created_on.date()})"
 
 
+class Conversation(models.Model):
+    """
+    Denormalized summary of the messages between two users.
+
+    There is one row per pair of users, where `user_a` is always the user with the
+    lowest primary key. The row is kept up to date when messages are created or
+    marked as seen, so the inbox doesn't have to aggregate the message table.
+    """
+
+    user_a = models.ForeignKey(
+        User,
+        verbose_name=_("User A"),
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    user_b = models.ForeignKey(
+        User,
+        verbose_name=_("User B"),
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    last_message = models.ForeignKey(
+        Message,
+        verbose_name=_("Last message"),
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="+",
+    )
+    last_message_on = models.DateTimeField(
+        verbose_name=_("Last message on"),
+    )
+    unread_a = models.PositiveIntegerField(
+        verbose_name=_("Unread messages of user A"),
+        default=0,
+    )
+    unread_b = models.PositiveIntegerField(
+        verbose_name=_("Unread messages of user B"),
+        default=0,
+    )
+
+    objects = ConversationQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _("Conversation")
+        verbose_name_plural = _("Conversations")
+        constraints = [
+            UniqueConstraint(
+                fields=["user_a", "user_b"],
+                name="unique_conversation_users",
+            ),
+            models.CheckConstraint(
+                check=Q(user_a__lte=models.F("user_b")),
+                name="conversation_users_ordered",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["user_a", "-last_message"],
+                name="conversation_user_a_idx",
+            ),
+            models.Index(
+                fields=["user_b", "-last_message"],
+                name="conversation_user_b_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user_a} - {self.user_b}"
+
+    def get_other_user_id(self, user: User) -> int:
+        return self.user_b_id if user.pk == self.user_a_id else self.user_a_id
+
+    def get_unread_for(self, user: User) -> int:
+        return self.unread_a if user.pk == self.user_a_id else self.unread_b
+
+
 class Invite(models.Model):
     inviter = models.ForeignKey(
         User,
@@ -1,10 +1,12 @@
 from typing import TYPE_CHECKING
 
-from django.db.models import Case, F, Max, OuterRef, Q, Subquery, When
+from django.db import transaction
+from django.db.models import Case, Count, F, Max, Q, Subquery, Sum, When
+from django.db.models.functions import Greatest, Least
 from django.db.models.query import QuerySet
 
 if TYPE_CHECKING:
-    from open_inwoner.accounts.models import User
+    from open_inwoner.accounts.models import Conversation, Message, User
 
 
 class MessageQuerySet(QuerySet):
@@ -33,22 +35,9 @@ class MessageQuerySet(QuerySet):
             Conversations should be unique/distinct by other_user_id.
 
         """
-        filtered_messages = (
-            self.filter(Q(receiver=user) | Q(sender=user))
-            .annotate(
-                other_user_uuid=Case(
-                    When(receiver=user, then=F("sender__uuid")),
-                    default=F("receiver__uuid"),
-                )
-            )
-            .order_by()
-        )
-        grouped_messages = (
-            filtered_messages.filter(other_user_uuid=OuterRef("other_user_uuid"))
-            .values("other_user_uuid")
-            .annotate(max_id=Max("id"))
-            .values("max_id")
-        )
+        from .models import Conversation
+
+        last_message_ids = Conversation.objects.for_user(user).values("last_message_id")
         result = (
             self.annotate(
                 other_user_uuid=Case(
@@ -56,7 +45,7 @@ class MessageQuerySet(QuerySet):
                     default=F("receiver__uuid"),
                 )
             )
-            .filter(id=Subquery(grouped_messages))
+            .filter(id__in=Subquery(last_message_ids))
             .annotate(
                 other_user_first_name=Case(
                     When(receiver=user, then=F("sender__first_name")),
@@ -91,7 +80,15 @@ class MessageQuerySet(QuerySet):
                 "sender",
                 "receiver",
             )
-            .order_by("-created_on")
+            .order_by("-created_on", "-pk")
+        )
+
+    def before(self, created_on, pk) -> "MessageQuerySet":
+        """
+        Keyset pagination: messages older than the message at (created_on, pk)
+        """
+        return self.filter(
+            Q(created_on__lt=created_on) | Q(created_on=created_on, pk__lt=pk)
         )
 
     def mark_seen(self, user, other_user) -> int:
@@ -99,9 +96,163 @@ class MessageQuerySet(QuerySet):
         Mark messages as seen between two users.
         Returns the number of updated messages.
         """
-        return self.filter(receiver=user, sender=other_user, seen=False).update(
-            seen=True
+        from .models import Conversation
+
+        with transaction.atomic():
+            total_marked = self.filter(
+                receiver=user, sender=other_user, seen=False
+            ).update(seen=True)
+            Conversation.objects.mark_seen(user, other_user)
+        return total_marked
+
+
+def rebuild_conversations(conversation_model, message_model, batch_size=1000) -> int:
+    """
+    Recompute every conversation from the message table in a set-based manner.
+
+    Takes the models as arguments so it can be used from data migrations.
+    Returns the number of conversations.
+    """
+    pairs = (
+        message_model.objects.annotate(
+            user_a_id=Least("sender_id", "receiver_id"),
+            user_b_id=Greatest("sender_id", "receiver_id"),
+        )
+        .order_by()
+        .values("user_a_id", "user_b_id")
+        .annotate(
+            last_message_id=Max("id"),
+            unread_a=Count("id", filter=Q(seen=False, receiver_id=F("user_a_id"))),
+            unread_b=Count("id", filter=Q(seen=False, receiver_id=F("user_b_id"))),
         )
+    )
+
+    total = 0
+    batch = []
+    with transaction.atomic():
+        for row in pairs.iterator(chunk_size=batch_size):
+            batch.append(row)
+            if len(batch) >= batch_size:
+                total += _save_conversations(conversation_model, message_model, batch)
+                batch = []
+        if batch:
+            total += _save_conversations(conversation_model, message_model, batch)
+
+        conversation_model.objects.filter(last_message__isnull=True).delete()
+    return total
+
+
+def _save_conversations(conversation_model, message_model, rows) -> int:
+    created_on = dict(
+        message_model.objects.filter(
+            pk__in=[row["last_message_id"] for row in rows]
+        ).values_list("pk", "created_on")
+    )
+    conversation_model.objects.bulk_create(
+        [
+            conversation_model(
+                last_message_on=created_on[row["last_message_id"]], **row
+            )
+            for row in rows
+        ],
+        update_conflicts=True,
+        unique_fields=["user_a", "user_b"],
+        update_fields=["last_message", "last_message_on", "unread_a", "unread_b"],
+    )
+    return len(rows)
+
+
+class ConversationQuerySet(QuerySet):
+    def for_user(self, user: "User") -> "ConversationQuerySet":
+        """
+        Conversations involving `user`, newest first
+        """
+        return self.filter(Q(user_a=user) | Q(user_b=user)).order_by("-last_message_id")
+
+    def for_users(self, user: "User", other_user: "User") -> "ConversationQuerySet":
+        user_a_id, user_b_id = sorted([user.pk, other_user.pk])
+        return self.filter(user_a_id=user_a_id, user_b_id=user_b_id)
+
+    def before(self, last_message_id: int | None) -> "ConversationQuerySet":
+        """
+        Keyset pagination: conversations older than the one with `last_message_id`
+        """
+        if last_message_id is None:
+            return self
+        return self.filter(last_message_id__lt=last_message_id)
+
+    def get_unread_total(self, user: "User") -> int:
+        totals = self.filter(Q(user_a=user) | Q(user_b=user)).aggregate(
+            total_a=Sum("unread_a", filter=Q(user_a=user)),
+            total_b=Sum("unread_b", filter=Q(user_b=user)),
+        )
+        return (totals["total_a"] or 0) + (totals["total_b"] or 0)
+
+    def register_message(self, message: "Message") -> "Conversation":
+        """
+        Update the conversation between sender and receiver with a new message
+        """
+        user_a_id, user_b_id = sorted([message.sender_id, message.receiver_id])
+        with transaction.atomic():
+            conversation, _created = self.select_for_update().get_or_create(
+                user_a_id=user_a_id,
+                user_b_id=user_b_id,
+                defaults={
+                    "last_message": message,
+                    "last_message_on": message.created_on,
+                },
+            )
+            if (
+                conversation.last_message_id is None
+                or message.pk >= conversation.last_message_id
+            ):
+                conversation.last_message = message
+                conversation.last_message_on = message.created_on
+            if not message.seen:
+                if message.receiver_id == user_a_id:
+                    conversation.unread_a += 1
+                else:
+                    conversation.unread_b += 1
+            conversation.save()
+        return conversation
+
+    def mark_seen(self, user: "User", other_user: "User") -> None:
+        """
+        Reset the unread count of `user` for the conversation with `other_user`
+        """
+        if user.pk <= other_user.pk:
+            self.for_users(user, other_user).update(unread_a=0)
+        else:
+            self.for_users(user, other_user).update(unread_b=0)
+
+    def rebuild_for_users(self, user_id: int, other_user_id: int) -> None:
+        """
+        Recompute the conversation between two users from their messages
+        """
+        from .models import Message
+
+        user_a_id, user_b_id = sorted([user_id, other_user_id])
+        messages = Message.objects.filter(
+            Q(sender_id=user_a_id, receiver_id=user_b_id)
+            | Q(sender_id=user_b_id, receiver_id=user_a_id)
+        )
+        with transaction.atomic():
+            last_message = messages.order_by("-pk").first()
+            if not last_message:
+                self.filter(user_a_id=user_a_id, user_b_id=user_b_id).delete()
+                return
+
+            unread = messages.filter(seen=False)
+            self.update_or_create(
+                user_a_id=user_a_id,
+                user_b_id=user_b_id,
+                defaults={
+                    "last_message": last_message,
+                    "last_message_on": last_message.created_on,
+                    "unread_a": unread.filter(receiver_id=user_a_id).count(),
+                    "unread_b": unread.filter(receiver_id=user_b_id).count(),
+                },
+            )
 
 
 class InviteQuerySet(QuerySet):
@@ -1,12 +1,16 @@
 import logging
 
+from django.conf import settings
 from django.contrib.auth.signals import user_logged_in, user_logged_out
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.urls import reverse
 from django.utils.translation import gettext as _
 
-from open_inwoner.accounts.models import User
+from open_inwoner.accounts.models import Conversation, Message, User
 from open_inwoner.haalcentraal.models import HaalCentraalConfig
+from open_inwoner.haalcentraal.tasks import update_brp_data
 from open_inwoner.haalcentraal.utils import update_brp_data_in_db
 from open_inwoner.kvk.client import KvKClient
 from open_inwoner.openklant.services import OpenKlant2Service, eSuiteKlantenService
@@ -111,10 +115,62 @@ def log_user_login(sender, user, request, *args, **kwargs):
 
     if user.login_type == LoginTypeChoices.digid:
         if brp_config.service:
-            update_brp_data_in_db(user)
+            if settings.BRP_UPDATE_ON_LOGIN_ASYNC:
+                # fetch in the background so login isn't blocked on the BRP API;
+                # the result is cached for the profile pages
+                transaction.on_commit(lambda: update_brp_data.delay(user.pk))
+            else:
+                update_brp_data_in_db(user)
 
 
 @receiver(user_logged_out)
 def log_user_logout(sender, user, request, *args, **kwargs):
     if user:
         user_action(request, user, MESSAGE_TYPE["logout"])
+
+
+@receiver(post_save, sender=Message)
+def update_conversation_on_message_save(
+    sender, instance, created, raw=False, update_fields=None, **kwargs
+):
+    if raw:
+        return
+
+    if created:
+        Conversation.objects.register_message(instance)
+    elif update_fields is None or {"seen", "created_on"} & set(update_fields):
+        Conversation.objects.rebuild_for_users(instance.sender_id, instance.receiver_id)
+
+
+def _get_conversation_rebuild(using):
+    """
+    Return the callback that rebuilds the conversations of deleted messages once the
+    current transaction commits, registering a new one if it isn't pending.
+    """
+    connection = transaction.get_connection(using)
+    rebuild = getattr(connection, "_conversation_rebuild", None)
+    # callbacks are dropped when their (savepoint) transaction is rolled back
+    if rebuild is not None and any(
+        callback[1] is rebuild for callback in connection.run_on_commit
+    ):
+        return rebuild
+
+    pairs = set()
+
+    def rebuild():
+        for user_id, other_user_id in pairs:
+            Conversation.objects.rebuild_for_users(user_id, other_user_id)
+
+    rebuild.pairs = pairs
+    connection._conversation_rebuild = rebuild
+    return rebuild
+
+
+@receiver(post_delete, sender=Message)
+def update_conversation_on_message_delete(sender, instance, using=None, **kwargs):
+    # a cascade (e.g. deleting a user) deletes many messages of a conversation,
+    # rebuild each conversation once when the transaction commits
+    rebuild = _get_conversation_rebuild(using)
+    rebuild.pairs.add(tuple(sorted([instance.sender_id, instance.receiver_id])))
+    if len(rebuild.pairs) == 1:
+        transaction.on_commit(rebuild, using=using)
@@ -44,7 +44,11 @@ CANCEL_URL = reverse("login")
 
 @override_settings(ROOT_URLCONF="open_inwoner.cms.tests.urls")
 class DigiDRegistrationTest(
-    AssertRedirectsMixin, AssertTimelineLogMixin, HaalCentraalMixin, WebTest
+    ClearCachesMixin,
+    AssertRedirectsMixin,
+    AssertTimelineLogMixin,
+    HaalCentraalMixin,
+    WebTest,
 ):
     """Tests concerning the registration of DigiD users"""
 
@@ -0,0 +1,171 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db import DatabaseError, transaction
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from django_webtest import WebTest
+
+from ..models import Conversation, Message
+from .factories import MessageFactory, UserFactory
+
+
+class ConversationModelTests(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.user = UserFactory.create()
+        self.other = UserFactory.create()
+
+    def test_message_creates_single_conversation_per_pair(self):
+        MessageFactory.create(sender=self.user, receiver=self.other)
+        last_message = MessageFactory.create(sender=self.other, receiver=self.user)
+
+        self.assertEqual(Conversation.objects.count(), 1)
+
+        conversation = Conversation.objects.get()
+        self.assertEqual(
+            {conversation.user_a_id, conversation.user_b_id},
+            {self.user.pk, self.other.pk},
+        )
+        self.assertLess(conversation.user_a_id, conversation.user_b_id)
+        self.assertEqual(conversation.last_message, last_message)
+        self.assertEqual(conversation.last_message_on, last_message.created_on)
+        self.assertEqual(conversation.get_unread_for(self.user), 1)
+        self.assertEqual(conversation.get_unread_for(self.other), 1)
+
+    def test_mark_seen_resets_unread_count(self):
+        MessageFactory.create_batch(3, sender=self.other, receiver=self.user)
+        MessageFactory.create(sender=self.user, receiver=self.other)
+
+        self.assertEqual(self.user.get_new_messages_total(), 3)
+
+        total_marked = Message.objects.mark_seen(self.user, self.other)
+
+        self.assertEqual(total_marked, 3)
+        self.assertEqual(self.user.get_new_messages_total(), 0)
+        self.assertEqual(self.other.get_new_messages_total(), 1)
+
+    def test_new_messages_total_over_conversations(self):
+        third = UserFactory.create()
+        MessageFactory.create_batch(2, sender=self.other, receiver=self.user)
+        MessageFactory.create(sender=third, receiver=self.user)
+        MessageFactory.create(sender=third, receiver=self.user, seen=True)
+
+        self.assertEqual(self.user.get_new_messages_total(), 3)
+
+    def test_deleting_messages_updates_conversation(self):
+        first = MessageFactory.create(sender=self.user, receiver=self.other)
+        last = MessageFactory.create(sender=self.other, receiver=self.user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            last.delete()
+
+        conversation = Conversation.objects.get()
+        self.assertEqual(conversation.last_message, first)
+        self.assertEqual(conversation.get_unread_for(self.user), 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            first.delete()
+
+        self.assertFalse(Conversation.objects.exists())
+
+    def test_deleting_user_rebuilds_conversations_once(self):
+        third = UserFactory.create()
+        MessageFactory.create_batch(3, sender=self.other, receiver=self.user)
+        MessageFactory.create_batch(2, sender=self.user, receiver=third)
+        MessageFactory.create(sender=self.other, receiver=third)
+
+        with patch.object(
+            Conversation.objects,
+            "rebuild_for_users",
+            autospec=True,
+            side_effect=Conversation.objects.rebuild_for_users,
+        ) as mock_rebuild:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.user.delete()
+
+        self.assertEqual(mock_rebuild.call_count, 2)
+        conversation = Conversation.objects.get()
+        self.assertEqual(
+            (conversation.user_a_id, conversation.user_b_id),
+            tuple(sorted([self.other.pk, third.pk])),
+        )
+
+    def test_rolled_back_deletes_are_not_rebuilt(self):
+        third = UserFactory.create()
+        rolled_back = MessageFactory.create(sender=self.user, receiver=self.other)
+        deleted = MessageFactory.create(sender=self.user, receiver=third)
+
+        with patch.object(
+            Conversation.objects,
+            "rebuild_for_users",
+            autospec=True,
+            side_effect=Conversation.objects.rebuild_for_users,
+        ) as mock_rebuild:
+            with self.captureOnCommitCallbacks(execute=True):
+                try:
+                    with transaction.atomic():
+                        rolled_back.delete()
+                        raise DatabaseError
+                except DatabaseError:
+                    pass
+
+                deleted.delete()
+
+        mock_rebuild.assert_called_once_with(*sorted([self.user.pk, third.pk]))
+        self.assertEqual(Conversation.objects.get().last_message, rolled_back)
+
+    def test_backfill_command(self):
+        third = UserFactory.create()
+        MessageFactory.create(sender=self.user, receiver=self.other)
+        MessageFactory.create(sender=self.other, receiver=self.user, seen=True)
+        last = MessageFactory.create(sender=third, receiver=self.user)
+        Conversation.objects.all().delete()
+
+        out = StringIO()
+        call_command("backfill_conversations", stdout=out)
+
+        self.assertIn("Rebuilt 2 conversations", out.getvalue())
+        self.assertEqual(Conversation.objects.for_user(self.user).count(), 2)
+        self.assertEqual(Conversation.objects.for_user(self.user)[0].last_message, last)
+        self.assertEqual(self.user.get_new_messages_total(), 1)
+        self.assertEqual(self.other.get_new_messages_total(), 1)
+
+
+@override_settings(ROOT_URLCONF="open_inwoner.cms.tests.urls")
+class InboxConversationPaginationTests(WebTest):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.user = UserFactory.create()
+        self.contacts = UserFactory.create_batch(12)
+        self.messages = [
+            MessageFactory.create(sender=contact, receiver=self.user)
+            for contact in self.contacts
+        ]
+        self.url = reverse("inbox:index")
+
+    def test_conversations_are_paginated_with_cursor(self):
+        response = self.app.get(self.url, user=self.user)
+
+        conversations = response.context["conversations"]
+        self.assertEqual(
+            [c.pk for c in conversations["object_list"]],
+            [m.pk for m in reversed(self.messages[2:])],
+        )
+        self.assertTrue(conversations["has_older"])
+
+        response = self.app.get(conversations["older_url"], user=self.user)
+
+        conversations = response.context["conversations"]
+        self.assertEqual(
+            [c.pk for c in conversations["object_list"]],
+            [m.pk for m in reversed(self.messages[:2])],
+        )
+        self.assertFalse(conversations["has_older"])
+        self.assertIn(
+            f"before={self.messages[2].pk}", conversations["object_list"][0].thread_url
+        )
@@ -1,4 +1,5 @@
 from unittest import skip
+from unittest.mock import patch
 
 from django.test import override_settings, tag
 from django.urls import reverse
@@ -56,7 +57,7 @@ class InboxPageTests(WebTest):
         conversations = response.context["conversations"]["object_list"]
         messages = response.context["conversation_messages"]
 
-        self.assertEqual(conversations.count(), 2)
+        self.assertEqual(len(conversations), 2)
         self.assertEqual(len(messages), 1)
         self.assertEqual(messages[0].id, self.message2.id)
 
@@ -67,7 +68,7 @@ class InboxPageTests(WebTest):
         conversations = response.context["conversations"]["object_list"]
         messages = response.context["conversation_messages"]
 
-        self.assertEqual(conversations.count(), 2)
+        self.assertEqual(len(conversations), 2)
         self.assertEqual(len(messages), 1)
         self.assertEqual(messages[0].id, self.message1.id)
 
@@ -229,6 +230,39 @@ class InboxPageTests(WebTest):
             self.url, {"receiver": str(contact.uuid), "file": file}, status=403
         )
 
+    @patch("open_inwoner.accounts.views.inbox.InboxView.messages_per_page", 2)
+    def test_messages_are_paginated_with_cursor(self):
+        older = MessageFactory.create_batch(3, sender=self.contact1, receiver=self.user)
+        newest = MessageFactory.create(sender=self.user, receiver=self.contact1)
+
+        response = self.app.get(self.contact1_url)
+
+        messages = response.context["conversation_messages"]
+        self.assertEqual([m.pk for m in messages], [older[2].pk, newest.pk])
+        older_url = response.context["older_messages_url"]
+        self.assertTrue(older_url)
+        self.assertTrue(response.pyquery(".messages__older"))
+
+        response = self.app.get(older_url, headers={"HX-Request": "true"})
+
+        self.assertTemplateUsed(response, "accounts/inbox_older_messages.html")
+        self.assertEqual(
+            [m.pk for m in response.context["conversation_messages"]],
+            [older[0].pk, older[1].pk],
+        )
+        self.assertEqual(len(response.pyquery(".messages__list-item")), 2)
+
+        response = self.app.get(
+            response.context["older_url"], headers={"HX-Request": "true"}
+        )
+
+        self.assertEqual(
+            [m.pk for m in response.context["conversation_messages"]],
+            [self.message1.pk],
+        )
+        self.assertEqual(response.context["older_url"], "")
+        self.assertFalse(response.pyquery(".messages__older"))
+
 
 @tag("e2e")
 @override_settings(ROOT_URLCONF="open_inwoner.cms.tests.urls")
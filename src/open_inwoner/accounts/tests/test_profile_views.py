@@ -828,7 +828,7 @@ class ProfileDeleteTest(WebTest):
 
 @requests_mock.Mocker()
 @override_settings(ROOT_URLCONF="open_inwoner.cms.tests.urls")
-class MyDataTests(AssertTimelineLogMixin, HaalCentraalMixin, WebTest):
+class MyDataTests(ClearCachesMixin, AssertTimelineLogMixin, HaalCentraalMixin, WebTest):
     maxDiff = None
 
     expected_response = BRPData(
@@ -847,6 +847,8 @@ class MyDataTests(AssertTimelineLogMixin, HaalCentraalMixin, WebTest):
     )
 
     def setUp(self):
+        super().setUp()
+
         self.user = UserFactory(
             bsn="999993847",
             first_name="Merel",
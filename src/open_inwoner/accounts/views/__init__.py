@@ -49,6 +49,7 @@ from .profile import (
     MyDataView,
     MyNotificationsView,
     MyProfileView,
+    UserAppointmentsPluginView,
     UserAppointmentsView,
 )
 from .registration import CustomRegistrationView, NecessaryFieldsUserView
@@ -87,6 +88,7 @@ __all__ = [
     "MyDataView",
     "MyNotificationsView",
     "MyProfileView",
+    "UserAppointmentsPluginView",
     "UserAppointmentsView",
     "CustomRegistrationView",
     "NecessaryFieldsUserView",
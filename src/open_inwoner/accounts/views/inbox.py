@@ -1,35 +1,41 @@
 import logging
+from datetime import datetime, timedelta, timezone
 from urllib.parse import unquote
 
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.exceptions import PermissionDenied
 from django.http import HttpResponseRedirect
 from django.shortcuts import get_object_or_404
+from django.template.response import TemplateResponse
 from django.urls import reverse, reverse_lazy
 from django.utils import formats
 from django.utils.translation import gettext as _
 from django.views.generic import FormView
 
+from furl import furl
 from privates.views import PrivateMediaView
 
 from open_inwoner.configurations.models import SiteConfiguration
-from open_inwoner.utils.mixins import PaginationMixin
 from open_inwoner.utils.views import CommonPageMixin, LogMixin
 
 from ..forms import InboxForm
 from ..models import Document, Message, User
-from ..query import MessageQuerySet
 
 logger = logging.getLogger(__name__)
 
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
-class InboxView(
-    LogMixin, LoginRequiredMixin, CommonPageMixin, PaginationMixin, FormView
-):
+
+class InboxView(LogMixin, LoginRequiredMixin, CommonPageMixin, FormView):
     template_name = "accounts/inbox.html"
     form_class = InboxForm
     paginate_by = 10
     slug_field = "uuid"
+    cursor_kwarg = "before"
+    older_messages_template_name = "accounts/inbox_older_messages.html"
+    messages_per_page = 50
+    message_cursor_kwarg = "older"
+    older_messages_url = ""
 
     def page_title(self):
         return _("Mijn berichten")
@@ -59,6 +65,7 @@ class InboxView(
                 "conversations": conversations,
                 "conversation_messages": messages,
                 "conversation_url": conversation_url,
+                "older_messages_url": self.older_messages_url,
                 "other_user": other_user,
                 "status": status,
                 "allow_file_sharing": config.allow_messages_file_sharing,
@@ -67,20 +74,49 @@ class InboxView(
 
         return context
 
+    def get_cursor(self) -> int | None:
+        try:
+            return int(self.request.GET[self.cursor_kwarg])
+        except (KeyError, ValueError):
+            return None
+
     def get_conversations(self) -> dict:
         """
         Returns the conversations with other users (used to navigate between conversations).
+
+        Conversations are paginated with a cursor on the id of their last message
+        (keyset pagination), so older pages don't get slower to load.
         """
+        cursor = self.get_cursor()
         conversations = Message.objects.get_conversations_for_user(self.request.user)
-        paginated = self.paginate_with_context(conversations)
-        self.annotate_conversations(paginated["object_list"])
-        return paginated
-
-    def annotate_conversations(self, conversations):
+        if cursor is not None:
+            conversations = conversations.filter(pk__lt=cursor)
+
+        object_list = list(conversations[: self.paginate_by + 1])
+        has_older = len(object_list) > self.paginate_by
+        object_list = object_list[: self.paginate_by]
+
+        older_url = ""
+        if has_older:
+            f = furl(self.request.get_full_path())
+            f.args[self.cursor_kwarg] = object_list[-1].pk
+            older_url = f.url
+
+        self.annotate_conversations(object_list, cursor)
+        return {
+            "object_list": object_list,
+            "cursor": cursor,
+            "has_older": has_older,
+            "older_url": older_url,
+        }
+
+    def annotate_conversations(self, conversations, cursor: int | None = None):
         for c in conversations:
             c.thread_url = reverse(
                 "inbox:index", kwargs={self.slug_field: c.other_user_uuid}
             )
+            if cursor is not None:
+                c.thread_url = furl(c.thread_url).add({self.cursor_kwarg: cursor}).url
             # note these are annotations (not models)
             parts = (
                 c.other_user_first_name,
@@ -104,28 +140,70 @@ class InboxView(
 
         return get_object_or_404(User, uuid=other_user_uuid)
 
+    def get_message_cursor(self) -> tuple[datetime, int] | None:
+        """
+        Returns the (created_on, pk) of the oldest message that is already shown.
+        """
+        try:
+            timestamp, pk = self.request.GET[self.message_cursor_kwarg].split("_")
+            created_on = EPOCH + timedelta(microseconds=int(timestamp))
+            return created_on, int(pk)
+        except (KeyError, ValueError, OverflowError):
+            return None
+
+    def get_older_messages_url(self, other_user: User, oldest: Message) -> str:
+        timestamp = (oldest.created_on - EPOCH) // timedelta(microseconds=1)
+        url = furl(reverse("inbox:index", kwargs={self.slug_field: other_user.uuid}))
+        url.args[self.message_cursor_kwarg] = f"{timestamp}_{oldest.pk}"
+        return url.url
+
     def get_messages(self, other_user: User) -> list[Message]:
         """
         Returns the messages (MessageType) of the current conversation.
+
+        Only the latest window of messages is loaded; older messages are fetched
+        on demand using a cursor on (created_on, pk).
         """
+        self.older_messages_url = ""
         if not other_user:
-            return Message.objects.none()
+            return []
 
         messages = Message.objects.get_messages_between_users(
             user=self.request.user, other_user=other_user
         )
+        cursor = self.get_message_cursor()
+        if cursor:
+            messages = messages.before(*cursor)
+
+        window = list(messages[: self.messages_per_page + 1])
+        if len(window) > self.messages_per_page:
+            window = window[: self.messages_per_page]
+            self.older_messages_url = self.get_older_messages_url(
+                other_user, window[-1]
+            )
 
-        return messages[:1000:-1]  # Show max 1000 messages for now.
+        return window[::-1]
 
-    def get_status(self, messages: MessageQuerySet) -> str:
+    def get_status(self, messages: list[Message]) -> str:
         """
         Returns the status string of the conversation.
         """
-        messages = list(messages)
         if not messages:
             return ""
         return f"{_('Laatste bericht ontvangen op')} {formats.date_format(messages[-1].created_on)}"
 
+    def render_older_messages(self) -> TemplateResponse:
+        other_user = get_object_or_404(User, uuid=self.kwargs.get(self.slug_field))
+        messages = self.get_messages(other_user)
+        return TemplateResponse(
+            self.request,
+            self.older_messages_template_name,
+            {
+                "conversation_messages": messages,
+                "older_url": self.older_messages_url,
+            },
+        )
+
     def mark_messages_seen(self, other_user: User | None):
         if not other_user:
             return
@@ -165,6 +243,9 @@ class InboxView(
         return HttpResponseRedirect(f"{url}#messages-last")
 
     def get(self, request, *args, **kwargs):
+        if request.htmx and self.get_message_cursor():
+            return self.render_older_messages()
+
         context = self.get_context_data()
 
         """
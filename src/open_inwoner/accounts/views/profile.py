@@ -6,7 +6,7 @@ from typing import Any
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.http import HttpResponseRedirect
-from django.shortcuts import redirect
+from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse, reverse_lazy
 from django.utils.functional import cached_property
 from django.utils.translation import gettext as _
@@ -21,16 +21,18 @@ from open_inwoner.accounts.choices import (
     NotificationChannelChoice,
     StatusChoices,
 )
+from open_inwoner.cms.plugins.models.appointments import UserAppointments
 from open_inwoner.cms.utils.page_display import (
     benefits_page_is_published,
     inbox_page_is_published,
 )
 from open_inwoner.configurations.models import SiteConfiguration
 from open_inwoner.haalcentraal.utils import fetch_brp
+from open_inwoner.htmx.mixins import RequiresHtmxMixin
 from open_inwoner.laposta.forms import NewsletterSubscriptionForm
 from open_inwoner.laposta.models import LapostaConfig
 from open_inwoner.plans.models import Plan
-from open_inwoner.qmatic.client import NoServiceConfigured, QmaticClient
+from open_inwoner.qmatic.cache import get_appointments
 from open_inwoner.questionnaire.models import QuestionnaireStep
 from open_inwoner.utils.views import CommonPageMixin, LogMixin
 
@@ -387,15 +389,9 @@ class UserAppointmentsView(
         if not user.has_verified_email():
             context["appointments"] = []
         else:
-            try:
-                client = QmaticClient()
-            except NoServiceConfigured:
-                logger.exception("Error occurred while creating Qmatic client")
-                context["appointments"] = []
-            else:
-                context["appointments"] = client.list_appointments_for_customer(
-                    user.verified_email
-                )
+            context["appointments"] = get_appointments(
+                user.verified_email, user_id=user.pk
+            )
         return context
 
     @cached_property
@@ -404,3 +400,23 @@ class UserAppointmentsView(
             (_("Mijn profiel"), reverse("profile:detail")),
             (_("Mijn afspraken"), reverse("profile:appointments")),
         ]
+
+
+class UserAppointmentsPluginView(RequiresHtmxMixin, LoginRequiredMixin, TemplateView):
+    """
+    Lazily loaded content of the `UserAppointmentsPlugin`
+    """
+
+    template_name = "cms/plugins/appointments/appointments.html"
+
+    def get_context_data(self, **kwargs) -> dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        user: User = self.request.user
+        context["instance"] = get_object_or_404(UserAppointments, pk=kwargs["pk"])
+        if not user.has_verified_email():
+            context["appointments"] = []
+        else:
+            context["appointments"] = get_appointments(
+                user.verified_email, user_id=user.pk
+            )
+        return context
@@ -0,0 +1,10 @@
+from rest_framework.pagination import CursorPagination
+
+
+class ProductCursorPagination(CursorPagination):
+    # the least recently updated products first, so consumers can follow the
+    # changes with `updated_since`
+    ordering = ("updated_on", "pk")
+    page_size = 100
+    page_size_query_param = "page_size"
+    max_page_size = 500
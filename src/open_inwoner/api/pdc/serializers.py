@@ -1,3 +1,8 @@
+from math import ceil, floor
+
+from django.utils.translation import gettext_lazy as _
+
+from djangorestframework_camel_case.util import camel_to_underscore
 from drf_spectacular.utils import extend_schema_field
 from filer.models import File, Image
 from rest_framework import serializers
@@ -97,9 +102,10 @@ class CategoryWithChildSerializer(serializers.ModelSerializer):
 
     @extend_schema_field(SmallCategorySerializer(many=True))
     def get_children(self, obj):
-        return SmallCategorySerializer(
-            obj.get_children(), many=True, context=self._context
-        ).data
+        # the view can provide the children of the (already loaded) tree
+        tree = self.context.get("children")
+        children = tree.get(obj.path, []) if tree is not None else obj.get_children()
+        return SmallCategorySerializer(children, many=True, context=self._context).data
 
 
 class OrganizationSerializer(serializers.ModelSerializer):
@@ -148,6 +154,10 @@ class ProductLinkSerializer(serializers.ModelSerializer):
 
 
 class ProductSerializer(serializers.ModelSerializer):
+    """
+    Serializes the given ``fields`` only, when provided.
+    """
+
     links = ProductLinkSerializer(many=True, required=False)
     categories = SmallCategorySerializer(many=True, required=False)
     related_products = SmallProductSerializer(many=True, required=False)
@@ -179,3 +189,91 @@ class ProductSerializer(serializers.ModelSerializer):
             "conditions",
             "files",
         )
+
+    # the relations with the lookups to prefetch them
+    expandable_fields = {
+        "links": ("links",),
+        "categories": ("categories",),
+        "related_products": ("related_products",),
+        "tags": ("tags__icon", "tags__type"),
+        "organizations": (
+            "organizations__logo",
+            "organizations__type",
+            "organizations__neighbourhood",
+        ),
+        "locations": ("locations",),
+        "conditions": ("conditions",),
+        "files": ("files__file",),
+    }
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+def parse_field_names(value: str, allowed) -> list[str]:
+    # the names are camelCased in the API
+    names = [camel_to_underscore(name.strip()) for name in value.split(",")]
+    names = list(dict.fromkeys(name for name in names if name))
+
+    unknown = [name for name in names if name not in allowed]
+    if unknown:
+        raise serializers.ValidationError(
+            _("Unknown fields: {fields}").format(fields=", ".join(unknown))
+        )
+    return names
+
+
+class ProductQuerySerializer(serializers.Serializer):
+    fields = serializers.CharField(
+        required=False,
+        help_text=_("Comma separated list of the fields to return"),
+    )
+    expand = serializers.CharField(
+        required=False,
+        help_text=_(
+            "Comma separated list of the relations to add to the returned fields"
+        ),
+    )
+    updated_since = serializers.DateTimeField(
+        required=False,
+        help_text=_("Only return the products updated since this moment"),
+    )
+
+    def validate_fields(self, value):
+        return parse_field_names(value, ProductSerializer.Meta.fields)
+
+    def validate_expand(self, value):
+        return parse_field_names(value, ProductSerializer.expandable_fields)
+
+
+class ProductLocationQuerySerializer(serializers.Serializer):
+    bbox = serializers.CharField(
+        required=False,
+        help_text=_(
+            "Only return the locations within the bounding box, as comma "
+            "separated min longitude, min latitude, max longitude and max latitude"
+        ),
+    )
+
+    def validate_bbox(self, value):
+        try:
+            min_lng, min_lat, max_lng, max_lat = (
+                float(coordinate) for coordinate in value.split(",")
+            )
+        except ValueError:
+            raise serializers.ValidationError(_("Invalid bounding box"))
+
+        if min_lng > max_lng or min_lat > max_lat:
+            raise serializers.ValidationError(_("Invalid bounding box"))
+
+        # round outwards, so the maps of nearby viewports share the cached locations
+        return (
+            floor(min_lng * 100) / 100,
+            floor(min_lat * 100) / 100,
+            ceil(max_lng * 100) / 100,
+            ceil(max_lat * 100) / 100,
+        )
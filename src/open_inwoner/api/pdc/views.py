@@ -1,9 +1,37 @@
+from collections import defaultdict
+from datetime import datetime
+
+from django.conf import settings
+from django.contrib.gis.geos import Polygon
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.functional import cached_property
+from django.utils.http import http_date, quote_etag
+
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import viewsets
 from rest_framework.generics import get_object_or_404
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
-from open_inwoner.pdc.models import Category, Product
+from open_inwoner.pdc.cache import (
+    get_cached_category_tree,
+    get_category_tree_etag,
+    get_product_relations_modified,
+)
+from open_inwoner.pdc.models import Category, Product, ProductLocation
+from open_inwoner.utils.hash import create_sha256_hash
+from open_inwoner.utils.schema import input_serializer_to_parameters
 
-from .serializers import CategoryWithChildSerializer, ProductSerializer
+from .pagination import ProductCursorPagination
+from .serializers import (
+    CategoryWithChildSerializer,
+    ProductLocationQuerySerializer,
+    ProductQuerySerializer,
+    ProductSerializer,
+)
 
 
 class CategoryViewSet(viewsets.ReadOnlyModelViewSet):
@@ -43,19 +71,203 @@ class CategoryViewSet(viewsets.ReadOnlyModelViewSet):
     def get_queryset(self):
         return Category.get_root_nodes()
 
+    def get_tree(self) -> tuple[list[Category], dict[str, list[Category]]]:
+        """
+        Load the published tree in a single query and assemble it in memory,
+        using the materialized path of the categories.
+
+        Returns the root categories and the children per path of the parent.
+        """
+        categories = (
+            Category.objects.published()
+            .select_related("icon", "image")
+            .prefetch_related("products", "question_set")
+            .order_by("path")
+        )
+        children = defaultdict(list)
+        for category in categories:
+            children[category.path[: -Category.steplen]].append(category)
+        return children.pop("", []), children
+
+    def get_cached_response(self, request, build, *parts):
+        """
+        Serve the data from the cache (or a 304) while the tree is unchanged.
+        """
+        # the representation contains absolute urls
+        etag = get_category_tree_etag(request.build_absolute_uri("/"), *parts)
+        response = get_conditional_response(request, etag=quote_etag(etag))
+        if response is None:
+            response = Response(get_cached_category_tree(etag, build))
+
+        response["ETag"] = quote_etag(etag)
+        patch_vary_headers(response, ["Accept"])
+        return response
+
+    def list(self, request, *args, **kwargs):
+        def build():
+            roots, children = self.get_tree()
+            context = {**self.get_serializer_context(), "children": children}
+            return self.get_serializer_class()(roots, many=True, context=context).data
+
+        return self.get_cached_response(request, build, "list")
+
+    def retrieve(self, request, *args, **kwargs):
+        def build():
+            return self.get_serializer(self.get_object()).data
 
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        return self.get_cached_response(
+            request, build, "detail", self.kwargs[lookup_url_kwarg]
+        )
+
+
+@extend_schema_view(
+    list=extend_schema(
+        parameters=input_serializer_to_parameters(ProductQuerySerializer)
+    ),
+    retrieve=extend_schema(
+        parameters=[
+            parameter
+            for parameter in input_serializer_to_parameters(ProductQuerySerializer)
+            if parameter.name != "updated_since"
+        ]
+    ),
+)
 class ProductViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    The list only contains the relations of the products that are expanded
+    (``expand=tags,locations``), the details contain all relations. The
+    returned fields can be limited with ``fields=name,slug,tags``.
+    """
+
     authentication_classes = []
     permission_classes = []
     serializer_class = ProductSerializer
-    queryset = Product.objects.prefetch_related(
-        "links",
-        "categories",
-        "related_products",
-        "tags",
-        "organizations",
-        "contacts",
-        "locations",
-        "conditions",
-    )
+    pagination_class = ProductCursorPagination
     lookup_field = "slug"
+
+    @cached_property
+    def query_params(self) -> dict:
+        serializer = ProductQuerySerializer(data=self.request.query_params)
+        serializer.is_valid(raise_exception=True)
+        return serializer.validated_data
+
+    def get_field_names(self) -> list[str]:
+        if getattr(self, "swagger_fake_view", False):
+            return list(ProductSerializer.Meta.fields)
+
+        if "fields" in self.query_params:
+            names = self.query_params["fields"]
+        elif self.action == "list":
+            names = [
+                name
+                for name in ProductSerializer.Meta.fields
+                if name not in ProductSerializer.expandable_fields
+            ]
+        else:
+            names = list(ProductSerializer.Meta.fields)
+
+        expand = self.query_params.get("expand", [])
+        return names + [name for name in expand if name not in names]
+
+    def get_queryset(self):
+        # only prefetch the returned relations
+        lookups = [
+            lookup
+            for name in self.get_field_names()
+            for lookup in ProductSerializer.expandable_fields.get(name, ())
+        ]
+        queryset = Product.objects.prefetch_related(*lookups)
+
+        if self.action == "list" and "updated_since" in self.query_params:
+            queryset = queryset.filter(
+                updated_on__gte=self.query_params["updated_since"]
+            )
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.setdefault("fields", self.get_field_names())
+        return super().get_serializer(*args, **kwargs)
+
+    def get_conditional_response(
+        self, request, last_modified: datetime | None, version: str, build
+    ):
+        """
+        Answer a 304 while the products are unchanged since the client's copy.
+        """
+        # saving a related object doesn't update the products
+        if set(self.get_field_names()) & set(ProductSerializer.expandable_fields):
+            relations_modified = get_product_relations_modified()
+            version = f"{version}:{relations_modified.isoformat()}"
+            if last_modified is None or relations_modified > last_modified:
+                last_modified = relations_modified
+
+        etag = quote_etag(
+            create_sha256_hash(
+                f"{request.build_absolute_uri()}:{version}", salt=settings.SECRET_KEY
+            )
+        )
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+
+        response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is None:
+            response = build()
+
+        response["ETag"] = etag
+        if timestamp:
+            response["Last-Modified"] = http_date(timestamp)
+        patch_vary_headers(response, ["Accept"])
+        return response
+
+    def list(self, request, *args, **kwargs):
+        aggregate = self.filter_queryset(self.get_queryset()).aggregate(
+            last_modified=Max("updated_on"), count=Count("pk")
+        )
+        # the count changes when products are deleted
+        version = f"{aggregate['last_modified']}:{aggregate['count']}"
+
+        return self.get_conditional_response(
+            request,
+            aggregate["last_modified"],
+            version,
+            lambda: super(ProductViewSet, self).list(request, *args, **kwargs),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+
+        return self.get_conditional_response(
+            request,
+            instance.updated_on,
+            instance.updated_on.isoformat(),
+            lambda: Response(self.get_serializer(instance).data),
+        )
+
+
+class ProductLocationGeoJSONView(APIView):
+    """
+    The product locations as a GeoJSON feature collection, the maps only load
+    the locations within their viewport (``bbox=4.8,52.3,5.0,52.4``).
+    """
+
+    authentication_classes = []
+    permission_classes = []
+    # the (snake case) properties of the features are used as-is by the maps
+    renderer_classes = [JSONRenderer]
+    max_locations = 1000
+
+    @extend_schema(
+        parameters=input_serializer_to_parameters(ProductLocationQuerySerializer),
+        responses=OpenApiTypes.OBJECT,
+    )
+    def get(self, request, *args, **kwargs):
+        query_serializer = ProductLocationQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+
+        queryset = ProductLocation.objects.order_by("pk")
+        if "bbox" in query_serializer.validated_data:
+            bbox = Polygon.from_bbox(query_serializer.validated_data["bbox"])
+            queryset = queryset.filter(geometry__within=bbox)
+
+        features = queryset[: self.max_locations].get_geojson_features()
+        return Response({"type": "FeatureCollection", "features": features})
@@ -2,18 +2,25 @@
 this file contains tests for the RESTful API
 The logic of `autocomplete` is tested at `open_inwoner.search.tests` folder
 """
-from django.test import tag
+from unittest.mock import patch
+
+from django.test import override_settings, tag
 from django.urls import reverse_lazy
 
+from djangorestframework_camel_case.render import CamelCaseJSONRenderer
 from rest_framework import status
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.test import APITestCase
 
+from open_inwoner.api.search.views import AutocompleteView
 from open_inwoner.pdc.tests.factories import ProductFactory
+from open_inwoner.search.results import AutocompleteResult, Suggester
 from open_inwoner.search.tests.utils import ESMixin
+from open_inwoner.utils.test import ClearCachesMixin
 
 
 @tag("elastic")
-class AutocompleteApiTests(ESMixin, APITestCase):
+class AutocompleteApiTests(ClearCachesMixin, ESMixin, APITestCase):
     url = reverse_lazy("api:search_autocomplete")
 
     def setUp(self):
@@ -23,13 +30,13 @@ class AutocompleteApiTests(ESMixin, APITestCase):
         self.update_index()
 
     def test_autocomplete_success(self):
-        response = self.client.get(self.url, {"search": "s"})
+        response = self.client.get(self.url, {"search": "so"})
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.json(), {"options": ["Some"]})
 
     def test_autocomplete_no_results(self):
-        response = self.client.get(self.url, {"search": "m"})
+        response = self.client.get(self.url, {"search": "mo"})
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.json(), {"options": []})
@@ -39,3 +46,72 @@ class AutocompleteApiTests(ESMixin, APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(response.json(), {"search": ["Dit veld is vereist."]})
+
+
+@override_settings(ES_SUGGEST_MIN_LENGTH=2, ES_SUGGEST_MAX_AGE=300)
+@patch(
+    "open_inwoner.search.searches.search_autocomplete",
+    return_value=AutocompleteResult(
+        suggesters=[Suggester(name="name_suggest", options=["Some"])]
+    ),
+)
+class AutocompleteApiCacheTests(ClearCachesMixin, APITestCase):
+    url = reverse_lazy("api:search_autocomplete")
+
+    def test_short_prefix_does_not_search(self, m_search):
+        response = self.client.get(self.url, {"search": "s"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {"options": []})
+        m_search.assert_not_called()
+
+    def test_options_are_cached_per_prefix(self, m_search):
+        for search in ["So", "so ", "so"]:
+            response = self.client.get(self.url, {"search": search})
+
+            self.assertEqual(response.json(), {"options": ["Some"]})
+
+        m_search.assert_called_once_with("so")
+
+    def test_conditional_request(self, m_search):
+        response = self.client.get(self.url, {"search": "so"})
+
+        self.assertEqual(response["Cache-Control"], "public, max-age=300")
+        etag = response["ETag"]
+
+        response = self.client.get(self.url, {"search": "so"}, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        m_search.assert_called_once()
+
+    @patch.object(
+        AutocompleteView,
+        "renderer_classes",
+        [CamelCaseJSONRenderer, BrowsableAPIRenderer],
+    )
+    def test_etag_depends_on_the_negotiated_renderer(self, m_search):
+        response = self.client.get(self.url, {"search": "so"})
+        etag = response["ETag"]
+
+        self.assertIn("Accept", response["Vary"])
+
+        response = self.client.get(
+            self.url, {"search": "so"}, HTTP_IF_NONE_MATCH=etag, HTTP_ACCEPT="text/html"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/html; charset=utf-8")
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_product_change_invalidates_options(self, m_search):
+        response = self.client.get(self.url, {"search": "so"})
+        etag = response["ETag"]
+
+        ProductFactory.create(name="Something")
+
+        response = self.client.get(self.url, {"search": "so"}, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(m_search.call_count, 2)
@@ -1,8 +1,18 @@
+from django.conf import settings
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import quote_etag
+
 from drf_spectacular.utils import extend_schema
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from open_inwoner.search.searches import search_autocomplete
+from open_inwoner.search.cache import get_autocomplete_etag
+from open_inwoner.search.searches import autocomplete_options
+from open_inwoner.search.utils import normalize_query
 from open_inwoner.utils.schema import input_serializer_to_parameters
 
 from .serializers import AutocompleteQuerySerializer, AutocompleteResponseSerializer
@@ -21,8 +31,23 @@ class AutocompleteView(APIView):
         query_serializer = AutocompleteQuerySerializer(data=request.query_params)
         query_serializer.is_valid(raise_exception=True)
 
-        # perform search
+        # the options only change when the search index is updated, the
+        # representation depends on the negotiated renderer (JSON vs browsable API)
         search_string = query_serializer.data["search"]
-        search_response = search_autocomplete(search_string)
-        serializer = self.serializer_class(search_response)
-        return Response(serializer.data)
+        etag = quote_etag(
+            "{etag}-{format}".format(
+                etag=get_autocomplete_etag(normalize_query(search_string)),
+                format=request.accepted_renderer.format,
+            )
+        )
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            # perform search
+            options = autocomplete_options(search_string)
+            serializer = self.serializer_class({"options": options})
+            response = Response(serializer.data)
+
+        response["ETag"] = etag
+        patch_cache_control(response, public=True, max_age=settings.ES_SUGGEST_MAX_AGE)
+        patch_vary_headers(response, ["Accept"])
+        return response
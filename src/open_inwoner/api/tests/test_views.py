@@ -1,10 +1,21 @@
+from django.contrib.gis.geos import Point
+from django.test import override_settings
 from django.urls import reverse
+from django.utils.http import http_date
 
+from freezegun import freeze_time
 from rest_framework import status
-from rest_framework.test import APIClient, APITestCase
+from rest_framework.test import APIClient, APIRequestFactory, APITestCase
 
+from open_inwoner.api.pdc.views import CategoryViewSet, ProductViewSet
 from open_inwoner.pdc.models import Category
-from open_inwoner.pdc.tests.factories import CategoryFactory
+from open_inwoner.pdc.tests.factories import (
+    CategoryFactory,
+    ProductFactory,
+    ProductLocationFactory,
+    TagFactory,
+)
+from open_inwoner.utils.test import ClearCachesMixin
 
 
 class TestPDCLocation(APITestCase):
@@ -111,3 +122,342 @@ class TestPDCLocation(APITestCase):
                 ],
             },
         )
+
+
+class CategoryTreeApiTests(ClearCachesMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.root = CategoryFactory.build()
+        self.child = CategoryFactory.build()
+        self.unpublished = CategoryFactory.build(published=False)
+        Category.add_root(instance=self.root)
+        self.root.add_child(instance=self.child)
+        self.root.add_child(instance=self.unpublished)
+
+        self.other_root = CategoryFactory.build()
+        Category.add_root(instance=self.other_root)
+
+        self.product = ProductFactory.create(categories=[self.root, self.child])
+
+    def get_children(self, response, slug):
+        for category in response.json():
+            if category["slug"] == slug:
+                return [child["slug"] for child in category["children"]]
+
+    def get_list(self, **extra):
+        # call the view directly, the middleware does its own queries
+        view = CategoryViewSet.as_view({"get": "list"})
+        request = APIRequestFactory().get(reverse("api:categories-list"), **extra)
+        return view(request)
+
+    def test_list_loads_published_tree_at_once(self):
+        # categories, products and questions
+        with self.assertNumQueries(3):
+            response = self.get_list()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [category["slug"] for category in response.data],
+            [self.root.slug, self.other_root.slug],
+        )
+        self.assertEqual(
+            [child["slug"] for child in response.data[0]["children"]],
+            [self.child.slug],
+        )
+        self.assertEqual(response.data[0]["products"][0]["slug"], self.product.slug)
+
+    def test_list_is_cached(self):
+        self.get_list()
+
+        with self.assertNumQueries(0):
+            response = self.get_list()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 2)
+
+    def test_list_not_modified(self):
+        etag = self.get_list()["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.get_list(HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_detail_not_modified(self):
+        url = reverse("api:categories-detail", kwargs={"slug": self.root.slug})
+        etag = self.client.get(url)["ETag"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertNotEqual(
+            etag, self.client.get(reverse("api:categories-list"))["ETag"]
+        )
+
+    def test_saving_category_invalidates_tree(self):
+        etag = self.client.get(reverse("api:categories-list"))["ETag"]
+
+        self.unpublished.published = True
+        self.unpublished.save()
+
+        response = self.client.get(
+            reverse("api:categories-list"), HTTP_IF_NONE_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(
+            self.get_children(response, self.root.slug),
+            [self.child.slug, self.unpublished.slug],
+        )
+
+    def test_moving_category_invalidates_tree(self):
+        self.client.get(reverse("api:categories-list"))
+
+        Category.objects.get(pk=self.child.pk).move(self.other_root, "last-child")
+
+        response = self.client.get(reverse("api:categories-list"))
+
+        self.assertEqual(self.get_children(response, self.root.slug), [])
+        self.assertEqual(
+            self.get_children(response, self.other_root.slug), [self.child.slug]
+        )
+
+    def test_changing_product_invalidates_tree(self):
+        self.client.get(reverse("api:categories-list"))
+
+        self.product.name = "Paspoort"
+        self.product.save()
+
+        response = self.client.get(reverse("api:categories-list"))
+
+        self.assertEqual(response.json()[0]["products"][0]["name"], "Paspoort")
+
+
+class ProductApiTests(ClearCachesMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+
+        with freeze_time("2024-01-01 10:00"):
+            self.tag = TagFactory.create()
+            self.product1 = ProductFactory.create(name="Paspoort")
+            self.product1.tags.add(self.tag)
+        with freeze_time("2024-02-01 10:00"):
+            self.product2 = ProductFactory.create(
+                name="Rijbewijs", locations=[ProductLocationFactory.create()]
+            )
+
+    def test_list_is_paginated(self):
+        response = self.client.get(reverse("api:products-list"), {"page_size": 1})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(
+            [product["slug"] for product in data["results"]], [self.product1.slug]
+        )
+        self.assertIsNone(data["previous"])
+
+        response = self.client.get(data["next"])
+
+        data = response.json()
+        self.assertEqual(
+            [product["slug"] for product in data["results"]], [self.product2.slug]
+        )
+        self.assertIsNone(data["next"])
+
+    def test_list_only_contains_expanded_relations(self):
+        response = self.client.get(reverse("api:products-list"))
+
+        product = response.json()["results"][0]
+        self.assertEqual(product["name"], "Paspoort")
+        self.assertIn("createdOn", product)
+        self.assertNotIn("tags", product)
+        self.assertNotIn("locations", product)
+
+        response = self.client.get(reverse("api:products-list"), {"expand": "tags"})
+
+        product = response.json()["results"][0]
+        self.assertEqual(product["tags"][0]["slug"], self.tag.slug)
+        self.assertNotIn("locations", product)
+
+    def test_list_only_prefetches_expanded_relations(self):
+        # call the view directly, the middleware does its own queries
+        view = ProductViewSet.as_view({"get": "list"})
+        request = APIRequestFactory().get(reverse("api:products-list"))
+
+        # aggregate and page
+        with self.assertNumQueries(2):
+            response = view(request)
+
+        self.assertEqual(len(response.data["results"]), 2)
+
+    def test_field_selection(self):
+        response = self.client.get(
+            reverse("api:products-list"), {"fields": "name,relatedProducts"}
+        )
+
+        self.assertEqual(
+            response.json()["results"][0], {"name": "Paspoort", "relatedProducts": []}
+        )
+
+        response = self.client.get(
+            reverse("api:products-detail", kwargs={"slug": self.product2.slug}),
+            {"fields": "slug,locations"},
+        )
+
+        self.assertEqual(response.json()["slug"], self.product2.slug)
+        self.assertEqual(len(response.json()["locations"]), 1)
+        self.assertEqual(set(response.json()), {"slug", "locations"})
+
+    def test_unknown_fields(self):
+        response = self.client.get(reverse("api:products-list"), {"fields": "foo"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(reverse("api:products-list"), {"expand": "name"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_detail_contains_all_relations(self):
+        response = self.client.get(
+            reverse("api:products-detail", kwargs={"slug": self.product1.slug})
+        )
+
+        self.assertEqual(response.json()["tags"][0]["slug"], self.tag.slug)
+        self.assertEqual(response.json()["locations"], [])
+
+    def test_updated_since(self):
+        response = self.client.get(
+            reverse("api:products-list"), {"updated_since": "2024-01-15T00:00:00Z"}
+        )
+
+        self.assertEqual(
+            [product["slug"] for product in response.json()["results"]],
+            [self.product2.slug],
+        )
+
+        response = self.client.get(
+            reverse("api:products-list"), {"updated_since": "invalid"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_list_not_modified(self):
+        response = self.client.get(reverse("api:products-list"))
+        etag = response["ETag"]
+
+        self.assertEqual(response["Last-Modified"], "Thu, 01 Feb 2024 10:00:00 GMT")
+
+        response = self.client.get(
+            reverse("api:products-list"), HTTP_IF_NONE_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        response = self.client.get(
+            reverse("api:products-list"),
+            HTTP_IF_MODIFIED_SINCE=response["Last-Modified"],
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_list_modified(self):
+        etag = self.client.get(reverse("api:products-list"))["ETag"]
+
+        self.product1.delete()
+
+        response = self.client.get(
+            reverse("api:products-list"), HTTP_IF_NONE_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_detail_not_modified(self):
+        url = reverse("api:products-detail", kwargs={"slug": self.product1.slug})
+        response = self.client.get(url)
+
+        # the details contain the relations, which last changed with product2
+        self.assertEqual(
+            response["Last-Modified"], http_date(self.product2.updated_on.timestamp())
+        )
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_relation_change_modifies_representations_with_relations(self):
+        detail_url = reverse("api:products-detail", kwargs={"slug": self.product1.slug})
+        list_url = reverse("api:products-list")
+        detail = self.client.get(detail_url)
+        expanded_list = self.client.get(list_url, {"expand": "tags"})
+        plain_list = self.client.get(list_url)
+
+        with freeze_time("2024-03-01 10:00"):
+            self.tag.name = "Changed"
+            self.tag.save()
+
+        response = self.client.get(detail_url, HTTP_IF_NONE_MATCH=detail["ETag"])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Last-Modified"], "Fri, 01 Mar 2024 10:00:00 GMT")
+
+        response = self.client.get(
+            list_url,
+            {"expand": "tags"},
+            HTTP_IF_MODIFIED_SINCE=expanded_list["Last-Modified"],
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(list_url, HTTP_IF_NONE_MATCH=plain_list["ETag"])
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+
+@override_settings(ROOT_URLCONF="open_inwoner.cms.tests.urls")
+class ProductLocationGeoJSONApiTests(ClearCachesMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.location1 = ProductLocationFactory.create(
+            name="Amsterdam", geometry=Point(4.88, 52.37)
+        )
+        self.location2 = ProductLocationFactory.create(
+            name="Deventer", geometry=Point(6.15, 52.25)
+        )
+        self.url = reverse("api:locations_geojson")
+
+    def test_all_locations(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json(),
+            {
+                "type": "FeatureCollection",
+                "features": [
+                    self.location1.get_geojson_feature(False),
+                    self.location2.get_geojson_feature(False),
+                ],
+            },
+        )
+
+    def test_locations_within_bbox(self):
+        response = self.client.get(self.url, {"bbox": "4.5,52.2,5.5,52.5"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        features = response.json()["features"]
+        self.assertEqual(len(features), 1)
+        # the properties are not camelized
+        self.assertEqual(features[0]["properties"]["name"], "Amsterdam")
+        self.assertIn("address_line_1", features[0]["properties"])
+
+    def test_invalid_bbox(self):
+        for bbox in ["4.5,52.2,5.5", "a,b,c,d", "5.5,52.2,4.5,52.5"]:
+            with self.subTest(bbox=bbox):
+                response = self.client.get(self.url, {"bbox": bbox})
+
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -3,7 +3,7 @@ from django.urls import include, path
 from drf_spectacular.views import SpectacularJSONAPIView, SpectacularRedocView
 from rest_framework import routers
 
-from .pdc.views import CategoryViewSet, ProductViewSet
+from .pdc.views import CategoryViewSet, ProductLocationGeoJSONView, ProductViewSet
 from .search.views import AutocompleteView
 
 app_name = "api"
@@ -26,5 +26,10 @@ urlpatterns = [
     path(
         "search/autocomplete/", AutocompleteView.as_view(), name="search_autocomplete"
     ),
+    path(
+        "locations/geojson/",
+        ProductLocationGeoJSONView.as_view(),
+        name="locations_geojson",
+    ),
     path("", include(router.urls)),
 ]
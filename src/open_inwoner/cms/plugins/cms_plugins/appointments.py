@@ -1,12 +1,13 @@
 import logging
 
+from django.urls import reverse
 from django.utils.translation import gettext as _
 
 from cms.plugin_base import CMSPluginBase
 from cms.plugin_pool import plugin_pool
 
 from open_inwoner.cms.plugins.models.appointments import UserAppointments
-from open_inwoner.qmatic.client import NoServiceConfigured, QmaticClient
+from open_inwoner.qmatic.cache import get_cached_appointments
 
 logger = logging.getLogger(__name__)
 
@@ -20,23 +21,26 @@ class UserAppointmentsPlugin(CMSPluginBase):
 
     def render(self, context, instance, placeholder):
         request = context["request"]
+        hxget = None
         if not request.user.is_authenticated or not request.user.has_verified_email():
             appointments = []
         else:
-            try:
-                client = QmaticClient()
-            except NoServiceConfigured:
-                logger.exception("Error occurred while creating Qmatic client")
+            appointments = get_cached_appointments(
+                request.user.verified_email, user_id=request.user.pk
+            )
+            if appointments is None:
+                # nothing cached yet: load the appointments after the page has
+                # rendered, so Qmatic never delays the page itself
                 appointments = []
-            else:
-                appointments = client.list_appointments_for_customer(
-                    request.user.verified_email
+                hxget = reverse(
+                    "profile:appointments_plugin", kwargs={"pk": instance.pk}
                 )
 
         context.update(
             {
                 "instance": instance,
                 "appointments": appointments,
+                "hxget": hxget,
             }
         )
         return context
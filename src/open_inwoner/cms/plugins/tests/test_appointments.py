@@ -5,20 +5,51 @@ import requests_mock
 from pyquery import PyQuery as PQ
 
 from open_inwoner.cms.tests import cms_tools
+from open_inwoner.qmatic.cache import get_appointments
 from open_inwoner.qmatic.tests.data import QmaticMockData
+from open_inwoner.utils.test import ClearCachesMixin
 
 from ..cms_plugins import UserAppointmentsPlugin
 
 
 @requests_mock.Mocker()
 @override_settings(ROOT_URLCONF="open_inwoner.cms.tests.urls")
-class TestUserAppointmentsPlugin(TestCase):
+class TestUserAppointmentsPlugin(ClearCachesMixin, TestCase):
+    def test_plugin_lazy_loads_appointments_if_not_cached(self, m):
+        data = QmaticMockData()
+        data.setUpMocks(m)
+
+        html, context = cms_tools.render_plugin(
+            UserAppointmentsPlugin, plugin_data={}, user=data.user
+        )
+
+        # Qmatic is not called while rendering the page
+        self.assertFalse(m.called)
+        self.assertEqual(context["appointments"], [])
+
+        hxget = PQ(html).find("[hx-get]").attr("hx-get")
+        self.assertEqual(
+            hxget,
+            reverse(
+                "profile:appointments_plugin", kwargs={"pk": context["instance"].pk}
+            ),
+        )
+
+        self.client.force_login(data.user)
+        response = self.client.get(hxget, HTTP_HX_REQUEST="true")
+
+        self.assertContains(response, "Paspoort")
+        self.assertContains(response, "ID kaart")
+
     def test_plugin(self, m):
         data = QmaticMockData()
         data.setUpMocks(m)
 
         self.assertTrue(data.user.has_verified_email())
 
+        # warm the cache, the plugin renders the cached appointments inline
+        get_appointments(data.user.verified_email)
+
         html, context = cms_tools.render_plugin(
             UserAppointmentsPlugin, plugin_data={}, user=data.user
         )
@@ -106,5 +106,5 @@ class ProductLocationPlugin(CMSActiveAppMixin, CMSPluginBase):
     cache = False
 
     def render(self, context, instance, placeholder):
-        context["product_locations"] = ProductLocation.objects.all()[:1000]
+        context["product_locations"] = ProductLocation.objects.all()
         return context
@@ -20,6 +20,8 @@ from open_inwoner.cms.products.cms_apps import ProductsApphook
 from open_inwoner.cms.profile.cms_apps import ProfileApphook
 from open_inwoner.configurations.models import SiteConfiguration
 from open_inwoner.kvk.branches import KVK_BRANCH_SESSION_VARIABLE
+from open_inwoner.openzaak.cache import invalidate_user_zaaktypen
+from open_inwoner.openzaak.clients import MultiZgwClientProxy
 from open_inwoner.openzaak.models import OpenZaakConfig
 from open_inwoner.openzaak.tests.factories import (
     ZaakTypeConfigFactory,
@@ -31,6 +33,7 @@ from open_inwoner.openzaak.tests.shared import (
     DOCUMENTEN_ROOT,
     ZAKEN_ROOT,
 )
+from open_inwoner.pdc.models import Category
 from open_inwoner.pdc.tests.factories import CategoryFactory
 from open_inwoner.utils.test import ClearCachesMixin, paginated_response
 
@@ -694,6 +697,47 @@ class TestCategoriesCaseFiltering(ClearCachesMixin, TransactionWebTest):
                 self.assertEqual(context["categories"][2], self.category6)
                 self.assertEqual(context["categories"][3], self.category7)
 
+    @requests_mock.Mocker()
+    def test_cases_are_summarized_once_per_session(self, m):
+        self._setUpMocks(m)
+        request = cms_tools.get_request(user=self.user)
+
+        with patch.object(
+            MultiZgwClientProxy,
+            "fetch_cases",
+            autospec=True,
+            side_effect=MultiZgwClientProxy.fetch_cases,
+        ) as mock_fetch_cases:
+            categories = Category.objects.filter_by_zaken_for_request(request)
+            self.assertEqual(list(categories), [self.category2, self.category3])
+
+            categories = Category.objects.filter_by_zaken_for_request(request)
+            self.assertEqual(list(categories), [self.category2, self.category3])
+            self.assertEqual(mock_fetch_cases.call_count, 1)
+
+            # a notification about one of the user's cases
+            invalidate_user_zaaktypen([self.user])
+
+            Category.objects.filter_by_zaken_for_request(request)
+            self.assertEqual(mock_fetch_cases.call_count, 2)
+
+    @requests_mock.Mocker()
+    def test_changed_zaaktype_config_is_used(self, m):
+        self._setUpMocks(m)
+        request = cms_tools.get_request(user=self.user)
+
+        categories = Category.objects.filter_by_zaken_for_request(request)
+        self.assertEqual(list(categories), [self.category2, self.category3])
+
+        self.zaaktype_config2.relevante_zaakperiode = 6
+        self.zaaktype_config2.save()
+
+        categories = Category.objects.filter_by_zaken_for_request(request)
+        self.assertEqual(
+            list(categories),
+            [self.category2, self.category3, self.category4, self.category6],
+        )
+
     @patch(
         "zgw_consumers.service.pagination_helper",
         side_effect=RequestException,
@@ -20,10 +20,17 @@ class TestLocationViewThroughMap(WebTest):
 
         html, context = cms_tools.render_plugin(ProductLocationPlugin)
 
+        # the locations in the viewport are loaded by the map
+        self.assertIn(f'data-geojson-url="{reverse("api:locations_geojson")}"', html)
+
+        response = self.app.get(reverse("api:locations_geojson"))
+
         url = reverse(
             "products:location_detail", kwargs={"uuid": product_location.uuid}
         )
-        self.assertIn(url, html)
+        self.assertEqual(
+            response.json["features"][0]["properties"]["location_url"], url
+        )
 
     def test_no_output_generated_without_apphook(self):
         product = ProductFactory()
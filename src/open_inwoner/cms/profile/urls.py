@@ -22,6 +22,7 @@ from open_inwoner.accounts.views import (
     MyNotificationsView,
     MyProfileView,
     NecessaryFieldsUserView,
+    UserAppointmentsPluginView,
     UserAppointmentsView,
 )
 from open_inwoner.accounts.views.actions import ActionDeleteView
@@ -109,5 +110,10 @@ urlpatterns = [
         name="email_verification_user",
     ),
     path("appointments", UserAppointmentsView.as_view(), name="appointments"),
+    path(
+        "appointments/plugin/<int:pk>/",
+        UserAppointmentsPluginView.as_view(),
+        name="appointments_plugin",
+    ),
     path("", MyProfileView.as_view(), name="detail"),
 ]
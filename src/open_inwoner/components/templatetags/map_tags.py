@@ -16,6 +16,8 @@ def map(lat=None, lng=None, **kwargs):
         + lng: float | The longitude position to center the map to.
 
         - extra_classes: str | Extra (css) classes to add .
+        - geojson_feature_collection: str | The GeoJSON features to show.
+        - geojson_url: str | The url to load the GeoJSON features in the viewport from.
         - id: str | The id attribute.
         - small: bool | Whether the map should be small.
         - title: str | The card title.
@@ -11,6 +11,49 @@ from open_inwoner.accounts.query import MessageQuerySet
 register = template.Library()
 
 
+def get_dates(message_list: MessageQuerySet) -> list[datetime.date]:
+    """
+    Returns a list of dates to render message(s) for.
+    """
+    dates = sorted({m.created_on.date() for m in message_list})
+    return dates
+
+
+def get_date_text(date) -> str | datetime.date:
+    """ "
+    Formats a date to a text value (if required).
+    """
+
+    if date == timezone.now().date():
+        return _("Vandaag")
+
+    if date == timezone.now().date() - timezone.timedelta(days=1):
+        return _("Gisteren")
+
+    return date
+
+
+def get_messages_by_date(message_list: MessageQuerySet) -> list[dict]:
+    """
+    Returns a dict containing the date, it's text value and the messages sent on that date.
+    """
+
+    dates = get_dates(message_list)
+    return [
+        {
+            "date": d,
+            "text": get_date_text(d),
+            "messages": list(
+                sorted(
+                    (m for m in message_list if m.created_on.date() == d),
+                    key=lambda m: m.created_on,
+                )
+            ),
+        }
+        for d in dates
+    ]
+
+
 @register.inclusion_tag("components/Messages/Messages.html", takes_context=True)
 def messages(
     context,
@@ -19,6 +62,7 @@ def messages(
     form: Form,
     other_user: str,
     status: str,
+    older_url: str = "",
 ):
     """
     Generate all messages in a conversation and shows the form to add a new message
@@ -32,52 +76,13 @@ def messages(
         + form: Form | a django form.
         + other_user: User | The user that we will be messaging.
         + status: string | The status below the subject.
+        - older_url: string | URL to load the previous (older) messages from.
 
     Extra context:
         - days: set | the message_list grouped by date.
         - subject: string | The title that will be displayed above the messages.
     """
 
-    def get_dates(message_list: MessageQuerySet) -> list[datetime.date]:
-        """
-        Returns a list of dates to render message(s) for.
-        """
-        dates = sorted({m.created_on.date() for m in message_list})
-        return dates
-
-    def get_date_text(date) -> str | datetime.date:
-        """ "
-        Formats a date to a text value (if required).
-        """
-
-        if date == timezone.now().date():
-            return _("Vandaag")
-
-        if date == timezone.now().date() - timezone.timedelta(days=1):
-            return _("Gisteren")
-
-        return date
-
-    def get_messages_by_date(message_list: MessageQuerySet) -> list[dict]:
-        """
-        Returns a dict containing the date, it's text value and the messages sent on that date.
-        """
-
-        dates = get_dates(message_list)
-        return [
-            {
-                "date": d,
-                "text": get_date_text(d),
-                "messages": list(
-                    sorted(
-                        (m for m in message_list if m.created_on.date() == d),
-                        key=lambda m: m.created_on,
-                    )
-                ),
-            }
-            for d in dates
-        ]
-
     return {
         **context.flatten(),
         "days": get_messages_by_date(message_list),
@@ -86,9 +91,28 @@ def messages(
         "status": status,
         "other_user": other_user,
         "subject": other_user.get_full_name(),
+        "older_url": older_url,
     }
 
 
+@register.inclusion_tag("components/Messages/MessageDays.html")
+def message_days(message_list: MessageQuerySet, user: User) -> dict:
+    """
+    Generate the messages of a conversation grouped by date
+
+    Usage:
+        {% message_days message_list=messages user=request.user %}
+
+    Variables:
+        + message_list: Message[] | a list of messages that needs to be displayed.
+        + user: User | currently loggedin user.
+
+    Extra context:
+        - days: set | the message_list grouped by date.
+    """
+    return {"days": get_messages_by_date(message_list), "user": user}
+
+
 @register.inclusion_tag("components/Messages/Message.html")
 def message(message: Message, user: User, file=False) -> dict:
     """
@@ -116,6 +116,54 @@ CACHE_ZGW_ZAKEN_TIMEOUT = config("CACHE_ZGW_ZAKEN_TIMEOUT", default=60 * 1)
 
 # Laposta API caching
 CACHE_LAPOSTA_API_TIMEOUT = config("CACHE_LAPOSTA_API_TIMEOUT", default=60 * 15)
+# combined deadline (in seconds) for checking the subscriptions of all lists
+LAPOSTA_SUBSCRIPTIONS_TIMEOUT = config("LAPOSTA_SUBSCRIPTIONS_TIMEOUT", default=5)
+LAPOSTA_SUBSCRIPTIONS_MAX_WORKERS = config(
+    "LAPOSTA_SUBSCRIPTIONS_MAX_WORKERS", default=8
+)
+
+# Qmatic appointments: fresh for CACHE_QMATIC_APPOINTMENTS_TIMEOUT, after which
+# stale entries are served while they're refreshed in the background
+CACHE_QMATIC_APPOINTMENTS_TIMEOUT = config(
+    "CACHE_QMATIC_APPOINTMENTS_TIMEOUT", default=60 * 5
+)
+CACHE_QMATIC_APPOINTMENTS_STALE_TIMEOUT = config(
+    "CACHE_QMATIC_APPOINTMENTS_STALE_TIMEOUT", default=60 * 60
+)
+QMATIC_REQUEST_TIMEOUT = config("QMATIC_REQUEST_TIMEOUT", default=5)
+
+# Haal Centraal BRP caching (entries are encrypted and keyed by hashed BSN).
+# CACHE_BRP_MAX_STALENESS is the upper bound on the age of BRP data we are
+# allowed to serve from cache (data minimisation); set CACHE_BRP_TIMEOUT to 0
+# to disable caching of BRP data altogether.
+CACHE_BRP = "default"
+CACHE_BRP_TIMEOUT = config("CACHE_BRP_TIMEOUT", default=60 * 5)
+CACHE_BRP_MAX_STALENESS = config("CACHE_BRP_MAX_STALENESS", default=60 * 15)
+
+# Search autocomplete suggestions, invalidated when the index is updated
+CACHE_SEARCH_AUTOCOMPLETE_TIMEOUT = config(
+    "CACHE_SEARCH_AUTOCOMPLETE_TIMEOUT", default=60 * 60
+)
+
+# Rendered (markdown) content, keyed by the hash of the content
+CACHE_RENDERED_CONTENT_TIMEOUT = config(
+    "CACHE_RENDERED_CONTENT_TIMEOUT", default=60 * 60 * 24 * 7
+)
+
+# PDC data served by the API, invalidated when the categories or products change
+CACHE_PDC_API_TIMEOUT = config("CACHE_PDC_API_TIMEOUT", default=60 * 60 * 24)
+# PDC pages of anonymous visitors, invalidated when the PDC data or CMS pages change
+CACHE_PDC_PAGES_TIMEOUT = config("CACHE_PDC_PAGES_TIMEOUT", default=60 * 60)
+# GeoJSON and centroids of the locations, invalidated when the locations change
+CACHE_PDC_LOCATIONS_TIMEOUT = config(
+    "CACHE_PDC_LOCATIONS_TIMEOUT", default=60 * 60 * 24
+)
+# the global template context derived from the site configuration and the menu
+# categories, invalidated when the configuration or the categories change
+CACHE_SITE_CONTEXT = config("CACHE_SITE_CONTEXT", default=True)
+# the maximum age of the data cached in-process (which is also rebuilt when its
+# version is bumped)
+CACHE_LOCAL_TIMEOUT = config("CACHE_LOCAL_TIMEOUT", default=60 * 5)
 
 
 #
@@ -703,6 +751,18 @@ CELERY_BEAT_SCHEDULE = {
         "task": "open_inwoner.search.tasks.rebuild_search_index",
         "schedule": crontab(minute="0", hour="4", day_of_month="*"),
     },
+    "Zoekindex bijwerken": {
+        "task": "open_inwoner.search.tasks.update_search_index",
+        "schedule": crontab(minute="30", hour="*", day_of_month="*"),
+    },
+    "Zoekstatistieken bijwerken": {
+        "task": "open_inwoner.search.tasks.flush_search_events",
+        "schedule": crontab(minute="*"),
+    },
+    "Verwijder verlopen zoekopdrachten": {
+        "task": "open_inwoner.search.tasks.delete_expired_search_events",
+        "schedule": crontab(minute="15", hour="3", day_of_month="*"),
+    },
     "Dagelijkse misluke email samenvatting": {
         "task": "open_inwoner.configurations.tasks.send_failed_mail_digest",
         "schedule": crontab(minute="0", hour="7", day_of_month="*"),
@@ -739,6 +799,14 @@ CELERY_BEAT_SCHEDULE = {
             "channel": "email",
         },
     },
+    "Synchroniseer openstaande taken van actieve gebruikers": {
+        "task": "open_inwoner.userfeed.tasks.sync_active_user_tasks",
+        "schedule": crontab(minute="*/10"),
+    },
+    "Verwijder verlopen PDF exports": {
+        "task": "open_inwoner.utils.tasks.delete_expired_exports",
+        "schedule": crontab(minute="*/30"),
+    },
     "Opschonen uitgaande request-logs": {
         "task": "log_outgoing_requests.tasks.prune_logs",
         "schedule": crontab(hour=0, minute=0),
@@ -801,6 +869,11 @@ SENDFILE_ROOT = PRIVATE_MEDIA_ROOT
 SENDFILE_BACKEND = "django_sendfile.backends.simple"
 PRIVATE_MEDIA_URL = "/private_files/"
 
+# PDF exports are rendered by a celery worker and stored in private media; the
+# rendered files (and the job handles) expire after EXPORT_PDF_EXPIRY seconds
+EXPORT_PDF_ASYNC = config("EXPORT_PDF_ASYNC", default=True)
+EXPORT_PDF_EXPIRY = config("EXPORT_PDF_EXPIRY", default=60 * 60)
+
 CORS_ALLOWED_ORIGINS = []
 CORS_ALLOW_CREDENTIALS = True
 
@@ -881,6 +954,8 @@ GEOPY_APP = "Openinwoner"
 GEOPY_TIMEOUT = 10  # in seconds
 LOCATIESERVER_DOMAIN = "api.pdok.nl/bzk/locatieserver/search/v3_1"
 GEOCODER = "open_inwoner.utils.geocode.PdocLocatieserver"
+# the maximum number of concurrent requests when geocoding a batch of addresses
+GEOCODE_MAX_WORKERS = config("GEOCODE_MAX_WORKERS", default=4)
 
 
 # ELASTICSEARCH CONFIG
@@ -890,6 +965,17 @@ ELASTICSEARCH_DSL = {
 ES_INDEX_PRODUCTS = config("ES_INDEX_PRODUCTS", "products")
 ES_MAX_SIZE = 10000
 ES_SUGGEST_SIZE = 5
+# shorter prefixes don't get suggestions (and don't reach Elasticsearch)
+ES_SUGGEST_MIN_LENGTH = config("ES_SUGGEST_MIN_LENGTH", default=2)
+# max-age of the autocomplete responses for proxies and browsers
+ES_SUGGEST_MAX_AGE = config("ES_SUGGEST_MAX_AGE", default=60 * 5)
+
+# search analytics: searches are buffered in the cache until they're stored by
+# the periodic task, the individual searches are kept for the retention period
+SEARCH_EVENTS_BUFFER_TIMEOUT = config(
+    "SEARCH_EVENTS_BUFFER_TIMEOUT", default=60 * 60 * 24
+)
+SEARCH_EVENTS_RETENTION_DAYS = config("SEARCH_EVENTS_RETENTION_DAYS", default=90)
 
 
 # django import-export
@@ -909,6 +995,14 @@ ZGW_LIMIT_NOTIFICATIONS_FREQUENCY = config(
     "ZGW_LIMIT_NOTIFICATIONS_FREQUENCY", default=60 * 15
 )
 
+# userfeed: minimum interval (seconds) between syncs of a user's open tasks, and
+# how recently (seconds) users must have logged in to be synced periodically
+USERFEED_TASKS_SYNC_DEBOUNCE = config("USERFEED_TASKS_SYNC_DEBOUNCE", default=60 * 5)
+USERFEED_TASKS_SYNC_ACTIVE = config("USERFEED_TASKS_SYNC_ACTIVE", default=60 * 60)
+# the rendered feed is invalidated on changes to the user's feed items, the timeout
+# bounds staleness from other changes (e.g. publishing CMS apps, status configs)
+CACHE_USERFEED_TIMEOUT = config("CACHE_USERFEED_TIMEOUT", default=60 * 15)
+
 # recent documents: created/added no longer than n days in the past
 DOCUMENT_RECENT_DAYS = config("DOCUMENT_RECENT_DAYS", default=1)
 
@@ -933,6 +1027,8 @@ UPLOAD_FILE_TYPES = "application/vnd.openxmlformats-officedocument.wordprocessin
 
 # HaalCentraal BRP versions
 BRP_VERSION = config("BRP_VERSION", default="2.0")
+# retrieve BRP data in a background task on DigiD login
+BRP_UPDATE_ON_LOGIN_ASYNC = config("BRP_UPDATE_ON_LOGIN_ASYNC", default=True)
 
 #
 # DIGID
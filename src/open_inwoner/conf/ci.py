@@ -50,6 +50,14 @@ ENVIRONMENT = "CI"
 
 # Django solo caching (disabled for CI)
 SOLO_CACHE = None
+# tests change the configuration in their (rolled back) transaction
+CACHE_SITE_CONTEXT = False
+
+# tests assert the BRP update on login directly, without a celery worker
+BRP_UPDATE_ON_LOGIN_ASYNC = False
+
+# tests expect the PDF in the export response, unless testing the export jobs
+EXPORT_PDF_ASYNC = False
 
 #
 # Django-axes
@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class ConfigurationsConfig(AppConfig):
+    name = "open_inwoner.configurations"
+
+    def ready(self):
+        from .signals import invalidate_site_configuration_version  # noqa
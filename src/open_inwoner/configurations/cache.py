@@ -0,0 +1,30 @@
+"""
+The version of the site configuration, which is bumped when the configuration
+(or the flatpages in the footer) is changed. Data derived from the
+configuration can be cached under the version.
+"""
+from open_inwoner.utils.cache import (
+    LocalVersionedCache,
+    bump_cache_version_on_commit,
+    get_cache_version,
+)
+
+SITE_CONFIGURATION_VERSION_CACHE_KEY = "configurations:site_configuration:version"
+
+_site_configuration_data = LocalVersionedCache(SITE_CONFIGURATION_VERSION_CACHE_KEY)
+
+
+def get_site_configuration_version() -> str:
+    return get_cache_version(SITE_CONFIGURATION_VERSION_CACHE_KEY)
+
+
+def invalidate_site_configuration() -> None:
+    bump_cache_version_on_commit(SITE_CONFIGURATION_VERSION_CACHE_KEY)
+
+
+def get_site_configuration_data(name: str, build):
+    """
+    Data derived from the configuration, kept in-process until the version is
+    bumped.
+    """
+    return _site_configuration_data.get(name, build)
@@ -0,0 +1,13 @@
+from django.contrib.flatpages.models import FlatPage
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_site_configuration
+from .models import SiteConfiguration, SiteConfigurationPage
+
+
+@receiver([post_save, post_delete], sender=SiteConfiguration)
+@receiver([post_save, post_delete], sender=SiteConfigurationPage)
+@receiver([post_save, post_delete], sender=FlatPage)
+def invalidate_site_configuration_version(sender, **kwargs):
+    invalidate_site_configuration()
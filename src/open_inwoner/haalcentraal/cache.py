@@ -0,0 +1,97 @@
+"""
+Short-lived, encrypted cache for Haal Centraal BRP responses.
+
+BRP data is personal data: entries are keyed by a salted hash of the BSN (so the
+BSN never appears in the cache keyspace) and the payload is encrypted with a key
+derived from ``settings.SECRET_KEY``. Entries are never served when they are
+older than ``settings.CACHE_BRP_MAX_STALENESS``, regardless of the cache TTL.
+"""
+import base64
+import dataclasses
+import json
+import logging
+from datetime import date
+from hashlib import sha256
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils import timezone
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from open_inwoner.utils.hash import create_sha256_hash
+
+from .api_models import BRPData
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_SALT = "open_inwoner.haalcentraal.cache"
+
+
+def _get_fernet() -> Fernet:
+    digest = sha256(f"{CACHE_KEY_SALT}:{settings.SECRET_KEY}".encode()).digest()
+    return Fernet(base64.urlsafe_b64encode(digest))
+
+
+def get_cache_key(user_bsn: str, version: str) -> str:
+    hashed_bsn = create_sha256_hash(user_bsn, salt=settings.SECRET_KEY)
+    return f"brp:{version}:{hashed_bsn}"
+
+
+def _get_timeout() -> int:
+    return min(settings.CACHE_BRP_TIMEOUT, settings.CACHE_BRP_MAX_STALENESS)
+
+
+def _encode(brp: BRPData) -> bytes:
+    data = dataclasses.asdict(brp)
+    if brp.birthday:
+        data["birthday"] = brp.birthday.isoformat()
+    payload = {
+        "fetched_at": timezone.now().timestamp(),
+        "data": data,
+    }
+    return _get_fernet().encrypt(json.dumps(payload).encode())
+
+
+def _decode(token: bytes) -> tuple[float, BRPData]:
+    payload = json.loads(_get_fernet().decrypt(token))
+    data = payload["data"]
+    if data.get("birthday"):
+        data["birthday"] = date.fromisoformat(data["birthday"])
+    return payload["fetched_at"], BRPData(**data)
+
+
+def get_cached_brp(user_bsn: str, version: str) -> BRPData | None:
+    if not settings.CACHE_BRP_TIMEOUT:
+        return None
+
+    token = caches[settings.CACHE_BRP].get(get_cache_key(user_bsn, version))
+    if token is None:
+        return None
+
+    try:
+        fetched_at, brp = _decode(token)
+    except (InvalidToken, ValueError, TypeError, KeyError):
+        logger.warning("discarding unreadable BRP cache entry")
+        delete_cached_brp(user_bsn, version)
+        return None
+
+    age = timezone.now().timestamp() - fetched_at
+    if age > settings.CACHE_BRP_MAX_STALENESS:
+        delete_cached_brp(user_bsn, version)
+        return None
+
+    return brp
+
+
+def set_cached_brp(user_bsn: str, version: str, brp: BRPData) -> None:
+    if not settings.CACHE_BRP_TIMEOUT:
+        return
+
+    caches[settings.CACHE_BRP].set(
+        get_cache_key(user_bsn, version), _encode(brp), timeout=_get_timeout()
+    )
+
+
+def delete_cached_brp(user_bsn: str, version: str) -> None:
+    caches[settings.CACHE_BRP].delete(get_cache_key(user_bsn, version))
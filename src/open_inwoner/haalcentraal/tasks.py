@@ -0,0 +1,26 @@
+import logging
+
+from open_inwoner.accounts.models import User
+from open_inwoner.celery import app
+
+from .utils import update_brp_data_in_db
+
+logger = logging.getLogger(__name__)
+
+
+@app.task
+def update_brp_data(user_id: int):
+    """
+    Retrieve BRP data for a user in the background, which also warms the BRP
+    cache used by the "Mijn gegevens" page.
+    """
+    try:
+        user = User.objects.get(pk=user_id)
+    except User.DoesNotExist:
+        logger.warning("user %s no longer exists, skipping BRP update", user_id)
+        return
+
+    if not user.bsn:
+        return
+
+    update_brp_data_in_db(user)
@@ -0,0 +1,78 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+import requests_mock
+from freezegun import freeze_time
+
+from open_inwoner.utils.test import ClearCachesMixin
+
+from ..cache import get_cache_key, get_cached_brp
+from ..utils import fetch_brp
+from .mixins import HaalCentraalMixin
+
+BSN = "999993847"
+
+
+@requests_mock.Mocker()
+class BRPCacheTest(ClearCachesMixin, HaalCentraalMixin, TestCase):
+    def _brp_requests(self, m):
+        return [r for r in m.request_history if r.method == "POST"]
+
+    def test_fetch_brp_is_cached(self, m):
+        self._setUpMocks_v_2(m)
+        self._setUpService()
+
+        first = fetch_brp(BSN)
+        second = fetch_brp(BSN)
+
+        self.assertEqual(first, second)
+        self.assertEqual(first.first_name, "Merel")
+        self.assertEqual(len(self._brp_requests(m)), 1)
+
+    def test_fetch_brp_bypass_cache(self, m):
+        self._setUpMocks_v_2(m)
+        self._setUpService()
+
+        fetch_brp(BSN)
+        fetch_brp(BSN, use_cache=False)
+
+        self.assertEqual(len(self._brp_requests(m)), 2)
+
+    def test_cache_entry_is_encrypted_and_keyed_by_hashed_bsn(self, m):
+        self._setUpMocks_v_2(m)
+        self._setUpService()
+
+        fetch_brp(BSN)
+
+        key = get_cache_key(BSN, "2.1")
+        self.assertNotIn(BSN, key)
+
+        token = caches[settings.CACHE_BRP].get(key)
+        self.assertIsNotNone(token)
+        self.assertNotIn(b"Merel", token)
+        self.assertNotIn(BSN.encode(), token)
+
+    @override_settings(CACHE_BRP_TIMEOUT=60 * 60, CACHE_BRP_MAX_STALENESS=60)
+    def test_entries_older_than_max_staleness_are_not_served(self, m):
+        self._setUpMocks_v_2(m)
+        self._setUpService()
+
+        fetch_brp(BSN)
+        self.assertIsNotNone(get_cached_brp(BSN, "2.1"))
+
+        with freeze_time(timezone.now() + timedelta(seconds=61)):
+            self.assertIsNone(get_cached_brp(BSN, "2.1"))
+
+    @override_settings(CACHE_BRP_TIMEOUT=0)
+    def test_cache_disabled(self, m):
+        self._setUpMocks_v_2(m)
+        self._setUpService()
+
+        fetch_brp(BSN)
+        fetch_brp(BSN)
+
+        self.assertEqual(len(self._brp_requests(m)), 2)
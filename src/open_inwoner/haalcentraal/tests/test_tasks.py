@@ -0,0 +1,96 @@
+from unittest.mock import patch
+
+from django.contrib.auth.signals import user_logged_in
+from django.test import RequestFactory, TestCase, override_settings
+
+import requests_mock
+
+from open_inwoner.accounts.choices import LoginTypeChoices
+from open_inwoner.accounts.tests.factories import UserFactory
+
+from ...utils.test import ClearCachesMixin
+from ..tasks import update_brp_data
+from .mixins import HaalCentraalMixin
+
+
+@override_settings(BRP_UPDATE_ON_LOGIN_ASYNC=True)
+@patch("open_inwoner.haalcentraal.tasks.update_brp_data.delay")
+class BRPUpdateOnLoginTest(ClearCachesMixin, HaalCentraalMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+
+        # the open tasks of the user are synced on login as well
+        patcher = patch("open_inwoner.userfeed.tasks.sync_user_tasks.delay")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def login(self, user):
+        request = RequestFactory().get("/")
+        request.user = user
+        user_logged_in.send(user.__class__, user=user, request=request)
+
+    def test_login_schedules_update_on_commit(self, mock_delay):
+        user = UserFactory(login_type=LoginTypeChoices.digid, bsn="999993847")
+        self._setUpService()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.login(user)
+
+            # the login isn't blocked on the BRP API
+            mock_delay.assert_not_called()
+
+        mock_delay.assert_called_once_with(user.pk)
+
+    def test_login_without_service_does_not_schedule_update(self, mock_delay):
+        user = UserFactory(login_type=LoginTypeChoices.digid, bsn="999993847")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.login(user)
+
+        mock_delay.assert_not_called()
+
+    def test_login_without_digid_does_not_schedule_update(self, mock_delay):
+        user = UserFactory(login_type=LoginTypeChoices.default)
+        self._setUpService()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.login(user)
+
+        mock_delay.assert_not_called()
+
+
+@requests_mock.Mocker()
+class UpdateBRPDataTaskTest(ClearCachesMixin, HaalCentraalMixin, TestCase):
+    def test_task_updates_user(self, m):
+        # created before the service is configured, so it isn't prepopulated
+        user = UserFactory(
+            first_name="",
+            last_name="",
+            login_type=LoginTypeChoices.digid,
+            bsn="999993847",
+        )
+        self._setUpService()
+        self._setUpMocks_v_2(m)
+
+        update_brp_data(user.pk)
+
+        user.refresh_from_db()
+        self.assertEqual(user.first_name, "Merel")
+        self.assertEqual(user.last_name, "Kooyman")
+        self.assertTrue(user.is_prepopulated)
+
+    def test_task_skips_deleted_user(self, m):
+        self._setUpService()
+
+        with self.assertLogs("open_inwoner.haalcentraal.tasks", level="WARNING"):
+            update_brp_data(0)
+
+        self.assertFalse(m.called)
+
+    def test_task_skips_user_without_bsn(self, m):
+        user = UserFactory(login_type=LoginTypeChoices.digid, bsn="")
+        self._setUpService()
+
+        update_brp_data(user.pk)
+
+        self.assertFalse(m.called)
@@ -5,6 +5,7 @@ from django.utils.translation import gettext as _
 
 from open_inwoner.haalcentraal.api import BRP_1_3, BRP_2_1, BRPAPI
 from open_inwoner.haalcentraal.api_models import BRPData
+from open_inwoner.haalcentraal.cache import get_cached_brp, set_cached_brp
 from open_inwoner.utils.logentry import system_action
 
 logger = logging.getLogger(__name__)
@@ -21,11 +22,22 @@ def get_brp_api() -> BRPAPI:
         raise NotImplementedError(f"no implementation for BRP API '{brp_version}'")
 
 
-def fetch_brp(user_bsn: str) -> BRPData | None:
+def fetch_brp(user_bsn: str, use_cache: bool = True) -> BRPData | None:
+    """
+    Retrieve BRP data, served from the (short-lived, encrypted) BRP cache when
+    possible. Successful responses are written back to the cache.
+    """
     if not user_bsn:
         return
     api = get_brp_api()
-    return api.fetch_brp(user_bsn)
+
+    if use_cache and (brp := get_cached_brp(user_bsn, api.version)):
+        return brp
+
+    brp = api.fetch_brp(user_bsn)
+    if brp:
+        set_cached_brp(user_bsn, api.version, brp)
+    return brp
 
 
 def update_brp_data_in_db(user, initial=True):
@@ -58,6 +58,7 @@ class Map {
     const tileLayer = L.tileLayer(tileConfig.url, tileConfig.options)
     tileLayer.addTo(this.map)
     this.addGeoJSON()
+    this.loadGeoJSON()
 
     if (isMobile()) {
       this.map.dragging.disable()
@@ -83,6 +84,62 @@ class Map {
     }).addTo(this.map)
   }
 
+  /**
+   * Loads the geoJSON within the viewport from data-geojson-url, and again
+   * when the viewport changes.
+   */
+  loadGeoJSON() {
+    this.geoJSONUrl = this.node.dataset.geojsonUrl
+
+    if (!this.geoJSONUrl) {
+      return
+    }
+
+    this.geoJSONLayer = L.geoJSON(null, {
+      onEachFeature: (feature, layer) =>
+        layer.bindPopup(this.featureToHTML(feature), {
+          maxWidth: 300,
+        }),
+    }).addTo(this.map)
+
+    // only the response of the latest viewport is shown
+    let controller = null
+
+    const load = async () => {
+      if (controller) {
+        controller.abort()
+      }
+      controller = new AbortController()
+      const { signal } = controller
+
+      const bbox = this.map.getBounds().toBBoxString()
+      let data
+      try {
+        const response = await fetch(`${this.geoJSONUrl}?bbox=${bbox}`, {
+          signal,
+        })
+        if (!response.ok) {
+          return
+        }
+        data = await response.json()
+      } catch (error) {
+        if (error.name === 'AbortError') {
+          return
+        }
+        throw error
+      }
+
+      if (signal.aborted) {
+        return
+      }
+      this.geoJSONLayer.clearLayers()
+      this.geoJSONLayer.addData(data)
+    }
+
+    this.map.on('moveend', load)
+    load()
+  }
+
   /**
    * Renders a feature as html.
    * @param {Object} feature
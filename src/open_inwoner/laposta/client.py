@@ -1,11 +1,13 @@
+import concurrent.futures
 import logging
+import time
 from urllib.parse import quote
 
 from django.conf import settings
 from django.core.cache import cache
 
 from ape_pie.client import APIClient
-from requests.exceptions import RequestException
+from requests.exceptions import HTTPError, RequestException
 
 from open_inwoner.utils.api import ClientError, get_json_response
 
@@ -24,6 +26,10 @@ def quote_email(email: str) -> str:
     return quote(email_with_quoted_plus)
 
 
+def get_subscription_cache_key(list_id: str, email: str) -> str:
+    return f"laposta_list_subscription:{list_id}:{email}"
+
+
 class LapostaClient(APIClient):
     @cache_result("laposta_lists", timeout=settings.CACHE_LAPOSTA_API_TIMEOUT)
     def get_lists(self) -> list[LapostaList]:
@@ -52,6 +58,7 @@ class LapostaClient(APIClient):
             # Handle scenario where a subscription exists in the API, but not locally
             if error.get("code") == 204 and error.get("parameter") == "email":
                 logger.info("Subscription already exists for user")
+                self._set_subscription_cache(list_id, user_data.email, True)
                 return Member(
                     member_id=data["error"]["member_id"],
                     list_id=list_id,
@@ -63,9 +70,8 @@ class LapostaClient(APIClient):
         if not data:
             return None
 
-        # Ensure the current subscriptions for this email address are fetched again after
-        # this API call
-        cache.delete(f"laposta_list_subscriptions:{user_data.email}")
+        # Only the subscription for this list changed, the others remain cached
+        self._set_subscription_cache(list_id, user_data.email, True)
 
         return Member(**data["member"])
 
@@ -80,30 +86,122 @@ class LapostaClient(APIClient):
             # but it does exist locally
             if error.get("code") == 203 and error.get("parameter") == "member_id":
                 logger.info("Subscription does not exist for user")
+                self._set_subscription_cache(list_id, email, False)
                 return None
 
         data = get_json_response(response)
         if not data:
             return None
 
-        # Ensure the current subscriptions for this email address are fetched again after
-        # this API call
-        cache.delete(f"laposta_list_subscriptions:{email}")
+        # Only the subscription for this list changed, the others remain cached
+        self._set_subscription_cache(list_id, email, False)
 
         return Member(**data["member"])
 
-    @cache_result(
-        "laposta_list_subscriptions:{email}", timeout=settings.CACHE_LAPOSTA_API_TIMEOUT
-    )
+    def _set_subscription_cache(self, list_id: str, email: str, subscribed: bool):
+        cache.set(
+            get_subscription_cache_key(list_id, email),
+            subscribed,
+            timeout=settings.CACHE_LAPOSTA_API_TIMEOUT,
+        )
+
+    def is_subscribed(
+        self, list_id: str, email: str, timeout: float | None = None
+    ) -> bool:
+        """
+        Only a found (or unknown) member is a definitive answer, other responses
+        raise so they are not mistaken for "not subscribed".
+        """
+        response = self.get(
+            f"member/{quote_email(email)}",
+            params={"list_id": list_id},
+            timeout=timeout or settings.LAPOSTA_SUBSCRIPTIONS_TIMEOUT,
+        )
+        if response.status_code == 200:
+            return True
+        if response.status_code in (400, 404):
+            return False
+        raise HTTPError(
+            f"unexpected status {response.status_code} for subscription",
+            response=response,
+        )
+
     def get_subscriptions_for_email(self, list_ids: list[str], email: str) -> list[str]:
-        subscribed_to = []
-        for list_id in list_ids:
-            response = self.get(
-                f"member/{quote_email(email)}", params={"list_id": list_id}
+        """
+        Return the ids of the lists `email` is subscribed to, see
+        `check_subscriptions_for_email`.
+        """
+        subscribed, _unknown = self.check_subscriptions_for_email(list_ids, email)
+        return subscribed
+
+    def check_subscriptions_for_email(
+        self, list_ids: list[str], email: str
+    ) -> tuple[list[str], list[str]]:
+        """
+        Return the ids of the lists `email` is subscribed to, and the ids of the
+        lists that could not be checked before the deadline (or failed).
+
+        Membership is cached per list, lists that are not in the cache are checked
+        concurrently. Use the client as a context manager to check them on a
+        shared session. The lists that could not be checked are not cached.
+        """
+        keys = {
+            list_id: get_subscription_cache_key(list_id, email) for list_id in list_ids
+        }
+        cached = cache.get_many(keys.values())
+        subscriptions = {
+            list_id: cached[key] for list_id, key in keys.items() if key in cached
+        }
+
+        if missing := [list_id for list_id in list_ids if list_id not in subscriptions]:
+            fetched = self._fetch_subscriptions(missing, email)
+            subscriptions.update(fetched)
+            cache.set_many(
+                {keys[list_id]: subscribed for list_id, subscribed in fetched.items()},
+                timeout=settings.CACHE_LAPOSTA_API_TIMEOUT,
+            )
+
+        return (
+            [list_id for list_id in list_ids if subscriptions.get(list_id)],
+            [list_id for list_id in list_ids if list_id not in subscriptions],
+        )
+
+    def _fetch_subscriptions(self, list_ids: list[str], email: str) -> dict[str, bool]:
+        deadline = time.monotonic() + settings.LAPOSTA_SUBSCRIPTIONS_TIMEOUT
+
+        def fetch(list_id: str) -> bool:
+            # requests that start late only get the remaining time
+            remaining = max(deadline - time.monotonic(), 0.1)
+            return self.is_subscribed(list_id, email, timeout=remaining)
+
+        results = {}
+        # the executor is not used as a context manager, which would wait for
+        # the requests that exceeded the deadline
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=settings.LAPOSTA_SUBSCRIPTIONS_MAX_WORKERS
+        )
+        try:
+            futures = {executor.submit(fetch, list_id): list_id for list_id in list_ids}
+            done, not_done = concurrent.futures.wait(
+                futures, timeout=settings.LAPOSTA_SUBSCRIPTIONS_TIMEOUT
+            )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        for future in done:
+            try:
+                results[futures[future]] = future.result()
+            except RequestException:
+                logger.exception(
+                    "exception while retrieving subscription for list %s",
+                    futures[future],
+                )
+        for future in not_done:
+            logger.warning(
+                "retrieving subscription for list %s exceeded the deadline",
+                futures[future],
             )
-            if response.status_code == 200:
-                subscribed_to.append(list_id)
-        return subscribed_to
+        return results
 
 
 def create_laposta_client() -> LapostaClient | None:
@@ -25,33 +25,47 @@ class NewsletterSubscriptionForm(forms.Form):
         required=False,
         widget=forms.widgets.CheckboxSelectMultiple,
     )
+    # the lists of which the subscription could not be retrieved, these are
+    # left alone when saving
+    unknown_newsletters = forms.MultipleChoiceField(
+        required=False, widget=forms.MultipleHiddenInput
+    )
 
     def __init__(self, request=None, *args, **kwargs):
         super().__init__(**kwargs)
+        self.unknown_newsletters = []
 
         if not request.user.has_verified_email():
             return
 
         if laposta_client := create_laposta_client():
-            lists = laposta_client.get_lists()
-            self.fields["newsletters"].choices = get_list_choices(lists)
-            self.fields["newsletters"].remarks_mapping = get_list_remarks_mapping(lists)
-            if limited_to := LapostaConfig.get_solo().limit_list_selection_to:
-                self.fields["newsletters"].choices = [
-                    choice
-                    for choice in self.fields["newsletters"].choices
-                    if choice[0] in limited_to
-                ]
-
-            # In case of errors, we want to keep the same data selected
-            if "newsletters" in request.POST:
-                initial_data = request.POST.getlist("newsletters")
-            else:
-                initial_data = laposta_client.get_subscriptions_for_email(
-                    limited_to, request.user.verified_email
+            with laposta_client:
+                lists = laposta_client.get_lists()
+                choices = get_list_choices(lists)
+                if limited_to := LapostaConfig.get_solo().limit_list_selection_to:
+                    choices = [choice for choice in choices if choice[0] in limited_to]
+                self.fields["newsletters"].choices = choices
+                self.fields["newsletters"].remarks_mapping = get_list_remarks_mapping(
+                    lists
                 )
+                self.fields["unknown_newsletters"].choices = choices
+
+                # In case of errors, we want to keep the same data selected
+                if "newsletters" in request.POST:
+                    initial_data = request.POST.getlist("newsletters")
+                    self.unknown_newsletters = request.POST.getlist(
+                        "unknown_newsletters"
+                    )
+                else:
+                    (
+                        initial_data,
+                        self.unknown_newsletters,
+                    ) = laposta_client.check_subscriptions_for_email(
+                        limited_to, request.user.verified_email
+                    )
 
             self.fields["newsletters"].initial = initial_data
+            self.fields["unknown_newsletters"].initial = self.unknown_newsletters
 
     def save(self, request, *args, **kwargs):
         user: User = request.user
@@ -62,6 +76,11 @@ class NewsletterSubscriptionForm(forms.Form):
         if not client:
             return
 
+        with client:
+            self._save_subscriptions(request, client)
+
+    def _save_subscriptions(self, request, client):
+        user: User = request.user
         newsletters = self.cleaned_data["newsletters"]
         has_errors = False
 
@@ -74,11 +93,28 @@ class NewsletterSubscriptionForm(forms.Form):
             options=None,
         )
         limited_to = LapostaConfig.get_solo().limit_list_selection_to
-        existing_subscriptions = set(
-            client.get_subscriptions_for_email(limited_to, user.verified_email)
+        subscribed, unknown = client.check_subscriptions_for_email(
+            limited_to, user.verified_email
         )
+        existing_subscriptions = set(subscribed)
+
+        # the choice of the user can't be compared to an unknown subscription
+        skipped = set(self.cleaned_data["unknown_newsletters"])
+        for list_id in set(unknown) - skipped:
+            has_errors = True
+            self.add_error(
+                "newsletters",
+                ValidationError(
+                    _(
+                        "Something went wrong while trying to retrieve the "
+                        "subscription to '{list_name}', please try again later"
+                    ).format(list_name=list_name_mapping[list_id])
+                ),
+            )
+        skipped.update(unknown)
+
         for list_id in newsletters:
-            if list_id in existing_subscriptions:
+            if list_id in existing_subscriptions or list_id in skipped:
                 continue
 
             try:
@@ -98,7 +134,7 @@ class NewsletterSubscriptionForm(forms.Form):
                     ),
                 )
 
-        unsubscribe_from_ids = existing_subscriptions - set(newsletters)
+        unsubscribe_from_ids = existing_subscriptions - set(newsletters) - skipped
         for list_id in unsubscribe_from_ids:
             try:
                 client.remove_subscription(list_id, user.verified_email)
@@ -0,0 +1,156 @@
+import time
+
+from django.test import TestCase, override_settings, tag
+
+import requests_mock
+from requests.exceptions import ConnectTimeout
+
+from open_inwoner.laposta.api_models import UserData
+from open_inwoner.utils.test import ClearCachesMixin
+
+from ..client import create_laposta_client
+from ..models import LapostaConfig
+from .factories import MemberFactory
+
+LAPOSTA_API_ROOT = "https://laposta.local/api/v2/"
+EMAIL = "news@example.com"
+
+
+@tag("laposta")
+@requests_mock.Mocker()
+class LapostaSubscriptionsTestCase(ClearCachesMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+
+        config = LapostaConfig.get_solo()
+        config.api_root = LAPOSTA_API_ROOT
+        config.basic_auth_username = "username"
+        config.basic_auth_password = "password"
+        config.save()
+
+        self.laposta_client = create_laposta_client()
+
+    def setUpMocks(self, m):
+        self.member_matchers = {
+            "123": m.get(
+                f"{LAPOSTA_API_ROOT}member/{EMAIL}?list_id=123",
+                json={
+                    "member": MemberFactory.build(
+                        list_id="123", email=EMAIL, custom_fields=None
+                    ).model_dump()
+                },
+            ),
+            "456": m.get(
+                f"{LAPOSTA_API_ROOT}member/{EMAIL}?list_id=456", status_code=400
+            ),
+            "789": m.get(
+                f"{LAPOSTA_API_ROOT}member/{EMAIL}?list_id=789", status_code=400
+            ),
+        }
+
+    def test_subscriptions_are_returned_in_list_order(self, m):
+        self.setUpMocks(m)
+
+        result = self.laposta_client.get_subscriptions_for_email(
+            ["789", "456", "123"], EMAIL
+        )
+
+        self.assertEqual(result, ["123"])
+        for matcher in self.member_matchers.values():
+            self.assertEqual(matcher.call_count, 1)
+
+    def test_subscriptions_are_cached_per_list(self, m):
+        self.setUpMocks(m)
+
+        self.laposta_client.get_subscriptions_for_email(["123", "456"], EMAIL)
+        result = self.laposta_client.get_subscriptions_for_email(
+            ["123", "456", "789"], EMAIL
+        )
+
+        self.assertEqual(result, ["123"])
+        for matcher in self.member_matchers.values():
+            self.assertEqual(matcher.call_count, 1)
+
+    def test_subscribe_only_updates_the_affected_list(self, m):
+        self.setUpMocks(m)
+        m.post(
+            f"{LAPOSTA_API_ROOT}member",
+            json={
+                "member": MemberFactory.build(
+                    list_id="456", email=EMAIL, custom_fields=None
+                ).model_dump()
+            },
+        )
+
+        self.laposta_client.get_subscriptions_for_email(["123", "456", "789"], EMAIL)
+        self.laposta_client.create_subscription(
+            "456",
+            UserData(
+                ip="127.0.0.1",
+                email=EMAIL,
+                source_url=None,
+                custom_fields=None,
+                options=None,
+            ),
+        )
+        result = self.laposta_client.get_subscriptions_for_email(
+            ["123", "456", "789"], EMAIL
+        )
+
+        self.assertEqual(result, ["123", "456"])
+        for matcher in self.member_matchers.values():
+            self.assertEqual(matcher.call_count, 1)
+
+    def test_failed_lookups_are_not_cached(self, m):
+        self.setUpMocks(m)
+        failing = m.get(
+            f"{LAPOSTA_API_ROOT}member/{EMAIL}?list_id=123",
+            exc=ConnectTimeout,
+        )
+
+        self.assertEqual(
+            self.laposta_client.get_subscriptions_for_email(["123"], EMAIL), []
+        )
+        self.assertEqual(
+            self.laposta_client.get_subscriptions_for_email(["123"], EMAIL), []
+        )
+
+        self.assertEqual(failing.call_count, 2)
+
+    def test_unknown_subscriptions_are_returned_separately(self, m):
+        self.setUpMocks(m)
+        m.get(f"{LAPOSTA_API_ROOT}member/{EMAIL}?list_id=456", status_code=503)
+
+        with self.laposta_client:
+            result = self.laposta_client.check_subscriptions_for_email(
+                ["123", "456", "789"], EMAIL
+            )
+
+        self.assertEqual(result, (["123"], ["456"]))
+
+    def test_server_errors_are_not_cached_as_not_subscribed(self, m):
+        self.setUpMocks(m)
+        failing = m.get(
+            f"{LAPOSTA_API_ROOT}member/{EMAIL}?list_id=123", status_code=503
+        )
+
+        self.laposta_client.get_subscriptions_for_email(["123"], EMAIL)
+        self.laposta_client.get_subscriptions_for_email(["123"], EMAIL)
+
+        self.assertEqual(failing.call_count, 2)
+
+    @override_settings(LAPOSTA_SUBSCRIPTIONS_TIMEOUT=0.1)
+    def test_slow_lookups_do_not_exceed_the_deadline(self, m):
+        self.setUpMocks(m)
+
+        def slow_response(request, context):
+            time.sleep(0.5)
+            return {}
+
+        m.get(f"{LAPOSTA_API_ROOT}member/{EMAIL}?list_id=123", json=slow_response)
+
+        start = time.monotonic()
+        result = self.laposta_client.get_subscriptions_for_email(["123", "456"], EMAIL)
+
+        self.assertLess(time.monotonic() - start, 0.4)
+        self.assertEqual(result, [])
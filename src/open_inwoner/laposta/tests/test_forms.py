@@ -147,6 +147,78 @@ class NewsletterSubscriptionFormTestCase(ClearCachesMixin, TestCase):
             "Unsubscribe from list if not present in the form data",
         )
 
+    def test_unknown_subscriptions_are_left_alone(self, m):
+        """
+        A list of which the subscription couldn't be retrieved is shown unchecked,
+        that shouldn't unsubscribe the user when the form is saved
+        """
+        self.setUpMocks(m)
+        m.get(
+            f"{LAPOSTA_API_ROOT}member/{self.user.email}?list_id=123", status_code=400
+        )
+        m.get(
+            f"{LAPOSTA_API_ROOT}member/{self.user.email}?list_id=456", status_code=503
+        )
+        m.get(
+            f"{LAPOSTA_API_ROOT}member/{self.user.email}?list_id=789", status_code=400
+        )
+
+        form = NewsletterSubscriptionForm(data={}, request=self.request)
+
+        self.assertEqual(form["newsletters"].initial, [])
+        self.assertEqual(form.unknown_newsletters, ["456"])
+
+        # the subscription can be retrieved when the form is saved
+        m.get(
+            f"{LAPOSTA_API_ROOT}member/{self.user.email}?list_id=456",
+            json={
+                "member": MemberFactory.build(
+                    list_id="456",
+                    member_id="8765433",
+                    email=self.user.email,
+                    custom_fields=None,
+                ).model_dump()
+            },
+        )
+        delete_matcher = m.delete(
+            f"{LAPOSTA_API_ROOT}member/{self.user.email}?list_id=456"
+        )
+
+        form = NewsletterSubscriptionForm(
+            data={"unknown_newsletters": ["456"]}, request=self.request
+        )
+        self.assertTrue(form.is_valid())
+        form.save(self.request)
+
+        self.assertFalse(delete_matcher.called)
+        self.assertFalse(form.errors)
+
+    def test_subscriptions_unknown_when_saving_are_left_alone(self, m):
+        self.setUpMocks(m)
+        m.get(
+            f"{LAPOSTA_API_ROOT}member/{self.user.email}?list_id=123", status_code=503
+        )
+        m.get(
+            f"{LAPOSTA_API_ROOT}member/{self.user.email}?list_id=456", status_code=400
+        )
+        m.get(
+            f"{LAPOSTA_API_ROOT}member/{self.user.email}?list_id=789", status_code=400
+        )
+        post_matcher = m.post(f"{LAPOSTA_API_ROOT}member")
+        delete_matcher = m.delete(
+            f"{LAPOSTA_API_ROOT}member/{self.user.email}?list_id=123"
+        )
+
+        form = NewsletterSubscriptionForm(
+            data={"newsletters": ["123"]}, request=self.request
+        )
+        self.assertTrue(form.is_valid())
+        form.save(self.request)
+
+        self.assertFalse(post_matcher.called)
+        self.assertFalse(delete_matcher.called)
+        self.assertEqual(len(form.errors["newsletters"]), 1)
+
     def test_save_form_create_duplicate_subscription(self, m):
         """
         Verify that the client properly handles the scenario where the user is a member
@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class OpenZaakAppConfig(AppConfig):
+    name = "open_inwoner.openzaak"
+
+    def ready(self):
+        from .signals import invalidate_zaaktype_configs_cache  # noqa
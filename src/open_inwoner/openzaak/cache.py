@@ -0,0 +1,124 @@
+"""
+Caching of the data used to show the categories relevant to the user's cases.
+
+The zaaktype configurations are cached in-process and rebuilt when one of them
+is changed. The zaaktypen of the user's cases are summarized once per session
+and again after a notification about one of the user's cases.
+"""
+from datetime import date
+
+from open_inwoner.accounts.models import User
+from open_inwoner.utils.cache import (
+    LocalVersionedCache,
+    bump_cache_version,
+    bump_cache_version_on_commit,
+    get_cache_version,
+)
+from open_inwoner.utils.logentry import system_action as log_system_action
+
+from .api_models import Zaak
+from .clients import MultiZgwClientProxy, build_zaken_clients
+from .models import ZaakTypeConfig
+from .utils import get_user_fetch_parameters
+
+ZAAKTYPE_CONFIGS_VERSION_CACHE_KEY = "openzaak:zaaktype_configs:version"
+USER_ZAAKTYPEN_SESSION_KEY = "user_zaaktypen"
+
+_zaaktype_configs = LocalVersionedCache(ZAAKTYPE_CONFIGS_VERSION_CACHE_KEY)
+
+
+def invalidate_zaaktype_configs() -> None:
+    bump_cache_version_on_commit(ZAAKTYPE_CONFIGS_VERSION_CACHE_KEY)
+
+
+def get_zaaktype_identificaties() -> dict[str, str]:
+    """
+    Map the URLs of the (versions of the) zaaktypen to their identificatie.
+    """
+    return _zaaktype_configs.get(
+        "identificaties",
+        lambda: {
+            url: zaaktype.identificatie
+            for zaaktype in ZaakTypeConfig.objects.only("urls", "identificatie")
+            for url in zaaktype.urls
+        },
+    )
+
+
+def get_zaaktype_relevant_periods() -> dict[str, int | None]:
+    """
+    Map the identificaties of the zaaktypen to their relevant period in months.
+    """
+    return _zaaktype_configs.get(
+        "relevant_periods",
+        lambda: dict(
+            ZaakTypeConfig.objects.values_list("identificatie", "relevante_zaakperiode")
+        ),
+    )
+
+
+def summarize_zaaktypen(cases: list[Zaak]) -> dict[str, date]:
+    """
+    Map the identificaties of the zaaktypen of the cases to the start date of the
+    most recent case.
+    """
+    identificaties = get_zaaktype_identificaties()
+
+    last_started = {}
+    for case in cases:
+        # TODO This can occur if the import ZGW data is missing entries or if the
+        # user has Zaken for zaaktypen with indicatie intern
+        if case.zaaktype not in identificaties:
+            continue
+
+        identificatie = identificaties[case.zaaktype]
+        if (
+            identificatie not in last_started
+            or last_started[identificatie] < case.startdatum
+        ):
+            last_started[identificatie] = case.startdatum
+
+    return last_started
+
+
+def get_user_zaaktypen_version_key(user: User) -> str:
+    return f"openzaak:user_zaaktypen:{user.pk}:version"
+
+
+def invalidate_user_zaaktypen(users: list[User]) -> None:
+    for user in users:
+        bump_cache_version(get_user_zaaktypen_version_key(user))
+
+
+def get_user_zaaktypen(request) -> dict[str, date]:
+    """
+    Summarize the zaaktypen of the cases of the request's user, see
+    ``summarize_zaaktypen``.
+    """
+    fetch_params = get_user_fetch_parameters(request)
+    version = get_cache_version(get_user_zaaktypen_version_key(request.user))
+
+    summary = request.session.get(USER_ZAAKTYPEN_SESSION_KEY)
+    if summary and summary["version"] == version and summary["params"] == fetch_params:
+        return {
+            identificatie: date.fromisoformat(started)
+            for identificatie, started in summary["zaaktypen"].items()
+        }
+
+    proxy = MultiZgwClientProxy(build_zaken_clients())
+    result = proxy.fetch_cases(**fetch_params)
+    zaaktypen = summarize_zaaktypen(result.join_results())
+
+    if result.has_errors:
+        # try again on the next request
+        log_system_action("unable to retrieve cases", user=request.user)
+    else:
+        request.session[USER_ZAAKTYPEN_SESSION_KEY] = {
+            "version": version,
+            "params": fetch_params,
+            "zaaktypen": {
+                identificatie: started.isoformat()
+                for identificatie, started in zaaktypen.items()
+            },
+        }
+    return zaaktypen
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.16 on 2026-10-19 12:00
+
+from django.db import migrations, models
+
+import open_inwoner.utils.validators
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("openzaak", "0059_openzaakconfig_show_cases_without_status"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="zgwapigroupconfig",
+            name="case_identification_pattern",
+            field=models.CharField(
+                blank=True,
+                default="^(?=.*\\d)\\S+$",
+                help_text="Regular expression matching the identifications of the cases in this Zaken API. Search queries are only looked up as case identification when they match. Leave empty to disable looking up cases from the search.",
+                max_length=255,
+                validators=[open_inwoner.utils.validators.validate_regex],
+                verbose_name="Case identification pattern",
+            ),
+        ),
+    ]
@@ -1,4 +1,5 @@
 import logging
+import re
 import warnings
 from datetime import timedelta
 from typing import Protocol, cast
@@ -25,6 +26,7 @@ from open_inwoner.openzaak.managers import (
     ZaakTypeResultaatTypeConfigManger,
     ZaakTypeStatusTypeConfigQuerySet,
 )
+from open_inwoner.utils.validators import validate_regex
 
 from .constants import StatusIndicators
 
@@ -252,6 +254,25 @@ class ZGWApiGroupConfig(models.Model):
         if self.form_service:
             return cast(FormClient, self._build_client_from_attr("form_service"))
 
+    case_identification_pattern = models.CharField(
+        _("Case identification pattern"),
+        max_length=255,
+        blank=True,
+        default=r"^(?=.*\d)\S+$",
+        validators=[validate_regex],
+        help_text=_(
+            "Regular expression matching the identifications of the cases in this "
+            "Zaken API. Search queries are only looked up as case identification "
+            "when they match. Leave empty to disable looking up cases from the "
+            "search."
+        ),
+    )
+
+    def matches_case_identification(self, value: str) -> bool:
+        if not self.case_identification_pattern:
+            return False
+        return bool(re.search(self.case_identification_pattern, value))
+
     class Meta:
         verbose_name = _("ZGW API set")
         verbose_name_plural = _("ZGW API sets")
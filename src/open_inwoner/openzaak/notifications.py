@@ -17,6 +17,7 @@ from open_inwoner.openzaak.api_models import (
     ZaakInformatieObject,
     ZaakType,
 )
+from open_inwoner.openzaak.cache import invalidate_user_zaaktypen
 from open_inwoner.openzaak.clients import CatalogiClient, ZakenClient
 from open_inwoner.openzaak.documents import fetch_single_information_object_from_url
 from open_inwoner.openzaak.models import (
@@ -93,6 +94,9 @@ def handle_zaken_notification(notification: Notification):
         )
         return
 
+    # the case may be new or changed for the users
+    invalidate_user_zaaktypen(inform_users)
+
     # check if this case is visible
     if not (case := zaken_client.fetch_case_by_url_no_cache(case_url)):
         log_system_action(
@@ -0,0 +1,10 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_zaaktype_configs
+from .models import ZaakTypeConfig
+
+
+@receiver([post_save, post_delete], sender=ZaakTypeConfig)
+def invalidate_zaaktype_configs_cache(sender, **kwargs):
+    invalidate_zaaktype_configs()
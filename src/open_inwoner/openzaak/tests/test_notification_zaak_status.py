@@ -15,10 +15,12 @@ from open_inwoner.openzaak.notifications import (
     _handle_status_update,
     handle_zaken_notification,
 )
+from open_inwoner.utils.cache import get_cache_version
 from open_inwoner.utils.test import ClearCachesMixin
 from open_inwoner.utils.tests.helpers import AssertTimelineLogMixin, Lookups
 
 from ..api_models import Status, StatusType, Zaak, ZaakType
+from ..cache import get_user_zaaktypen_version_key
 from ..models import OpenZaakConfig, UserCaseStatusNotification
 from .factories import (
     NotificationFactory,
@@ -42,6 +44,15 @@ class StatusNotificationHandlerTestCase(
         MockAPIData.setUpServices()
         MockAPIDataAlt.setUpServices()
 
+    def test_notification_invalidates_zaaktypen_of_users(self, m, mock_handle: Mock):
+        data = MockAPIData().install_mocks(m)
+        version_key = get_user_zaaktypen_version_key(data.user_initiator)
+        version = get_cache_version(version_key)
+
+        handle_zaken_notification(data.status_notification)
+
+        self.assertNotEqual(get_cache_version(version_key), version)
+
     def test_handle_zaak_status_notifications(self, m, mock_handle: Mock):
         """
         Happy flow (with multiple ZGW backends) for notifications about zaak status updates
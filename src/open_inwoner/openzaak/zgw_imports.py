@@ -10,6 +10,7 @@ from zgw_consumers.api_models.catalogi import (
 )
 
 from open_inwoner.openzaak.api_models import ZaakType
+from open_inwoner.openzaak.cache import invalidate_zaaktype_configs
 from open_inwoner.openzaak.clients import (
     CatalogiClient,
     MultiZgwClientProxy,
@@ -141,6 +142,10 @@ def import_zaaktype_configs() -> list[ZaakTypeConfig]:
         if create:
             ZaakTypeConfig.objects.bulk_create(list(create.values()))
 
+    if create:
+        # bulk_create doesn't send the post_save signals
+        invalidate_zaaktype_configs()
+
     return list((create or {}).values())
 
 
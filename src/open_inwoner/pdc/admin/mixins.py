@@ -1,5 +1,9 @@
 from django import forms
+from django.contrib import admin
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
 
+from ..tasks import geocode_locations
 from ..widgets import MapWidget
 
 
@@ -17,6 +21,7 @@ class GeoAdminForm(forms.ModelForm):
 
 class GeoAdminMixin:
     form = GeoAdminForm
+    actions = ["update_geometry"]
 
     def get_readonly_fields(self, request, obj=None):
         readonly_fields = super().get_readonly_fields(request, obj)
@@ -25,3 +30,16 @@ class GeoAdminMixin:
             return readonly_fields + ("geometry",)
 
         return readonly_fields
+
+    @admin.action(description=_("Update the geo coordinates from the address"))
+    def update_geometry(self, request, queryset):
+        label = queryset.model._meta.label
+        pks = list(queryset.values_list("pk", flat=True))
+        transaction.on_commit(lambda: geocode_locations.delay(label, pks))
+        self.message_user(
+            request,
+            _(
+                "The geo coordinates of %(count)d locations are updated in the background"
+            )
+            % {"count": len(pks)},
+        )
@@ -0,0 +1,13 @@
+from django.apps import AppConfig
+
+
+class PdcConfig(AppConfig):
+    name = "open_inwoner.pdc"
+
+    def ready(self):
+        from .signals import (  # noqa
+            invalidate_pdc_category_tree,
+            invalidate_pdc_locations,
+            invalidate_pdc_pages,
+            invalidate_pdc_product_finder,
+        )
@@ -0,0 +1,200 @@
+"""
+Versioned caching of PDC data.
+
+The category tree (with the products and questions of the categories) is
+cached under a version that is bumped whenever a category is saved, moved or
+deleted, or when the products or questions of a category change.
+
+The PDC pages shown to anonymous visitors are cached under a version that is
+bumped when the PDC data or the CMS pages change, and the version of the site
+configuration.
+
+The categories of the menu (per visibility of the categories) are kept
+in-process under the version of the category tree.
+
+The index of the product finder is kept in-process, under a version that is
+bumped when the products or their conditions change.
+
+The time the relations of the products (categories, tags, organizations,
+locations, etc.) last changed is kept, the validators of the product API
+responses that contain relations depend on it.
+
+The GeoJSON and centroids of (querysets of) locations are cached by the SQL of
+the queryset, under a version that is bumped when the locations change.
+"""
+from datetime import datetime
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.db import transaction
+from django.utils import timezone
+from django.utils.translation import get_language
+
+from open_inwoner.configurations.cache import get_site_configuration_version
+from open_inwoner.utils.cache import (
+    LocalVersionedCache,
+    bump_cache_version_on_commit,
+    get_cache_version,
+)
+from open_inwoner.utils.hash import create_sha256_hash
+
+CATEGORY_TREE_VERSION_CACHE_KEY = "pdc:category_tree:version"
+PAGES_VERSION_CACHE_KEY = "pdc:pages:version"
+PRODUCT_FINDER_VERSION_CACHE_KEY = "pdc:product_finder:version"
+LOCATIONS_VERSION_CACHE_KEY = "pdc:locations:version"
+PRODUCT_RELATIONS_MODIFIED_CACHE_KEY = "pdc:product_relations:modified"
+
+# the cookies that change the rendered pages
+PAGE_CACHE_COOKIES = ("cookieBannerAccepted",)
+
+
+def get_category_tree_version() -> str:
+    return get_cache_version(CATEGORY_TREE_VERSION_CACHE_KEY)
+
+
+def invalidate_category_tree() -> None:
+    bump_cache_version_on_commit(CATEGORY_TREE_VERSION_CACHE_KEY)
+
+
+def get_category_tree_etag(*parts: str) -> str:
+    """
+    Identify a representation of (part of) the category tree at the current
+    version, the parts distinguish the representations.
+    """
+    return create_sha256_hash(
+        ":".join([get_category_tree_version(), *parts]), salt=settings.SECRET_KEY
+    )
+
+
+def get_cached_category_tree(etag: str, build):
+    key = f"pdc:category_tree:{etag}"
+    data = cache.get(key)
+    if data is None:
+        data = build()
+        cache.set(key, data, timeout=settings.CACHE_PDC_API_TIMEOUT)
+    return data
+
+
+_category_tree = LocalVersionedCache(CATEGORY_TREE_VERSION_CACHE_KEY)
+
+
+def get_category_tree_lookup(name: str, build):
+    return _category_tree.get(name, build)
+
+
+#
+# anonymous pages
+#
+
+
+def invalidate_pages() -> None:
+    bump_cache_version_on_commit(PAGES_VERSION_CACHE_KEY)
+
+
+def is_page_cacheable(request) -> bool:
+    """
+    Only the pages of anonymous visitors without a session (or messages) are
+    the same for all visitors. The pages don't use query parameters, pages
+    requested with arbitrary ones are not cached to not fill the cache.
+    """
+    return (
+        request.method in ("GET", "HEAD")
+        and not request.GET
+        and not request.user.is_authenticated
+        and settings.SESSION_COOKIE_NAME not in request.COOKIES
+        and "messages" not in request.COOKIES
+        and not request.headers.get("HX-Request")
+    )
+
+
+def get_page_cache_key(request) -> str:
+    parts = [
+        get_cache_version(PAGES_VERSION_CACHE_KEY),
+        get_site_configuration_version(),
+        get_language(),
+        request.build_absolute_uri(request.path),
+        *(request.COOKIES.get(name, "") for name in PAGE_CACHE_COOKIES),
+    ]
+    page_hash = create_sha256_hash("\n".join(parts), salt=settings.SECRET_KEY)
+    return f"pdc:page:{page_hash}"
+
+
+def get_cached_page(request) -> dict | None:
+    return cache.get(get_page_cache_key(request))
+
+
+def set_cached_page(request, page: dict) -> None:
+    cache.set(
+        get_page_cache_key(request), page, timeout=settings.CACHE_PDC_PAGES_TIMEOUT
+    )
+
+
+#
+# product finder
+#
+
+_product_finder = LocalVersionedCache(PRODUCT_FINDER_VERSION_CACHE_KEY)
+
+
+def invalidate_product_finder() -> None:
+    bump_cache_version_on_commit(PRODUCT_FINDER_VERSION_CACHE_KEY)
+
+
+def get_product_finder_lookup(name: str, build):
+    return _product_finder.get(name, build)
+
+
+#
+# product relations
+#
+
+
+def get_product_relations_modified() -> datetime:
+    """
+    The time the relations of the products last changed, or the time it was
+    lost from the cache.
+    """
+    modified = cache.get(PRODUCT_RELATIONS_MODIFIED_CACHE_KEY)
+    if modified is None:
+        cache.add(PRODUCT_RELATIONS_MODIFIED_CACHE_KEY, timezone.now(), timeout=None)
+        modified = cache.get(PRODUCT_RELATIONS_MODIFIED_CACHE_KEY)
+    return modified
+
+
+def _set_product_relations_modified() -> None:
+    cache.set(PRODUCT_RELATIONS_MODIFIED_CACHE_KEY, timezone.now(), timeout=None)
+
+
+def invalidate_product_relations() -> None:
+    # like the versions, set now and again when the transaction is committed
+    _set_product_relations_modified()
+    transaction.on_commit(_set_product_relations_modified)
+
+
+#
+# locations
+#
+
+
+def invalidate_locations() -> None:
+    bump_cache_version_on_commit(LOCATIONS_VERSION_CACHE_KEY)
+
+
+def get_cached_locations(queryset, name: str, build):
+    try:
+        sql, params = queryset.query.sql_with_params()
+    except EmptyResultSet:
+        return build()
+
+    signature = create_sha256_hash(
+        f"{get_cache_version(LOCATIONS_VERSION_CACHE_KEY)}:{name}:{sql}:{params}",
+        salt=settings.SECRET_KEY,
+    )
+    key = f"pdc:locations:{signature}"
+    cached = cache.get(key)
+    if cached is None:
+        # wrapped, the data itself can be None
+        cached = {"data": build()}
+        cache.set(key, cached, timeout=settings.CACHE_PDC_LOCATIONS_TIMEOUT)
+    return cached["data"]
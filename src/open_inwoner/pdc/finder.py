@@ -0,0 +1,88 @@
+"""
+Product finder.
+
+The products matching the answers of the finder are selected with an index of
+the published products per condition. The products of a condition are a bitset
+(an int with the bits of the positions of the products set), so every step of
+the finder is a few bitwise operations.
+"""
+from dataclasses import dataclass
+
+from .cache import get_product_finder_lookup
+from .choices import YesNo
+from .models import Product
+
+
+@dataclass(frozen=True)
+class ProductFinderIndex:
+    # the ids of the published products, by position
+    product_ids: tuple[int, ...]
+    # the products of every condition, by condition id
+    conditions: dict[int, int]
+
+    @classmethod
+    def build(cls) -> "ProductFinderIndex":
+        product_ids = tuple(
+            Product.objects.published().order_by("pk").values_list("pk", flat=True)
+        )
+        positions = {pk: position for position, pk in enumerate(product_ids)}
+
+        conditions = {}
+        for product_id, condition_id in Product.conditions.through.objects.filter(
+            product__published=True
+        ).values_list("product_id", "productcondition_id"):
+            # skip products that were published after the first query
+            if product_id in positions:
+                bit = 1 << positions[product_id]
+                conditions[condition_id] = conditions.get(condition_id, 0) | bit
+
+        return cls(product_ids=product_ids, conditions=conditions)
+
+    @property
+    def all_products(self) -> int:
+        return (1 << len(self.product_ids)) - 1
+
+    def get_product_ids(self, products: int) -> list[int]:
+        product_ids = []
+        while products:
+            lowest = products & -products
+            product_ids.append(self.product_ids[lowest.bit_length() - 1])
+            products ^= lowest
+        return product_ids
+
+    def find(self, answers: list[dict]) -> tuple[list[int], list[int]]:
+        """
+        Return the ids of the matched products (with a condition that was
+        answered and no condition that was answered with "no") and of the
+        possible products (without a condition answered with "no").
+        """
+        answered = 0
+        rejected = 0
+        for answer in answers:
+            products = self.conditions.get(answer.get("condition"), 0)
+            answered |= products
+            if answer.get("answer") == YesNo.no:
+                rejected |= products
+
+        matched = answered & ~rejected
+        possible = self.all_products & ~matched & ~rejected
+        return self.get_product_ids(matched), self.get_product_ids(possible)
+
+
+def get_product_finder_index() -> ProductFinderIndex:
+    return get_product_finder_lookup("index", ProductFinderIndex.build)
+
+
+def find_products(answers: list[dict]) -> tuple[list[Product], list[Product]]:
+    """
+    Return the matched and possible products for the answers of the finder.
+    """
+    matched_ids, possible_ids = get_product_finder_index().find(answers)
+    if not matched_ids and not possible_ids:
+        return [], []
+
+    products = Product.objects.in_bulk(matched_ids + possible_ids)
+    return (
+        [products[pk] for pk in matched_ids if pk in products],
+        [products[pk] for pk in possible_ids if pk in products],
+    )
@@ -0,0 +1,40 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import translation
+
+from open_inwoner.utils.ckeditor import (
+    get_product_rendered_content,
+    get_rendered_content,
+)
+
+from ...models import Category, Product, Question
+from ...utils import extract_subheadings
+
+
+class Command(BaseCommand):
+    help = (
+        "Render the content of the products, categories and questions into the "
+        "cache, so the pages don't have to render it"
+    )
+
+    def handle(self, *args, **options):
+        with translation.override(settings.LANGUAGE_CODE):
+            products = Product.objects.published()
+            for product in products.iterator():
+                get_product_rendered_content(product)
+                extract_subheadings(product.content, tag="h2")
+
+            categories = Category.objects.published().exclude(description="")
+            for description in categories.values_list("description", flat=True):
+                get_rendered_content(description)
+
+            answers = Question.objects.values_list("answer", flat=True)
+            for answer in answers.iterator():
+                get_rendered_content(answer)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rendered the content of {products.count()} products, "
+                f"{categories.count()} categories and {answers.count()} questions"
+            )
+        )
@@ -1,5 +1,7 @@
 from datetime import date
+from typing import Iterable
 
+from django.contrib.gis.geos import Point
 from django.db import models
 
 from dateutil.relativedelta import relativedelta
@@ -9,9 +11,12 @@ from treebeard.mp_tree import MP_NodeQuerySet
 from open_inwoner.accounts.models import User
 from open_inwoner.configurations.models import SiteConfiguration
 from open_inwoner.openzaak.api_models import Zaak
-from open_inwoner.openzaak.clients import MultiZgwClientProxy, build_zaken_clients
-from open_inwoner.openzaak.models import ZaakTypeConfig
-from open_inwoner.openzaak.utils import get_user_fetch_parameters
+from open_inwoner.openzaak.cache import (
+    get_user_zaaktypen,
+    get_zaaktype_relevant_periods,
+    summarize_zaaktypen,
+)
+from open_inwoner.utils.geocode import geocode_addresses, normalize_address
 
 
 class ProductQueryset(models.QuerySet):
@@ -25,6 +30,27 @@ class ProductQueryset(models.QuerySet):
         return self.order_by("categoryproduct__order")
 
 
+# the categories visible for the users of a visibility
+CATEGORY_VISIBILITY_FILTERS = {
+    "anonymous": {"visible_for_anonymous": True},
+    "citizen": {"visible_for_citizens": True},
+    "company": {"visible_for_companies": True},
+    # Show all categories to staff users
+    "staff": {},
+}
+
+
+def get_category_visibility(user: User) -> str:
+    if not user.is_authenticated:
+        return "anonymous"
+    if user.is_staff:
+        return "staff"
+    if user.kvk:
+        return "company"
+    # User is DigiD or non-staff username/password
+    return "citizen"
+
+
 class CategoryPublishedQueryset(MP_NodeQuerySet):
     def published(self):
         return self.filter(published=True)
@@ -32,20 +58,16 @@ class CategoryPublishedQueryset(MP_NodeQuerySet):
     def draft(self):
         return self.filter(published=False)
 
+    def visible_for(self, visibility: str):
+        return self.filter(**CATEGORY_VISIBILITY_FILTERS[visibility])
+
     def visible_for_user(self, user: User):
-        if user.is_authenticated:
-            # Show all categories to staff users
-            if user.is_staff:
-                return self
-            elif user.kvk:
-                return self.filter(visible_for_companies=True)
-            # User is DigiD or non-staff username/password
-            return self.filter(visible_for_citizens=True)
-
-        config = SiteConfiguration.get_solo()
-        if config.hide_categories_from_anonymous_users:
-            return self.none()
-        return self.filter(visible_for_anonymous=True)
+        visibility = get_category_visibility(user)
+        if visibility == "anonymous":
+            config = SiteConfiguration.get_solo()
+            if config.hide_categories_from_anonymous_users:
+                return self.none()
+        return self.visible_for(visibility)
 
     def filter_by_zaken_for_request(self, request):
         """
@@ -54,49 +76,27 @@ class CategoryPublishedQueryset(MP_NodeQuerySet):
         if not request.user.bsn and not request.user.kvk:
             return self
 
-        clients = build_zaken_clients()
-        proxy_result = MultiZgwClientProxy(clients)
-        proxy_result = proxy_result.fetch_cases(**get_user_fetch_parameters(request))
-        if proxy_result.has_errors:
-            self.log_system_action("unable to retrieve cases", user=request.user)
-
-        cases = proxy_result.join_results()
-
-        return self.filter_by_zaken(cases)
+        return self.filter_by_zaaktypen(get_user_zaaktypen(request))
 
     def filter_by_zaken(self, cases: list[Zaak]):
         """
         Returns the categories linked to ZaakTypen matching with the specified Zaken.
         """
-        zaaktypen = ZaakTypeConfig.objects.all()
-        url_to_identificatie_mapping = {
-            url: zaaktype.identificatie
-            for zaaktype in zaaktypen
-            for url in zaaktype.urls
-        }
-        zaakperiode_mapping = {
-            zaaktype.identificatie: zaaktype.relevante_zaakperiode
-            for zaaktype in zaaktypen
-        }
+        return self.filter_by_zaaktypen(summarize_zaaktypen(cases))
+
+    def filter_by_zaaktypen(self, last_started: dict[str, date]):
+        """
+        Returns the categories linked to the ZaakTypen (mapped to the start date of
+        the most recent Zaak), within the relevant period of the ZaakType.
+        """
+        zaakperiode_mapping = get_zaaktype_relevant_periods()
 
         months_since_last_zaak_per_zaaktype = {}
-        for case in cases:
-            # TODO This can occur if the import ZGW data is missing entries or if the
-            # user has Zaken for zaaktypen with indicatie intern
-            if case.zaaktype not in url_to_identificatie_mapping:
-                continue
-
-            zaaktype_identificatie = url_to_identificatie_mapping[case.zaaktype]
-
-            duration_since_start = relativedelta(date.today(), case.startdatum)
-            if (
-                zaaktype_identificatie not in months_since_last_zaak_per_zaaktype
-                or months_since_last_zaak_per_zaaktype[zaaktype_identificatie]
-                > duration_since_start.months
-            ):
-                months_since_last_zaak_per_zaaktype[
-                    zaaktype_identificatie
-                ] = duration_since_start.months
+        for zaaktype_identificatie, startdatum in last_started.items():
+            duration_since_start = relativedelta(date.today(), startdatum)
+            months_since_last_zaak_per_zaaktype[zaaktype_identificatie] = (
+                duration_since_start.years * 12 + duration_since_start.months
+            )
 
         zaaktype_ids = list(months_since_last_zaak_per_zaaktype.keys())
 
@@ -125,3 +125,54 @@ class CategoryPublishedQueryset(MP_NodeQuerySet):
 class QuestionQueryset(OrderedModelQuerySet):
     def general(self):
         return self.filter(category__isnull=True, product__isnull=True)
+
+
+class GeocodedAddressQuerySet(models.QuerySet):
+    def get_geometries(self, addresses: Iterable[str]) -> dict[str, Point]:
+        """
+        Return the stored geo coordinates of the addresses that were geocoded.
+        """
+        normalized = {address: normalize_address(address) for address in addresses}
+        geometries = dict(
+            self.filter(address__in=set(normalized.values())).values_list(
+                "address", "geometry"
+            )
+        )
+        return {
+            address: geometries[key]
+            for address, key in normalized.items()
+            if key in geometries
+        }
+
+    def store(self, geometries: dict[str, Point | None]) -> None:
+        # the addresses that weren't found are geocoded again next time
+        objs = {
+            normalize_address(address): self.model(
+                address=normalize_address(address), geometry=geometry
+            )
+            for address, geometry in geometries.items()
+            if geometry and normalize_address(address)
+        }
+        self.bulk_create(
+            objs.values(),
+            update_conflicts=True,
+            unique_fields=["address"],
+            update_fields=["geometry"],
+        )
+
+    def geocode(
+        self, addresses: Iterable[str], max_workers: int | None = None
+    ) -> dict[str, Point | None]:
+        """
+        Geocode the addresses, only the addresses that weren't geocoded before
+        are sent to the geocoder (concurrently). The addresses that failed to
+        geocode are left out.
+        """
+        addresses = list(addresses)
+        geometries = self.get_geometries(addresses)
+        geocoded = geocode_addresses(
+            [address for address in addresses if address not in geometries],
+            max_workers=max_workers,
+        )
+        self.store(geocoded)
+        return {**geocoded, **geometries}
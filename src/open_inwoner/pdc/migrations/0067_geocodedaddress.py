@@ -0,0 +1,57 @@
+# Generated by Django 4.2.16 on 2026-10-19 14:00
+
+import django.contrib.gis.db.models.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("pdc", "0066_category_access_groups"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GeocodedAddress",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "address",
+                    models.CharField(
+                        help_text="The normalized address",
+                        max_length=1000,
+                        unique=True,
+                        verbose_name="Address",
+                    ),
+                ),
+                (
+                    "geometry",
+                    django.contrib.gis.db.models.fields.PointField(
+                        help_text="Geo coordinates of the address",
+                        srid=4326,
+                        verbose_name="Geometry",
+                    ),
+                ),
+                (
+                    "created_on",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        help_text="This is the date the address was geocoded.",
+                        verbose_name="Created on",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Geocoded address",
+                "verbose_name_plural": "Geocoded addresses",
+            },
+        ),
+    ]
@@ -1,5 +1,6 @@
 from .category import Category
 from .faq import Question
+from .geocode import GeocodedAddress
 from .neighbourhood import Neighbourhood
 from .organization import Organization, OrganizationType
 from .product import (
@@ -16,6 +17,7 @@ from .tag import Tag, TagType
 __all__ = [
     "Category",
     "Question",
+    "GeocodedAddress",
     "Neighbourhood",
     "Organization",
     "OrganizationType",
@@ -7,6 +7,7 @@ from filer.fields.image import FilerImageField
 from treebeard.exceptions import InvalidMoveToDescendant
 from treebeard.mp_tree import MP_MoveHandler, MP_Node
 
+from ..cache import invalidate_category_tree, invalidate_pages
 from ..managers import CategoryPublishedQueryset
 
 
@@ -16,7 +17,11 @@ class PublishedMoveHandler(MP_MoveHandler):
             raise InvalidMoveToDescendant(
                 _("Published nodes cannot be moved to unpublished ones.")
             )
-        return super().process()
+        result = super().process()
+        # the paths are updated without saving the nodes
+        invalidate_category_tree()
+        invalidate_pages()
+        return result
 
 
 class Category(MP_Node):
@@ -0,0 +1,32 @@
+from django.contrib.gis.db.models import PointField
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from ..managers import GeocodedAddressQuerySet
+
+
+class GeocodedAddress(models.Model):
+    address = models.CharField(
+        verbose_name=_("Address"),
+        max_length=1000,
+        unique=True,
+        help_text=_("The normalized address"),
+    )
+    geometry = PointField(
+        verbose_name=_("Geometry"),
+        help_text=_("Geo coordinates of the address"),
+    )
+    created_on = models.DateTimeField(
+        verbose_name=_("Created on"),
+        auto_now_add=True,
+        help_text=_("This is the date the address was geocoded."),
+    )
+
+    objects = GeocodedAddressQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _("Geocoded address")
+        verbose_name_plural = _("Geocoded addresses")
+
+    def __str__(self):
+        return self.address
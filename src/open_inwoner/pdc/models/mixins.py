@@ -1,9 +1,13 @@
 import json
 import re
 
-from django.contrib.gis.db.models import PointField
+from django.contrib.gis.db.models import Collect, PointField
+from django.contrib.gis.db.models.functions import AsGeoJSON, AsWKT, Centroid
+from django.contrib.postgres.aggregates.mixins import OrderableAggMixin
 from django.core.exceptions import ValidationError
-from django.db import connection, models
+from django.db import models
+from django.db.models import Aggregate, F, Func, JSONField, TextField, Value
+from django.db.models.functions import Cast, Concat, Replace
 from django.utils.translation import gettext_lazy as _
 
 from geopy.exc import GeopyError
@@ -11,8 +15,62 @@ from localflavor.nl.models import NLZipCodeField
 
 from open_inwoner.utils.geocode import geocode_address
 
+from ..cache import get_cached_locations
+from .geocode import GeocodedAddress
+
+
+class JSONBuildObject(Func):
+    """
+    ``json_build_object``, which (unlike ``JSONObject``) keeps the order of the
+    keys.
+    """
+
+    function = "JSON_BUILD_OBJECT"
+    output_field = JSONField()
+
+    def __init__(self, **fields):
+        expressions = []
+        for key, value in fields.items():
+            expressions.extend([Cast(Value(key), TextField()), value])
+        super().__init__(*expressions)
+
+
+class JSONAgg(OrderableAggMixin, Aggregate):
+    """
+    ``json_agg`` as text, it's parsed by the caller.
+    """
+
+    function = "JSON_AGG"
+    template = "%(function)s(%(expressions)s %(ordering)s)::text"
+    output_field = TextField()
+
 
 class GeoModelQuerySet(models.QuerySet):
+    """
+    The GeoJSON and centroid of the objects are aggregated by PostGIS, and
+    cached by the signature of the queryset until the objects change.
+    """
+
+    def _unsliced(self) -> models.QuerySet:
+        if self.query.is_sliced:
+            return self.model.objects.filter(pk__in=self.values("pk"))
+        return self
+
+    def get_geojson_features(self) -> list[dict]:
+        return get_cached_locations(self, "features", self._get_geojson_features)
+
+    def _get_geojson_features(self) -> list[dict]:
+        feature = JSONBuildObject(
+            type=Cast(Value("Feature"), TextField()),
+            geometry=Cast(AsGeoJSON("geometry", precision=15), JSONField()),
+            properties=JSONBuildObject(**self.model.get_geojson_properties()),
+        )
+        ordering = self.query.order_by or self.model._meta.ordering or ["pk"]
+        features = self._unsliced().aggregate(
+            features=JSONAgg(feature, ordering=ordering)
+        )["features"]
+        return json.loads(features) if features else []
+
     def get_geojson_feature_collection(self) -> str:
         """
         Returns a geojson feature collection for all objects in this queryset.
@@ -20,33 +78,25 @@ class GeoModelQuerySet(models.QuerySet):
         return json.dumps(
             {
                 "type": "FeatureCollection",
-                "features": [o.get_geojson_feature(False) for o in self],
+                "features": self.get_geojson_features(),
             }
         )
 
     def get_centroid(self) -> dict | None:
         """
-        I apologize.
-
-        This uses postgis to figure out the centroid of the objects in this queryset.
+        The centroid of the objects in this queryset.
         """
-        ids = self.values_list("id", flat=True)
+        return get_cached_locations(self, "centroid", self._get_centroid)
 
-        if not ids:
+    def _get_centroid(self) -> dict | None:
+        point = self._unsliced().aggregate(point=AsWKT(Centroid(Collect("geometry"))))[
+            "point"
+        ]
+        if not point:
             return
 
-        with connection.cursor() as cursor:
-            cursor.execute(
-                "SELECT ST_AsText(ST_Centroid(ST_Collect(geometry))) "
-                "FROM pdc_productlocation "
-                "WHERE id in %s",
-                [tuple(ids)],
-            )
-            row = cursor.fetchone()
-
+        m = re.findall(r"-?[0-9\.]+", point)
         try:
-            point = row[0]
-            m = re.findall(r"[0-9\.]+", point)
             return {
                 "lng": m[0],
                 "lat": m[1],
@@ -102,6 +152,14 @@ class GeoModel(models.Model):
         if self.id and self.address_str == model.objects.get(id=self.id).address_str:
             return
 
+        # the address could have been geocoded before, e.g. by an import
+        geometry = GeocodedAddress.objects.get_geometries([self.address_str]).get(
+            self.address_str
+        )
+        if geometry:
+            self.geometry = geometry
+            return
+
         # locate geo coordinates using address string
         try:
             geometry = geocode_address(self.address_str)
@@ -111,6 +169,7 @@ class GeoModel(models.Model):
             )
         except IndexError:
             raise ValidationError(_("No location data was provided"))
+        GeocodedAddress.objects.store({self.address_str: geometry})
 
         if not geometry:
             raise ValidationError(
@@ -136,6 +195,25 @@ class GeoModel(models.Model):
             return json.dumps(feature)
         return feature
 
+    @classmethod
+    def get_geojson_properties(cls) -> dict:
+        """
+        Returns the expressions of the properties of the geojson features, the
+        database side version of `get_serialized_fields`.
+        """
+        field_names = {field.name for field in cls._meta.get_fields()}
+        properties = {}
+        if "name" in field_names:
+            properties["name"] = F("name")
+        properties["address_line_1"] = Concat("street", Value(" "), "housenumber")
+        properties["address_line_2"] = Concat(
+            Replace("postcode", Value(" "), Value("")), Value(" "), "city"
+        )
+        for name in ("email", "phonenumber"):
+            if name in field_names:
+                properties[name] = F(name)
+        return properties
+
     def get_geojson_geometry(self) -> str:
         """
         Returns a geojson geometry for this object.
@@ -3,6 +3,8 @@ from uuid import uuid4
 
 from django.contrib.postgres.fields import ArrayField
 from django.db import models
+from django.db.models import TextField, Value
+from django.db.models.functions import Cast, Concat
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
@@ -385,6 +387,19 @@ class ProductLocation(GeoModel):
     def get_absolute_url(self) -> str:
         return reverse("products:location_detail", kwargs={"uuid": self.uuid})
 
+    @classmethod
+    def get_geojson_properties(cls) -> dict:
+        # the url with the uuid of the location filled in by the database
+        placeholder = "00000000-0000-0000-0000-000000000000"
+        url = reverse("products:location_detail", kwargs={"uuid": placeholder})
+        prefix, suffix = url.split(placeholder)
+        return {
+            **super().get_geojson_properties(),
+            "location_url": Concat(
+                Value(prefix), Cast("uuid", TextField()), Value(suffix)
+            ),
+        }
+
 
 class ProductCondition(OrderedModel):
     name = models.CharField(
@@ -0,0 +1,87 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from cms.models import Page
+from cms.signals import post_publish, post_unpublish
+
+from .cache import (
+    invalidate_category_tree,
+    invalidate_locations,
+    invalidate_pages,
+    invalidate_product_finder,
+    invalidate_product_relations,
+)
+from .models import (
+    Category,
+    CategoryProduct,
+    Neighbourhood,
+    Organization,
+    OrganizationType,
+    Product,
+    ProductCondition,
+    ProductContact,
+    ProductFile,
+    ProductLink,
+    ProductLocation,
+    Question,
+    Tag,
+    TagType,
+)
+
+
+@receiver([post_save, post_delete], sender=Category)
+@receiver([post_save, post_delete], sender=CategoryProduct)
+@receiver([post_save, post_delete], sender=Product)
+@receiver([post_save, post_delete], sender=Question)
+@receiver(m2m_changed, sender=Product.categories.through)
+def invalidate_pdc_category_tree(sender, **kwargs):
+    invalidate_category_tree()
+
+
+@receiver([post_save, post_delete], sender=Category)
+@receiver([post_save, post_delete], sender=CategoryProduct)
+@receiver([post_save, post_delete], sender=Product)
+@receiver([post_save, post_delete], sender=ProductContact)
+@receiver([post_save, post_delete], sender=ProductFile)
+@receiver([post_save, post_delete], sender=ProductLink)
+@receiver([post_save, post_delete], sender=ProductLocation)
+@receiver([post_save, post_delete], sender=Question)
+@receiver(m2m_changed, sender=Product.categories.through)
+@receiver([post_publish, post_unpublish], sender=Page)
+def invalidate_pdc_pages(sender, **kwargs):
+    invalidate_pages()
+
+
+@receiver([post_save, post_delete], sender=Product)
+@receiver([post_save, post_delete], sender=ProductCondition)
+@receiver(m2m_changed, sender=Product.conditions.through)
+def invalidate_pdc_product_finder(sender, **kwargs):
+    invalidate_product_finder()
+
+
+@receiver([post_save, post_delete], sender=Category)
+@receiver([post_save, post_delete], sender=Neighbourhood)
+@receiver([post_save, post_delete], sender=Organization)
+@receiver([post_save, post_delete], sender=OrganizationType)
+@receiver([post_save, post_delete], sender=Product)
+@receiver([post_save, post_delete], sender=ProductCondition)
+@receiver([post_save, post_delete], sender=ProductFile)
+@receiver([post_save, post_delete], sender=ProductLink)
+@receiver([post_save, post_delete], sender=ProductLocation)
+@receiver([post_save, post_delete], sender=Tag)
+@receiver([post_save, post_delete], sender=TagType)
+@receiver(m2m_changed, sender=Product.categories.through)
+@receiver(m2m_changed, sender=Product.conditions.through)
+@receiver(m2m_changed, sender=Product.locations.through)
+@receiver(m2m_changed, sender=Product.organizations.through)
+@receiver(m2m_changed, sender=Product.related_products.through)
+@receiver(m2m_changed, sender=Product.tags.through)
+def invalidate_pdc_product_relations(sender, **kwargs):
+    invalidate_product_relations()
+
+
+@receiver([post_save, post_delete], sender=Organization)
+@receiver([post_save, post_delete], sender=ProductLocation)
+@receiver(m2m_changed, sender=Product.locations.through)
+def invalidate_pdc_locations(sender, **kwargs):
+    invalidate_locations()
@@ -0,0 +1,37 @@
+import logging
+
+from django.apps import apps
+
+from open_inwoner.celery import app
+
+from .cache import invalidate_locations
+from .models import GeocodedAddress
+
+logger = logging.getLogger(__name__)
+
+
+@app.task
+def geocode_locations(model_label: str, pks: list[int]) -> int:
+    """
+    Update the geo coordinates of the locations from their addresses, e.g.
+    after an import.
+    """
+    model = apps.get_model(model_label)
+    locations = list(model.objects.filter(pk__in=pks))
+    geometries = GeocodedAddress.objects.geocode(
+        location.address_str for location in locations
+    )
+
+    changed = []
+    for location in locations:
+        geometry = geometries.get(location.address_str)
+        if geometry and geometry.coords != location.geometry.coords:
+            location.geometry = geometry
+            changed.append(location)
+
+    if changed:
+        model.objects.bulk_update(changed, ["geometry"])
+        invalidate_locations()
+
+    logger.info("updated the geo coordinates of %s locations", len(changed))
+    return len(changed)
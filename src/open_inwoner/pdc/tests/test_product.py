@@ -1,7 +1,9 @@
 from html import escape
 from unittest.mock import patch
 
-from django.test import override_settings, tag
+from django.db import connection
+from django.test import RequestFactory, override_settings, tag
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from django_webtest import WebTest
@@ -13,12 +15,16 @@ from open_inwoner.utils.test import ClearCachesMixin
 from open_inwoner.utils.tests.playwright import PlaywrightSyncLiveServerTestCase
 
 from ...media.tests.factories import VideoFactory
-from ..models import CategoryProduct
+from ..models import CategoryProduct, ProductLink
+from ..views import ProductDetailView
 from .factories import (
     CategoryFactory,
     ProductConditionFactory,
+    ProductContactFactory,
     ProductFactory,
+    ProductLocationFactory,
     QuestionFactory,
+    TagFactory,
 )
 
 
@@ -431,6 +437,101 @@ class TestProductDetailView(WebTest):
         self.assertEqual(response.url, "http://www.example.com")
 
 
+@override_settings(ROOT_URLCONF="open_inwoner.cms.tests.urls")
+class TestProductDetailViewQueries(ClearCachesMixin, WebTest):
+    def add_relations(self, product, count):
+        for i in range(count):
+            QuestionFactory(product=product)
+            ProductLink.objects.create(
+                product=product, name=f"Link {i}", url=f"https://example.com/{i}"
+            )
+            product.tags.add(TagFactory())
+            product.conditions.add(ProductConditionFactory())
+            product.locations.add(ProductLocationFactory())
+            product.contacts.add(ProductContactFactory())
+            product.related_products.add(ProductFactory())
+
+    def get_queries(self, product):
+        with CaptureQueriesContext(connection) as context:
+            response = self.app.get(
+                reverse("products:product_detail", kwargs={"slug": product.slug})
+            )
+
+        self.assertEqual(response.status_code, 200)
+        return [query["sql"] for query in context.captured_queries]
+
+    def test_product_is_loaded_once(self):
+        product = ProductFactory()
+        self.add_relations(product, 1)
+
+        queries = self.get_queries(product)
+
+        product_queries = [q for q in queries if 'WHERE "pdc_product"."slug" = ' in q]
+        self.assertEqual(len(product_queries), 1)
+
+    def test_queries_do_not_depend_on_related_objects(self):
+        # warm up the caches of the page
+        self.get_queries(ProductFactory())
+
+        product1 = ProductFactory()
+        self.add_relations(product1, 1)
+        product2 = ProductFactory()
+        self.add_relations(product2, 3)
+
+        self.assertEqual(
+            len(self.get_queries(product1)), len(self.get_queries(product2))
+        )
+
+    def test_product_is_loaded_with_a_query_per_relation(self):
+        product = ProductFactory()
+        self.add_relations(product, 3)
+
+        view = ProductDetailView()
+        view.setup(RequestFactory().get("/"), slug=product.slug)
+
+        # the product (with the annotations of the sections) and its tags,
+        # questions, files, conditions, locations, contacts (and their
+        # organizations), links and related products
+        with self.assertNumQueries(10):
+            view.get_object()
+            view.crumbs
+
+        with self.assertNumQueries(0):
+            self.assertEqual(len(view.product.tags.all()), 3)
+            self.assertEqual(len(view.product.published_related_products), 3)
+            for contact in view.product.contacts.all():
+                contact.organization
+
+    def test_sections_are_shown_for_related_objects(self):
+        product = ProductFactory()
+        self.add_relations(product, 1)
+        unpublished = ProductFactory(name="Niet gepubliceerd", published=False)
+        product.related_products.add(unpublished)
+
+        response = self.app.get(
+            reverse("products:product_detail", kwargs={"slug": product.slug})
+        )
+
+        self.assertEqual(len(response.pyquery(".faq__list-item")), 1)
+        self.assertEqual(len(response.pyquery("#links")), 1)
+        self.assertEqual(len(response.pyquery("#see")), 1)
+        self.assertEqual(len(response.pyquery(".contact-block")), 1)
+        self.assertNotIn("Niet gepubliceerd", response.text)
+
+    def test_sections_are_hidden_without_related_objects(self):
+        product = ProductFactory()
+
+        response = self.app.get(
+            reverse("products:product_detail", kwargs={"slug": product.slug})
+        )
+
+        self.assertEqual(len(response.pyquery(".product-info .faq")), 0)
+        self.assertEqual(len(response.pyquery("#links")), 0)
+        self.assertEqual(len(response.pyquery("#see")), 0)
+        self.assertEqual(len(response.pyquery(".contact-block")), 0)
+        self.assertEqual(len(response.pyquery("hr.divider")), 0)
+
+
 @tag("e2e")
 @override_settings(ROOT_URLCONF="open_inwoner.cms.tests.urls")
 @patch("open_inwoner.configurations.models.SiteConfiguration.get_solo")
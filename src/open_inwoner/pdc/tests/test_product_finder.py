@@ -1,8 +1,14 @@
-from django.test import override_settings
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
 from django.urls import reverse
 
 from django_webtest import WebTest
 
+from open_inwoner.utils.test import ClearCachesMixin
+
+from ..choices import YesNo
+from ..finder import ProductFinderIndex, find_products, get_product_finder_index
 from ..models import ProductCondition
 from .factories import ProductConditionFactory, ProductFactory
 
@@ -1565,3 +1571,109 @@ class ProductConditions(WebTest):
         self.assertEqual(session["product_finder"], {})
         self.assertIsNone(session["current_condition"])
         self.assertFalse(session["conditions_done"])
+
+
+class ProductFinderIndexTests(ClearCachesMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.condition1 = ProductConditionFactory()
+        self.condition2 = ProductConditionFactory()
+
+        self.product1 = ProductFactory()
+        self.product1.conditions.add(self.condition1)
+        self.product2 = ProductFactory()
+        self.product2.conditions.add(self.condition1, self.condition2)
+        self.product3 = ProductFactory()
+        self.product3.conditions.add(self.condition2)
+        self.product4 = ProductFactory()
+        ProductFactory(published=False).conditions.add(self.condition1)
+
+    def answer(self, condition, answer):
+        return {"condition": condition.pk, "answer": answer}
+
+    def test_find_products(self):
+        matched, possible = find_products([])
+
+        self.assertEqual(matched, [])
+        self.assertEqual(
+            possible, [self.product1, self.product2, self.product3, self.product4]
+        )
+
+        matched, possible = find_products([self.answer(self.condition1, YesNo.yes)])
+
+        self.assertEqual(matched, [self.product1, self.product2])
+        self.assertEqual(possible, [self.product3, self.product4])
+
+        matched, possible = find_products(
+            [
+                self.answer(self.condition1, YesNo.yes),
+                self.answer(self.condition2, YesNo.no),
+            ]
+        )
+
+        self.assertEqual(matched, [self.product1])
+        self.assertEqual(possible, [self.product4])
+
+    def test_products_are_fetched_in_one_query(self):
+        get_product_finder_index()
+
+        with self.assertNumQueries(1):
+            find_products(
+                [
+                    self.answer(self.condition1, YesNo.no),
+                    self.answer(self.condition2, YesNo.yes),
+                ]
+            )
+
+    def test_index_is_refreshed_on_changes(self):
+        answers = [self.answer(self.condition2, YesNo.yes)]
+        self.assertEqual(
+            get_product_finder_index().find(answers),
+            (
+                [self.product2.pk, self.product3.pk],
+                [self.product1.pk, self.product4.pk],
+            ),
+        )
+
+        self.product4.conditions.add(self.condition2)
+        self.product3.published = False
+        self.product3.save()
+
+        self.assertEqual(
+            get_product_finder_index().find(answers),
+            ([self.product2.pk, self.product4.pk], [self.product1.pk]),
+        )
+
+        self.condition2.delete()
+
+        self.assertEqual(
+            get_product_finder_index().find(answers),
+            ([], [self.product1.pk, self.product2.pk, self.product4.pk]),
+        )
+
+    def test_index_built_before_the_commit_is_refreshed(self):
+        answers = [self.answer(self.condition2, YesNo.yes)]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.product4.conditions.add(self.condition2)
+            # the index is marked as stale, but the index of another process
+            # could be rebuilt (with the old conditions) before the commit
+            get_product_finder_index()
+            with patch.object(ProductFinderIndex, "build") as build:
+                get_product_finder_index()
+                build.assert_not_called()
+
+        with patch.object(
+            ProductFinderIndex, "build", side_effect=ProductFinderIndex.build
+        ) as build:
+            index = get_product_finder_index()
+            build.assert_called_once()
+
+        self.assertEqual(
+            index.find(answers),
+            (
+                [self.product2.pk, self.product3.pk, self.product4.pk],
+                [self.product1.pk],
+            ),
+        )
@@ -10,8 +10,12 @@ from django_webtest import WebTest
 from maykin_2fa.test import disable_admin_mfa
 
 from open_inwoner.accounts.tests.factories import UserFactory
+from open_inwoner.utils.cache import get_cache_version
+from open_inwoner.utils.test import ClearCachesMixin
 
-from ..models import ProductLocation
+from ..cache import LOCATIONS_VERSION_CACHE_KEY
+from ..models import GeocodedAddress, ProductLocation
+from ..tasks import geocode_locations
 from .factories import ProductFactory, ProductLocationFactory
 
 
@@ -220,6 +224,177 @@ class ProductLocationTestCase(TestCase):
         )
 
 
+@override_settings(ROOT_URLCONF="open_inwoner.cms.tests.urls")
+class GeocodedAddressTests(TestCase):
+    @patch("open_inwoner.pdc.models.mixins.geocode_address")
+    def test_clean_uses_geocoded_address(self, mock_geocoding):
+        GeocodedAddress.objects.create(
+            address="keizersgracht 117, 1015cj amsterdam",
+            geometry=Point(4.8876438, 52.37670043),
+        )
+        product_location = ProductLocation(
+            street="Keizersgracht",
+            housenumber="117",
+            postcode="1015 CJ",
+            city="Amsterdam",
+        )
+
+        product_location.clean()
+
+        self.assertEqual(product_location.geometry.coords, (4.8876438, 52.37670043))
+        mock_geocoding.assert_not_called()
+
+    @patch(
+        "open_inwoner.pdc.models.mixins.geocode_address",
+        return_value=Point(4.8876438, 52.37670043),
+    )
+    def test_clean_stores_geocoded_address(self, mock_geocoding):
+        ProductLocation(
+            street="Keizersgracht",
+            housenumber="117",
+            postcode="1015 CJ",
+            city="Amsterdam",
+        ).clean()
+
+        self.assertEqual(
+            GeocodedAddress.objects.get().address,
+            "keizersgracht 117, 1015cj amsterdam",
+        )
+
+    @patch("open_inwoner.utils.geocode.geocode_address")
+    def test_geocode_only_new_addresses(self, mock_geocoding):
+        GeocodedAddress.objects.create(
+            address="keizersgracht 117, 1015cj amsterdam", geometry=Point(4.88, 52.37)
+        )
+        mock_geocoding.side_effect = lambda address: (
+            None if address == "Onbekend 1" else Point(6.15, 52.25)
+        )
+
+        result = GeocodedAddress.objects.geocode(
+            [
+                "Keizersgracht 117, 1015 CJ Amsterdam",
+                "Grote Kerkhof 4, 7411 KT Deventer",
+                "Onbekend 1",
+            ]
+        )
+
+        self.assertEqual(
+            result["Keizersgracht 117, 1015 CJ Amsterdam"].coords, (4.88, 52.37)
+        )
+        self.assertEqual(
+            result["Grote Kerkhof 4, 7411 KT Deventer"].coords, (6.15, 52.25)
+        )
+        self.assertIsNone(result["Onbekend 1"])
+        self.assertEqual(mock_geocoding.call_count, 2)
+        # the addresses that weren't found aren't stored
+        self.assertEqual(
+            set(GeocodedAddress.objects.values_list("address", flat=True)),
+            {
+                "keizersgracht 117, 1015cj amsterdam",
+                "grote kerkhof 4, 7411kt deventer",
+            },
+        )
+
+    @patch(
+        "open_inwoner.utils.geocode.geocode_address",
+        return_value=Point(6.15, 52.25),
+    )
+    def test_geocode_locations_task(self, mock_geocoding):
+        location1 = ProductLocationFactory.create(
+            street="Grote Kerkhof",
+            housenumber="4",
+            postcode="7411 KT",
+            city="Deventer",
+            geometry=Point(5, 52),
+        )
+        location2 = ProductLocationFactory.create(
+            street="Grote Kerkhof",
+            housenumber="4",
+            postcode="7411KT",
+            city="Deventer",
+            geometry=Point(6.15, 52.25),
+        )
+
+        updated = geocode_locations("pdc.ProductLocation", [location1.pk, location2.pk])
+
+        self.assertEqual(updated, 1)
+        location1.refresh_from_db()
+        self.assertEqual(location1.geometry.coords, (6.15, 52.25))
+        # both locations have the same (normalized) address
+        mock_geocoding.assert_called_once()
+
+
+@override_settings(ROOT_URLCONF="open_inwoner.cms.tests.urls")
+class ProductLocationCacheTests(ClearCachesMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.location1 = ProductLocationFactory.create(geometry=Point(4.88, 52.37))
+        self.location2 = ProductLocationFactory.create(geometry=Point(6.15, 52.25))
+        self.product = ProductFactory.create(locations=(self.location1,))
+
+    def test_geojson_matches_the_features_of_the_locations(self):
+        self.assertEqual(
+            ProductLocation.objects.all().get_geojson_features(),
+            [
+                self.location1.get_geojson_feature(False),
+                self.location2.get_geojson_feature(False),
+            ],
+        )
+        self.assertEqual(
+            self.product.locations.get_geojson_features(),
+            [self.location1.get_geojson_feature(False)],
+        )
+        self.assertEqual(
+            len(ProductLocation.objects.order_by("pk")[:1].get_geojson_features()),
+            1,
+        )
+
+    def test_empty_querysets(self):
+        self.assertEqual(ProductLocation.objects.none().get_geojson_features(), [])
+        self.assertIsNone(ProductLocation.objects.none().get_centroid())
+        self.assertIsNone(ProductLocation.objects.filter(name="unknown").get_centroid())
+
+    def test_geojson_and_centroid_are_cached(self):
+        queryset = self.product.locations.all()
+        queryset.get_geojson_feature_collection()
+        queryset.get_centroid()
+
+        with self.assertNumQueries(0):
+            self.product.locations.all().get_geojson_feature_collection()
+            self.product.locations.all().get_centroid()
+
+    def test_cache_is_invalidated_on_changes(self):
+        self.assertEqual(len(self.product.locations.get_geojson_features()), 1)
+        self.assertEqual(
+            self.product.locations.get_centroid(), {"lng": "4.88", "lat": "52.37"}
+        )
+
+        self.location1.name = "Stadhuis"
+        self.location1.save()
+
+        features = self.product.locations.get_geojson_features()
+        self.assertEqual(features[0]["properties"]["name"], "Stadhuis")
+
+        self.product.locations.add(self.location2)
+
+        self.assertEqual(len(self.product.locations.get_geojson_features()), 2)
+        self.assertNotEqual(
+            self.product.locations.get_centroid(), {"lng": "4.88", "lat": "52.37"}
+        )
+
+    def test_locations_cached_before_the_commit_are_invalidated(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.location1.name = "Stadhuis"
+            self.location1.save()
+
+            # other processes cache the locations under this version until the
+            # change is committed
+            version = get_cache_version(LOCATIONS_VERSION_CACHE_KEY)
+
+        self.assertNotEqual(get_cache_version(LOCATIONS_VERSION_CACHE_KEY), version)
+
+
 @disable_admin_mfa()
 @override_settings(ROOT_URLCONF="open_inwoner.cms.tests.urls")
 class TestLocationFormInput(WebTest):
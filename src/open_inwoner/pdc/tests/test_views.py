@@ -1,5 +1,9 @@
+from unittest.mock import patch
+
 from django.conf import settings
-from django.test import TestCase, override_settings
+from django.db import connection
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from open_inwoner.accounts.tests.factories import (
@@ -8,9 +12,16 @@ from open_inwoner.accounts.tests.factories import (
     eHerkenningUserFactory,
 )
 from open_inwoner.configurations.models import SiteConfiguration
-from open_inwoner.utils.test import set_kvk_branch_number_in_session
-
-from .factories import CategoryFactory
+from open_inwoner.utils.test import ClearCachesMixin, set_kvk_branch_number_in_session
+
+from ..views import (
+    CSP_NONCE_PLACEHOLDER,
+    CSRF_TOKEN_PLACEHOLDER,
+    CategoryDetailView,
+    CategoryListView,
+    ProductDetailView,
+)
+from .factories import CategoryFactory, ProductFactory, QuestionFactory
 
 # Avoid redirects through `KvKLoginMiddleware`
 PATCHED_MIDDLEWARE = [
@@ -250,6 +261,54 @@ class CategoryDetailViewTest(TestCase):
             response.rendered_content,
         )
 
+    def test_category_is_loaded_once(self):
+        config = SiteConfiguration.get_solo()
+        config.hide_categories_from_anonymous_users = False
+        config.save()
+
+        self.category.visible_for_anonymous = True
+        self.category.save()
+        subcategory = self.category.add_child(
+            name="sub cat", slug="sub-cat", visible_for_anonymous=True, published=True
+        )
+
+        url = reverse(
+            "products:category_detail",
+            kwargs={"slug": f"{self.category.slug}/{subcategory.slug}"},
+        )
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        category_queries = [
+            query["sql"]
+            for query in context.captured_queries
+            if 'WHERE "pdc_category"."slug" ' in query["sql"]
+        ]
+        # the category itself and the categories of the breadcrumbs
+        self.assertEqual(len(category_queries), 2)
+
+    def test_category_is_loaded_with_a_fixed_number_of_queries(self):
+        subcategory = self.category.add_child(
+            name="sub cat", slug="sub-cat", visible_for_anonymous=True, published=True
+        )
+        QuestionFactory.create_batch(3, category=subcategory)
+
+        view = CategoryDetailView()
+        view.setup(
+            RequestFactory().get("/"),
+            slug=f"{self.category.slug}/{subcategory.slug}",
+        )
+
+        # the category, its questions and the categories of the breadcrumbs
+        with self.assertNumQueries(3):
+            view.get_object()
+            view.crumbs
+
+        with self.assertNumQueries(0):
+            self.assertEqual(len(view.category.question_set.all()), 3)
+
     def test_category_breadcrumbs_404(self):
         config = SiteConfiguration.get_solo()
         config.hide_categories_from_anonymous_users = False
@@ -265,3 +324,130 @@ class CategoryDetailViewTest(TestCase):
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, 404)
+
+
+@override_settings(ROOT_URLCONF="open_inwoner.cms.tests.urls")
+class AnonymousPageCacheTest(ClearCachesMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+
+        config = SiteConfiguration.get_solo()
+        config.hide_categories_from_anonymous_users = False
+        config.save()
+
+        self.category = CategoryFactory(name="Wonen", visible_for_anonymous=True)
+        self.product = ProductFactory(name="Parkeervergunning")
+        self.url = reverse("products:category_list")
+
+    def get_anonymous(self, url):
+        # a fresh client for every visitor
+        return self.client_class().get(url)
+
+    def test_anonymous_page_is_cached(self):
+        with patch.object(
+            CategoryListView,
+            "get_context_data",
+            autospec=True,
+            side_effect=CategoryListView.get_context_data,
+        ) as mock_context:
+            first = self.get_anonymous(self.url)
+            second = self.get_anonymous(self.url)
+
+        self.assertEqual(mock_context.call_count, 1)
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.status_code, 200)
+        self.assertContains(second, "Wonen")
+
+    def test_visitor_specific_values_are_filled_in(self):
+        self.get_anonymous(self.url)
+        response = self.get_anonymous(self.url)
+
+        content = response.content.decode()
+        self.assertNotIn(CSRF_TOKEN_PLACEHOLDER, content)
+        self.assertNotIn(CSP_NONCE_PLACEHOLDER, content)
+        self.assertIn(response.wsgi_request.META["CSRF_COOKIE"], content)
+        self.assertIn(response.wsgi_request._csp_nonce, content)
+        self.assertIn(
+            response.wsgi_request._csp_nonce, response["Content-Security-Policy"]
+        )
+
+    def test_page_is_not_cached_for_users_or_sessions(self):
+        user = UserFactory()
+
+        with patch.object(
+            CategoryListView,
+            "get_context_data",
+            autospec=True,
+            side_effect=CategoryListView.get_context_data,
+        ) as mock_context:
+            self.client.force_login(user)
+            self.client.get(self.url)
+            self.client.get(self.url)
+            self.client.logout()
+
+            self.client.cookies[settings.SESSION_COOKIE_NAME] = "session"
+            self.client.get(self.url)
+            self.client.get(self.url)
+
+        self.assertEqual(mock_context.call_count, 4)
+
+    def test_page_with_query_parameters_is_not_cached(self):
+        with patch.object(
+            CategoryListView,
+            "get_context_data",
+            autospec=True,
+            side_effect=CategoryListView.get_context_data,
+        ) as mock_context:
+            for value in ["1", "2", "1"]:
+                response = self.get_anonymous(f"{self.url}?random={value}")
+
+                self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(mock_context.call_count, 3)
+
+    def test_changes_invalidate_the_cached_pages(self):
+        url = reverse("products:product_detail", kwargs={"slug": self.product.slug})
+
+        with patch.object(
+            ProductDetailView,
+            "get_context_data",
+            autospec=True,
+            side_effect=ProductDetailView.get_context_data,
+        ) as mock_context:
+            self.get_anonymous(url)
+            self.get_anonymous(url)
+            self.assertEqual(mock_context.call_count, 1)
+
+            self.product.summary = "Een nieuwe samenvatting"
+            self.product.save()
+
+            response = self.get_anonymous(url)
+            self.assertEqual(mock_context.call_count, 2)
+            self.assertContains(response, "Een nieuwe samenvatting")
+
+            config = SiteConfiguration.get_solo()
+            config.name = "Mijn gemeente"
+            config.save()
+
+            self.get_anonymous(url)
+            self.assertEqual(mock_context.call_count, 3)
+
+    def test_pages_cached_before_the_commit_are_invalidated(self):
+        url = reverse("products:product_detail", kwargs={"slug": self.product.slug})
+
+        with patch.object(
+            ProductDetailView,
+            "get_context_data",
+            autospec=True,
+            side_effect=ProductDetailView.get_context_data,
+        ) as mock_context:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.product.summary = "Een nieuwe samenvatting"
+                self.product.save()
+
+                # rendered by another visitor before the change is committed
+                self.get_anonymous(url)
+                self.assertEqual(mock_context.call_count, 1)
+
+            self.get_anonymous(url)
+            self.assertEqual(mock_context.call_count, 2)
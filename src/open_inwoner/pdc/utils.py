@@ -3,6 +3,8 @@ from django.utils.text import slugify
 import markdown
 from bs4 import BeautifulSoup
 
+from open_inwoner.utils.ckeditor import get_cached_render
+
 PRODUCT_PATH_NAME = "products"
 
 
@@ -11,6 +13,14 @@ def extract_subheadings(content: str, tag: str) -> list[tuple[str, str]]:
     Returns a list of tuples containing a subheading (the text of the `tag` element)
     and a slug for the corresponding HTML anchor
     """
+    return get_cached_render(
+        "subheadings",
+        {"content": content, "tag": tag},
+        lambda: render_subheadings(content, tag),
+    )
+
+
+def render_subheadings(content: str, tag: str) -> list[tuple[str, str]]:
     md = markdown.Markdown()
     html_string = md.convert(content)
 
@@ -1,6 +1,7 @@
-from django.db.models import Q
-from django.http import Http404, HttpResponseRedirect
-from django.shortcuts import get_object_or_404
+from django.db.models import Exists, OuterRef, Prefetch
+from django.http import Http404, HttpResponse, HttpResponseRedirect
+from django.middleware.csrf import get_token
+from django.template.response import TemplateResponse
 from django.urls import reverse, reverse_lazy
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
@@ -15,31 +16,44 @@ from open_inwoner.utils.views import LoginMaybeRequiredMixin
 
 from ..utils.ckeditor import get_rendered_content
 from ..utils.views import CommonPageMixin
-from .choices import YesNo
+from .cache import get_cached_page, is_page_cacheable, set_cached_page
+from .finder import find_products
 from .forms import ProductFinderForm
-from .models import Category, Product, ProductLocation, Question
+from .models import (
+    Category,
+    Product,
+    ProductFile,
+    ProductLink,
+    ProductLocation,
+    Question,
+)
 from .utils import extract_subheadings
 
 
 class CategoryBreadcrumbMixin:
     def get_orderd_categories(self, slug_name="slug"):
         slug = self.kwargs.get(slug_name, "")
-        slugs = slug.split("/")
+        slugs = [sl for sl in slug.split("/") if sl]
+        categories_by_slug = Category.objects.in_bulk(slugs, field_name="slug")
         categories = []
         older_slugs = ""
         for sl in slugs:
-            if sl:
-                categories.append(
-                    {
-                        "slug": sl,
-                        "build_slug": f"{older_slugs}/{sl}" if older_slugs else sl,
-                        "category": get_object_or_404(Category, slug=sl),
-                    }
+            if sl not in categories_by_slug:
+                raise Http404(
+                    _("No %(verbose_name)s found matching the query")
+                    % {"verbose_name": Category._meta.verbose_name}
                 )
-                if older_slugs:
-                    older_slugs = f"{older_slugs}/{sl}"
-                else:
-                    older_slugs = sl
+            categories.append(
+                {
+                    "slug": sl,
+                    "build_slug": f"{older_slugs}/{sl}" if older_slugs else sl,
+                    "category": categories_by_slug[sl],
+                }
+            )
+            if older_slugs:
+                older_slugs = f"{older_slugs}/{sl}"
+            else:
+                older_slugs = sl
         return categories
 
     def get_categories_breadcrumbs(self, slug_name="slug"):
@@ -63,7 +77,69 @@ class RedirectToLinkMixin:
         return super().dispatch(request, *args, **kwargs)
 
 
-class FAQView(CommonPageMixin, TemplateView):
+CSRF_TOKEN_PLACEHOLDER = "__csrf_token__"
+CSP_NONCE_PLACEHOLDER = "__csp_nonce__"
+
+
+def fill_page_placeholders(request, content: str) -> str:
+    if CSRF_TOKEN_PLACEHOLDER in content:
+        content = content.replace(CSRF_TOKEN_PLACEHOLDER, get_token(request))
+    if CSP_NONCE_PLACEHOLDER in content:
+        content = content.replace(CSP_NONCE_PLACEHOLDER, str(request.csp_nonce))
+    return content
+
+
+class AnonymousPageCacheMixin:
+    """
+    Cache the rendered page for the anonymous visitors without a session.
+
+    The CSRF token and CSP nonce differ per visitor, so the page is cached with
+    placeholders that are filled in for every response.
+    """
+
+    cache_page = False
+
+    def dispatch(self, request, *args, **kwargs):
+        if not is_page_cacheable(request):
+            return super().dispatch(request, *args, **kwargs)
+
+        page = get_cached_page(request)
+        if page is not None:
+            return HttpResponse(
+                fill_page_placeholders(request, page["content"]),
+                content_type=page["content_type"],
+            )
+
+        self.cache_page = True
+        response = super().dispatch(request, *args, **kwargs)
+        if isinstance(response, TemplateResponse) and response.status_code == 200:
+            csp_nonce = getattr(request, "csp_nonce", None)
+            if csp_nonce is not None:
+                request.csp_nonce = CSP_NONCE_PLACEHOLDER
+
+            def store_page(response):
+                if csp_nonce is not None:
+                    request.csp_nonce = csp_nonce
+                content = response.content.decode(response.charset)
+                # the page sets visitor specific cookies (e.g. messages)
+                if not response.cookies:
+                    set_cached_page(
+                        request,
+                        {"content": content, "content_type": response["Content-Type"]},
+                    )
+                response.content = fill_page_placeholders(request, content)
+
+            response.add_post_render_callback(store_page)
+        return response
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        if self.cache_page:
+            context["csrf_token"] = CSRF_TOKEN_PLACEHOLDER
+        return context
+
+
+class FAQView(AnonymousPageCacheMixin, CommonPageMixin, TemplateView):
     template_name = "pages/faq.html"
 
     def page_title(self):
@@ -75,7 +151,11 @@ class FAQView(CommonPageMixin, TemplateView):
 
 
 class CategoryListView(
-    LoginMaybeRequiredMixin, CommonPageMixin, ListBreadcrumbMixin, ListView
+    AnonymousPageCacheMixin,
+    LoginMaybeRequiredMixin,
+    CommonPageMixin,
+    ListBreadcrumbMixin,
+    ListView,
 ):
     template_name = "pages/category/list.html"
     model = Category
@@ -98,6 +178,7 @@ class CategoryListView(
 
 
 class CategoryDetailView(
+    AnonymousPageCacheMixin,
     LoginMaybeRequiredMixin,
     CommonPageMixin,
     BaseBreadcrumbMixin,
@@ -114,10 +195,25 @@ class CategoryDetailView(
         base_list = [(_("Onderwerpen"), reverse("products:category_list"))]
         return base_list + self.get_categories_breadcrumbs()
 
+    def get_queryset(self):
+        return (
+            super()
+            .get_queryset()
+            .select_related("icon", "image")
+            .prefetch_related("question_set")
+        )
+
     def get_object(self, queryset=None):
+        # the category is used by the access check, dispatch and the context
         if queryset is None:
-            queryset = self.get_queryset()
+            return self.category
+        return self.load_category(queryset)
+
+    @cached_property
+    def category(self):
+        return self.load_category(self.get_queryset())
 
+    def load_category(self, queryset):
         slug = self.kwargs.get("slug", "")
         slugs = slug.split("/")
         queryset = queryset.filter(slug=slugs[-1])
@@ -134,7 +230,9 @@ class CategoryDetailView(
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context["subcategories"] = self.object.get_children().published()
-        context["products"] = self.object.products.published().order_in_category()
+        context["products"] = (
+            self.object.products.published().order_in_category().select_related("icon")
+        )
         context["questionnaire_roots"] = QuestionnaireStep.get_root_nodes().filter(
             category=self.object
         )
@@ -178,6 +276,7 @@ class CategoryDetailView(
 
 
 class ProductDetailView(
+    AnonymousPageCacheMixin,
     CommonPageMixin,
     BaseBreadcrumbMixin,
     CategoryBreadcrumbMixin,
@@ -195,6 +294,61 @@ class ProductDetailView(
         base_list += self.get_categories_breadcrumbs(slug_name="category_slug")
         return base_list + [(self.get_object().name, self.request.path)]
 
+    def get_queryset(self):
+        """
+        Load the product with everything shown on the page, the annotations
+        tell which sections of the page are shown.
+        """
+        product = OuterRef("pk")
+        return (
+            super()
+            .get_queryset()
+            .select_related("icon", "image", "video")
+            .prefetch_related(
+                "tags",
+                "question_set",
+                "files__file",
+                "conditions",
+                "locations",
+                "contacts__organization",
+                Prefetch("links", queryset=ProductLink.objects.order_by("pk")),
+                Prefetch(
+                    "related_products",
+                    queryset=Product.objects.published(),
+                    to_attr="published_related_products",
+                ),
+            )
+            .annotate(
+                has_questions=Exists(Question.objects.filter(product=product)),
+                has_files=Exists(ProductFile.objects.filter(product=product)),
+                has_conditions=Exists(
+                    Product.conditions.through.objects.filter(product=product)
+                ),
+                has_locations=Exists(
+                    Product.locations.through.objects.filter(product=product)
+                ),
+                has_contacts=Exists(
+                    Product.contacts.through.objects.filter(product=product)
+                ),
+                has_links=Exists(ProductLink.objects.filter(product=product)),
+                has_related_products=Exists(
+                    Product.related_products.through.objects.filter(
+                        from_product=product, to_product__published=True
+                    )
+                ),
+            )
+        )
+
+    def get_object(self, queryset=None):
+        # the product is used by dispatch, the breadcrumbs and the context
+        if queryset is None:
+            return self.product
+        return super().get_object(queryset)
+
+    @cached_property
+    def product(self):
+        return super().get_object()
+
     def get(self, request, *args, **kwargs):
         obj = self.get_object()
         if not obj.published:
@@ -212,13 +366,13 @@ class ProductDetailView(
         anchors = subheadings
         if product.content_is_collapsable:
             anchors = []
-        if product.question_set.exists():
+        if product.has_questions:
             anchors.append(("#faq", _("Veelgestelde vragen")))
-        if product.files.exists():
+        if product.has_files:
             anchors.append(("#files", _("Bestanden")))
-        if product.locations.exists():
+        if product.has_locations:
             anchors.append(("#locations", _("Locaties")))
-        if product.contacts.exists():
+        if product.has_contacts:
             anchors.append(("#contact", _("Contact")))
 
         context["meta_description"] = product.summary
@@ -226,8 +380,8 @@ class ProductDetailView(
             context["meta_image_url"] = request.build_absolute_uri(product.icon.url)
         context["meta_page_url"] = request.build_absolute_uri(request.path)
         context["anchors"] = anchors
-        context["related_products_start"] = 6 if product.links.exists() else 1
-        context["product_links"] = product.links.order_by("pk")
+        context["related_products_start"] = 6 if product.has_links else 1
+        context["product_links"] = product.links.all()
         context["display_social"] = config.display_social
         return context
 
@@ -339,51 +493,15 @@ class ProductFinderView(CommonPageMixin, FormView):
                 }
             }
 
-    def get_condition_products(self):
-        current_answers = self.request.session.get("product_finder")
-        filters = None
-        if current_answers:
-            for _order, answer in current_answers.items():
-                new_filter = Q(conditions=answer.get("condition"))
-
-                if filters:
-                    filters = filters | new_filter
-                else:
-                    filters = new_filter
-
-        if filters:
-            return Product.objects.published().filter(filters).distinct()
-        return Product.objects.none()
-
-    def filter_matched_products(self, condition_products):
-        products = condition_products
-        current_answers = self.request.session.get("product_finder")
-        if current_answers:
-            for _order, answer in current_answers.items():
-                if answer.get("answer") == YesNo.no:
-                    products = products.exclude(conditions=answer.get("condition"))
-        return products
-
-    def filter_possible_products(self, condition_products, matched):
-        qs = Product.objects.published().exclude(pk__in=matched.values_list("pk"))
-        current_answers = self.request.session.get("product_finder")
-        if current_answers:
-            for _order, answer in current_answers.items():
-                if answer.get("answer") == YesNo.no:
-                    qs = qs.exclude(conditions=answer.get("condition"))
-        return qs
-
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         previous_condition = self.get_previous_condition()
         context["show_previous"] = previous_condition is not None
         context["condition"] = self.condition
-        condition_products = self.get_condition_products()
-        matched = self.filter_matched_products(condition_products)
+        current_answers = self.request.session.get("product_finder") or {}
+        matched, possible = find_products(list(current_answers.values()))
         context["matched_products"] = matched
-        context["possible_products"] = self.filter_possible_products(
-            condition_products, matched
-        )
+        context["possible_products"] = possible
         context["conditions_done"] = self.request.session.get("conditions_done", False)
         return context
 
@@ -413,7 +531,11 @@ class ProductFinderView(CommonPageMixin, FormView):
 
 
 class ProductLocationDetailView(
-    CommonPageMixin, BaseBreadcrumbMixin, CategoryBreadcrumbMixin, DetailView
+    AnonymousPageCacheMixin,
+    CommonPageMixin,
+    BaseBreadcrumbMixin,
+    CategoryBreadcrumbMixin,
+    DetailView,
 ):
     template_name = "pages/product/location_detail.html"
     model = ProductLocation
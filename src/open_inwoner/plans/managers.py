@@ -1,6 +1,68 @@
-from django.db.models import QuerySet
+from datetime import date
+
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    IntegerField,
+    OuterRef,
+    Q,
+    QuerySet,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce
 
 
 class PlanQuerySet(QuerySet):
     def connected(self, user):
         return self.filter(plan_contacts=user)
+
+    def with_open_actions_count(self):
+        from open_inwoner.accounts.choices import StatusChoices
+        from open_inwoner.accounts.models import Action
+
+        open_actions = (
+            Action.objects.filter(
+                plan=OuterRef("pk"),
+                status__in=[StatusChoices.open, StatusChoices.approval],
+                is_deleted=False,
+            )
+            .order_by()
+            .values("plan")
+            .annotate(total=Count("pk"))
+            .values("total")
+        )
+        return self.annotate(
+            open_actions_count=Coalesce(
+                Subquery(open_actions, output_field=IntegerField()), Value(0)
+            )
+        )
+
+    def order_open_first(self):
+        """
+        Open plans first (ending soonest first), followed by the closed plans
+        (most recently ended first).
+        """
+        today = date.today()
+        return self.annotate(
+            open_end_date=Case(When(end_date__gt=today, then=F("end_date"))),
+            closed_end_date=Case(When(end_date__lte=today, then=F("end_date"))),
+        ).order_by(
+            F("open_end_date").asc(nulls_last=True),
+            F("closed_end_date").desc(),
+            "pk",
+        )
+
+    def participants(self, exclude_user=None):
+        """
+        Users participating in any of the plans (as contact or creator)
+        """
+        from open_inwoner.accounts.models import User
+
+        plan_ids = self.order_by().values("pk")
+        users = User.objects.filter(Q(plans__in=plan_ids) | Q(plan__in=plan_ids))
+        if exclude_user:
+            users = users.exclude(pk=exclude_user.pk)
+        return users.distinct()
@@ -171,8 +171,14 @@ class Plan(models.Model):
         return User.objects.filter(id__in=user_ids)
 
     def get_other_users_full_names(self, user):
-        other_users = self.get_other_users(user)
-        return ", ".join([user.get_full_name() for user in other_users])
+        # uses the prefetched plan contacts when available
+        other_users = {contact.pk: contact for contact in self.plan_contacts.all()}
+        other_users[self.created_by_id] = self.created_by
+        other_users.pop(user.pk, None)
+        return ", ".join(
+            other_user.get_full_name()
+            for _pk, other_user in sorted(other_users.items())
+        )
 
     def get_status(self):
         if self.end_date > date.today():
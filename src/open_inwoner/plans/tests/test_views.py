@@ -3,7 +3,9 @@ from unittest.mock import Mock, patch
 
 from django.contrib.messages import get_messages
 from django.core import mail
+from django.db import connection
 from django.test import override_settings, tag
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils.translation import gettext as _
 
@@ -874,6 +876,43 @@ class PlanBegeleiderListViewTests(WebTest):
         self.assertIn(self.begeleider_plan.title, rendered_plan_title)
         self.assertEqual(contact_name, self.contact.get_full_name())
 
+    @freeze_time("2022-01-01")
+    def test_plan_list_orders_open_plans_before_closed_plans(self):
+        self.begeleider_plan.end_date = date(2022, 1, 20)
+        self.begeleider_plan.save()
+        open_plan = PlanFactory(created_by=self.begeleider, end_date=date(2022, 1, 10))
+        closed_plan = PlanFactory(created_by=self.begeleider, end_date=date(2021, 1, 1))
+        recently_closed_plan = PlanFactory(
+            created_by=self.begeleider, end_date=date(2021, 12, 1)
+        )
+        for plan in (open_plan, closed_plan, recently_closed_plan):
+            plan.plan_contacts.add(self.begeleider)
+
+        response = self.app.get(self.list_url, user=self.begeleider)
+
+        self.assertEqual(
+            list(response.context["plans"]["plan_list"]),
+            [open_plan, self.begeleider_plan, recently_closed_plan, closed_plan],
+        )
+
+    def test_plan_list_query_count_does_not_grow_with_plans(self):
+        def count_queries():
+            with CaptureQueriesContext(connection) as queries:
+                self.app.get(self.list_url, user=self.begeleider)
+            return len(queries)
+
+        # warm up caches (site configuration, cms menus, ...)
+        self.app.get(self.list_url, user=self.begeleider)
+        num_queries = count_queries()
+
+        for _i in range(15):
+            contact = UserFactory()
+            plan = PlanFactory(created_by=self.begeleider)
+            plan.plan_contacts.add(self.begeleider, contact)
+            ActionFactory(plan=plan, created_by=self.begeleider)
+
+        self.assertEqual(count_queries(), num_queries)
+
     @freeze_time("2022-01-01")
     def test_plan_list_filters_status_closed(self):
         open_plan = PlanFactory(
@@ -15,7 +15,6 @@ from view_breadcrumbs import BaseBreadcrumbMixin
 
 from open_inwoner.accounts.choices import ContactTypeChoices
 from open_inwoner.accounts.forms import ActionListForm, DocumentForm
-from open_inwoner.accounts.models import User
 from open_inwoner.accounts.views.actions import (
     ActionCreateView,
     ActionDeleteView,
@@ -118,15 +117,7 @@ class PlanListView(
         """
         Return all available contacts for filtering for all the plans.
         """
-        user_contacts_qs = []
-        for plan in plans:
-            user_contacts_qs.append(plan.get_other_users(user=self.request.user))
-
-        available_contacts = User.objects.none()
-        for qs in user_contacts_qs:
-            available_contacts |= qs
-
-        return available_contacts
+        return plans.participants(exclude_user=self.request.user)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -139,18 +130,16 @@ class PlanListView(
             plans["extended_plans"] = True
             available_contacts = self.get_available_contacts_for_filtering(initial_qs)
 
-            filtered_plans = self.get_filtered_plans(initial_qs, available_contacts)
-
-            # sort the filtered plans based on if they are open or closed
-            open_plans = filtered_plans.filter(end_date__gt=date.today())
-            closed_plans = filtered_plans.filter(end_date__lte=date.today()).order_by(
-                "-end_date"
+            # sort the filtered plans based on if they are open or closed, and
+            # paginate in the database
+            filtered_plans = (
+                self.get_filtered_plans(initial_qs, available_contacts)
+                .select_related("created_by")
+                .with_open_actions_count()
+                .order_open_first()
             )
-            sorted_plans = list(open_plans) + list(closed_plans)
-
-            # paginate results
             paginator, page, queryset, is_paginated = self.paginate_queryset(
-                sorted_plans, 10
+                filtered_plans, 10
             )
 
             # instantiate filter form
@@ -159,11 +148,9 @@ class PlanListView(
             )
 
             # prepare plans for frontend
-            temp_plans = {}
-            for plan in queryset:
-                temp_plans[plan] = plan.get_other_users_full_names(user=user)
-
-            plans["plan_list"] = temp_plans
+            plans["plan_list"] = {
+                plan: plan.get_other_users_full_names(user=user) for plan in queryset
+            }
         else:
             paginator, page, queryset, is_paginated = self.paginate_queryset(
                 initial_qs, 10
@@ -0,0 +1,97 @@
+"""
+Per-customer cache of Qmatic appointments.
+
+Entries are considered fresh for ``CACHE_QMATIC_APPOINTMENTS_TIMEOUT`` seconds.
+After that they are still served (up to ``CACHE_QMATIC_APPOINTMENTS_STALE_TIMEOUT``)
+while a background task fetches a new list, so page renders never wait on Qmatic
+when there is anything in the cache.
+"""
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from requests import RequestException
+
+from open_inwoner.utils.hash import create_sha256_hash
+
+from .client import Appointment, NoServiceConfigured, QmaticClient
+from .exceptions import QmaticException
+
+logger = logging.getLogger(__name__)
+
+
+def get_cache_key(email: str) -> str:
+    hashed_email = create_sha256_hash(email.lower(), salt=settings.SECRET_KEY)
+    return f"qmatic_appointments:{hashed_email}"
+
+
+def get_cached_appointments(email: str, user_id: int | None = None):
+    """
+    Return the cached appointments for `email`, or `None` if nothing is cached.
+
+    If the cached entry is stale and `user_id` is given, a background refresh is
+    scheduled.
+    """
+    entry = cache.get(get_cache_key(email))
+    if entry is None:
+        return None
+
+    age = timezone.now().timestamp() - entry["fetched_at"]
+    if user_id and age > settings.CACHE_QMATIC_APPOINTMENTS_TIMEOUT:
+        schedule_refresh(user_id, email)
+
+    return [Appointment(**data) for data in entry["appointments"]]
+
+
+def fetch_appointments(email: str) -> list[Appointment]:
+    """
+    Retrieve the appointments from Qmatic and store them in the cache.
+
+    Raises `NoServiceConfigured` if Qmatic is not configured, any other error is
+    logged and results in an empty list (which is not cached).
+    """
+    client = QmaticClient()
+    try:
+        appointments = client.list_appointments_for_customer(email) or []
+    except (RequestException, QmaticException):
+        logger.exception("Error occurred while retrieving Qmatic appointments")
+        return []
+
+    cache.set(
+        get_cache_key(email),
+        {
+            "fetched_at": timezone.now().timestamp(),
+            "appointments": [
+                appointment.model_dump(mode="json") for appointment in appointments
+            ],
+        },
+        timeout=settings.CACHE_QMATIC_APPOINTMENTS_STALE_TIMEOUT,
+    )
+    return appointments
+
+
+def get_appointments(email: str, user_id: int | None = None) -> list[Appointment]:
+    """
+    Return the appointments from the cache, falling back to a (time-limited)
+    request to Qmatic on a cache miss.
+    """
+    appointments = get_cached_appointments(email, user_id=user_id)
+    if appointments is not None:
+        return appointments
+
+    try:
+        return fetch_appointments(email)
+    except NoServiceConfigured:
+        logger.exception("Error occurred while creating Qmatic client")
+        return []
+
+
+def schedule_refresh(user_id: int, email: str) -> None:
+    from .tasks import refresh_appointments
+
+    # only schedule one refresh per customer at a time
+    lock_key = f"{get_cache_key(email)}:refreshing"
+    if cache.add(lock_key, True, timeout=settings.CACHE_QMATIC_APPOINTMENTS_TIMEOUT):
+        refresh_appointments.delay(user_id)
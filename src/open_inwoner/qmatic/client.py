@@ -2,6 +2,8 @@ import logging
 from datetime import datetime
 from urllib.parse import quote
 
+from django.conf import settings
+
 from ape_pie.client import APIClient
 from pydantic import BaseModel, ValidationError
 from zgw_consumers.client import build_client
@@ -109,6 +111,8 @@ class Client(APIClient):
         self.headers["Content-Type"] = "application/json"
 
     def request(self, method: str, url: str, *args, **kwargs):
+        # never let a slow Qmatic hold up the request indefinitely
+        kwargs.setdefault("timeout", settings.QMATIC_REQUEST_TIMEOUT)
         response = super().request(method, url, *args, **kwargs)
 
         if response.status_code == 500:
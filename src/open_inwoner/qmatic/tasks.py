@@ -0,0 +1,25 @@
+import logging
+
+from open_inwoner.accounts.models import User
+from open_inwoner.celery import app
+
+from .cache import fetch_appointments
+from .client import NoServiceConfigured
+
+logger = logging.getLogger(__name__)
+
+
+@app.task
+def refresh_appointments(user_id: int):
+    try:
+        user = User.objects.get(pk=user_id)
+    except User.DoesNotExist:
+        return
+
+    if not user.has_verified_email():
+        return
+
+    try:
+        fetch_appointments(user.verified_email)
+    except NoServiceConfigured:
+        logger.warning("No Qmatic service defined, skipping refresh of appointments")
@@ -0,0 +1,52 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+import requests_mock
+from freezegun import freeze_time
+
+from open_inwoner.utils.test import ClearCachesMixin
+
+from ..cache import get_appointments, get_cached_appointments
+from .data import QmaticMockData
+
+
+@requests_mock.Mocker()
+@override_settings(
+    ROOT_URLCONF="open_inwoner.cms.tests.urls",
+    CACHE_QMATIC_APPOINTMENTS_TIMEOUT=60,
+    CACHE_QMATIC_APPOINTMENTS_STALE_TIMEOUT=60 * 60,
+)
+class AppointmentsCacheTest(ClearCachesMixin, TestCase):
+    def test_appointments_are_cached(self, m):
+        data = QmaticMockData()
+        data.setUpMocks(m)
+        email = data.user.verified_email
+
+        self.assertIsNone(get_cached_appointments(email))
+
+        appointments = get_appointments(email)
+        call_count = m.call_count
+
+        self.assertEqual(len(appointments), 2)
+        self.assertEqual(get_appointments(email), appointments)
+        self.assertEqual(m.call_count, call_count)
+
+    @patch("open_inwoner.qmatic.tasks.refresh_appointments.delay")
+    def test_stale_appointments_are_served_and_refreshed_once(self, m, mock_delay):
+        data = QmaticMockData()
+        data.setUpMocks(m)
+        email = data.user.verified_email
+
+        appointments = get_appointments(email, user_id=data.user.pk)
+        mock_delay.assert_not_called()
+
+        with freeze_time(timezone.now() + timedelta(seconds=61)):
+            self.assertEqual(
+                get_cached_appointments(email, user_id=data.user.pk), appointments
+            )
+            get_cached_appointments(email, user_id=data.user.pk)
+
+        mock_delay.assert_called_once_with(data.user.pk)
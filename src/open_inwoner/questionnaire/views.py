@@ -82,6 +82,8 @@ class QuestionnaireStepView(CommonPageMixin, BaseBreadcrumbMixin, FormView):
 
 class QuestionnaireExportView(LogMixin, ExportMixin, TemplateView):
     template_name = "export/questionnaire/questionnaire_export.html"
+    # the rendered file is saved to the user's documents
+    export_async = False
 
     def get_filename(self):
         return _("questionnaire_{slug}.pdf").format(
@@ -6,7 +6,13 @@ from django.utils.translation import gettext_lazy as _
 from import_export.admin import ImportExportMixin
 from import_export.formats import base_formats
 
-from .models import Feedback, FieldBoost, Synonym
+from .models import (
+    Feedback,
+    FieldBoost,
+    SearchQueryStatistic,
+    Synonym,
+    ZeroResultSearchQueryStatistic,
+)
 from .resources import SynonymResource
 
 
@@ -66,3 +72,32 @@ class FieldBoostAdmin(admin.ModelAdmin):
             )
 
         return super().formfield_for_dbfield(db_field, request, **kwargs)
+
+
+@admin.register(SearchQueryStatistic)
+class SearchQueryStatisticAdmin(admin.ModelAdmin):
+    list_display = (
+        "date",
+        "query",
+        "search_count",
+        "zero_result_count",
+        "click_count",
+    )
+    date_hierarchy = "date"
+    search_fields = ("query",)
+    ordering = ("-date", "-search_count", "query")
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(ZeroResultSearchQueryStatistic)
+class ZeroResultSearchQueryStatisticAdmin(SearchQueryStatisticAdmin):
+    list_display = ("date", "query", "zero_result_count")
+    ordering = ("-date", "-zero_result_count", "query")
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).filter(zero_result_count__gt=0)
@@ -0,0 +1,182 @@
+"""
+Search analytics.
+
+Searches (and the clicks on their results) are buffered in the shared cache
+during the request and stored in batches by a periodic task, which also
+aggregates them into statistics of the queries per day.
+
+The buffer is best effort, which is fine for statistics: the audit log of the
+search queries of users is written by the search view itself.
+"""
+import logging
+from datetime import timedelta
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from open_inwoner.pdc.models import Product
+
+from .models import SearchEvent, SearchQueryStatistic
+from .utils import normalize_query
+
+logger = logging.getLogger(__name__)
+
+EVENT_COUNTER_CACHE_KEY = "search:events:counter"
+EVENT_FLUSHED_CACHE_KEY = "search:events:flushed"
+EVENT_FLUSH_HORIZON_CACHE_KEY = "search:events:flush_horizon"
+FLUSH_LOCK_CACHE_KEY = "search:events:flush_lock"
+
+
+class SearchEventType:
+    search = "search"
+    click = "click"
+
+
+def get_event_cache_key(number: int) -> str:
+    return f"search:events:{number}"
+
+
+def _buffer_event(event: dict) -> None:
+    cache.add(EVENT_COUNTER_CACHE_KEY, 0, timeout=None)
+    try:
+        number = cache.incr(EVENT_COUNTER_CACHE_KEY)
+    except ValueError:
+        logger.warning("search event counter expired, dropped a search event")
+        return
+
+    cache.set(
+        get_event_cache_key(number),
+        event,
+        timeout=settings.SEARCH_EVENTS_BUFFER_TIMEOUT,
+    )
+
+
+def emit_search_event(
+    query: str,
+    filters: dict,
+    result_count: int,
+    latency: float,
+    page: int = 1,
+) -> str:
+    """
+    Buffer a search, returns the id to track the clicks on its results.
+    """
+    event_id = str(uuid4())
+    _buffer_event(
+        {
+            "type": SearchEventType.search,
+            "uuid": event_id,
+            "query": query,
+            "filters": {name: value for name, value in filters.items() if value},
+            "result_count": result_count,
+            "latency": round(latency * 1000),
+            "page": page,
+            "timestamp": timezone.now(),
+        }
+    )
+    return event_id
+
+
+def emit_click_event(event_id: str, product_id: int) -> None:
+    _buffer_event(
+        {
+            "type": SearchEventType.click,
+            "uuid": event_id,
+            "product_id": product_id,
+            "timestamp": timezone.now(),
+        }
+    )
+
+
+def store_search_events(events: list[dict]) -> int:
+    searches = [e for e in events if e["type"] == SearchEventType.search]
+    clicks = [e for e in events if e["type"] == SearchEventType.click]
+
+    with transaction.atomic():
+        SearchEvent.objects.bulk_create(
+            [
+                SearchEvent(
+                    uuid=event["uuid"],
+                    query=normalize_query(event["query"])[:400],
+                    filters=event["filters"],
+                    page=event["page"],
+                    result_count=event["result_count"],
+                    latency=event["latency"],
+                    created_on=event["timestamp"],
+                )
+                for event in searches
+            ],
+            ignore_conflicts=True,
+        )
+
+        product_ids = set(
+            Product.objects.filter(
+                pk__in=[e["product_id"] for e in clicks]
+            ).values_list("pk", flat=True)
+        )
+        for event in clicks:
+            if event["product_id"] in product_ids:
+                SearchEvent.objects.filter(uuid=event["uuid"]).update(
+                    clicked_product_id=event["product_id"]
+                )
+
+        keys = {
+            (timezone.localdate(event.created_on), event.query)
+            for event in SearchEvent.objects.filter(
+                uuid__in=[e["uuid"] for e in events]
+            ).only("created_on", "query")
+        }
+        SearchQueryStatistic.objects.update_from_events(SearchEvent, keys)
+
+    return len(events)
+
+
+def flush_search_events(batch_size: int = 500) -> int:
+    """
+    Store the buffered search events in batches.
+
+    Only the events numbered before the previous flush are stored: an event is
+    numbered before it is written to the buffer, so the most recent numbers
+    might not be written yet.
+    """
+    if not cache.add(FLUSH_LOCK_CACHE_KEY, True, timeout=60 * 5):
+        logger.info("search events are already being flushed")
+        return 0
+
+    try:
+        flushed = cache.get(EVENT_FLUSHED_CACHE_KEY, 0)
+        counter = cache.get(EVENT_COUNTER_CACHE_KEY, 0)
+        if counter < flushed:
+            # the counter was reset
+            flushed = 0
+        last = min(cache.get(EVENT_FLUSH_HORIZON_CACHE_KEY, 0), counter)
+        cache.set(EVENT_FLUSH_HORIZON_CACHE_KEY, counter, timeout=None)
+
+        total = 0
+        for start in range(flushed + 1, last + 1, batch_size):
+            keys = [
+                get_event_cache_key(number)
+                for number in range(start, min(start + batch_size, last + 1))
+            ]
+            events = cache.get_many(keys)
+            total += store_search_events([events[k] for k in keys if k in events])
+            cache.delete_many(keys)
+            cache.set(EVENT_FLUSHED_CACHE_KEY, start + len(keys) - 1, timeout=None)
+    finally:
+        cache.delete(FLUSH_LOCK_CACHE_KEY)
+
+    return total
+
+
+def delete_expired_search_events() -> int:
+    """
+    Only the statistics are kept after the retention period.
+    """
+    expired_before = timezone.now() - timedelta(
+        days=settings.SEARCH_EVENTS_RETENTION_DAYS
+    )
+    total, _deleted = SearchEvent.objects.filter(created_on__lt=expired_before).delete()
+    return total
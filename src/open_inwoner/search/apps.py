@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class SearchConfig(AppConfig):
+    name = "open_inwoner.search"
+
+    def ready(self):
+        from .signals import (  # noqa
+            invalidate_search_autocomplete,
+            invalidate_search_lookups,
+        )
@@ -0,0 +1,85 @@
+"""
+Caching of search data.
+
+The (rarely changing) data needed for every search, the field boosts and the
+names of the facet choices, is cached in-process. The cached data is tied to a
+version kept in the shared cache, which is bumped when one of the models is
+changed, so all processes rebuild their data on the next search.
+
+The autocomplete suggestions are cached per prefix in the shared cache, under
+a version that is bumped when the search index is updated.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models
+
+from open_inwoner.utils.cache import (
+    LocalVersionedCache,
+    bump_cache_version,
+    get_cache_version,
+)
+from open_inwoner.utils.hash import create_sha256_hash
+
+from .models import FieldBoost
+
+VERSION_CACHE_KEY = "search:lookups:version"
+AUTOCOMPLETE_VERSION_CACHE_KEY = "search:autocomplete:version"
+
+_lookups = LocalVersionedCache(VERSION_CACHE_KEY)
+
+
+def invalidate_lookups() -> None:
+    _lookups.invalidate()
+
+
+def get_lookup(name: str, build):
+    return _lookups.get(name, build)
+
+
+def get_field_boosts() -> dict:
+    return get_lookup("field_boosts", FieldBoost.objects.as_dict)
+
+
+def get_facet_names(model: type[models.Model]) -> dict[str, str]:
+    """
+    Map the slugs of the facet model to the names, ordered by slug.
+    """
+    return get_lookup(
+        f"facet_names:{model._meta.label_lower}",
+        lambda: dict(model.objects.order_by("slug").values_list("slug", "name")),
+    )
+
+
+#
+# autocomplete
+#
+
+
+def get_autocomplete_version() -> str:
+    return get_cache_version(AUTOCOMPLETE_VERSION_CACHE_KEY)
+
+
+def invalidate_autocomplete() -> None:
+    bump_cache_version(AUTOCOMPLETE_VERSION_CACHE_KEY)
+
+
+def get_autocomplete_etag(prefix: str) -> str:
+    return create_sha256_hash(
+        f"{get_autocomplete_version()}:{prefix}", salt=settings.SECRET_KEY
+    )
+
+
+def get_autocomplete_cache_key(prefix: str) -> str:
+    return f"search:autocomplete:{get_autocomplete_etag(prefix)}"
+
+
+def get_cached_autocomplete(prefix: str, build) -> list[str]:
+    if len(prefix) < settings.ES_SUGGEST_MIN_LENGTH:
+        return []
+
+    key = get_autocomplete_cache_key(prefix)
+    options = cache.get(key)
+    if options is None:
+        options = build(prefix)
+        cache.set(key, options, timeout=settings.CACHE_SEARCH_AUTOCOMPLETE_TIMEOUT)
+    return options
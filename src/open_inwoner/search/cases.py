@@ -0,0 +1,102 @@
+"""
+Look up search queries as the identification of one of the user's cases.
+
+Only queries that look like a case identification (as configured per ZGW API
+group) are looked up, first in an index of the user's (cached) case list and
+only then in the Zaken API itself.
+"""
+import logging
+from concurrent.futures import Executor, Future
+
+from django.conf import settings
+from django.core.cache import cache
+
+from open_inwoner.openzaak.api_models import Zaak
+from open_inwoner.openzaak.models import ZGWApiGroupConfig
+from open_inwoner.openzaak.utils import is_zaak_visible
+from open_inwoner.utils.hash import create_sha256_hash
+
+logger = logging.getLogger(__name__)
+
+CaseLookup = tuple[ZGWApiGroupConfig, Future]
+
+
+def get_case_lookup_groups(query: str) -> list[ZGWApiGroupConfig]:
+    """
+    Return the API groups for which the query looks like a case identification.
+    """
+    return [
+        group
+        for group in ZGWApiGroupConfig.objects.select_related(
+            "zrc_service", "ztc_service"
+        ).order_by("pk")
+        if group.matches_case_identification(query)
+    ]
+
+
+def get_case_index_cache_key(group: ZGWApiGroupConfig, fetch_params: dict) -> str:
+    params = ":".join(f"{key}={value}" for key, value in sorted(fetch_params.items()))
+    hashed_params = create_sha256_hash(params, salt=settings.SECRET_KEY)
+    return f"search:case_index:{group.pk}:{hashed_params}"
+
+
+def get_user_case_index(group: ZGWApiGroupConfig, fetch_params: dict) -> dict:
+    """
+    Map the identifications of the user's cases to the cases.
+    """
+    cache_key = get_case_index_cache_key(group, fetch_params)
+    index = cache.get(cache_key)
+    if index is None:
+        # this is the same (cached) call as used for the user's case list
+        cases = group.zaken_client.fetch_cases(**fetch_params)
+        index = {case.identificatie: case for case in cases if case.identificatie}
+        cache.set(cache_key, index, timeout=settings.CACHE_ZGW_ZAKEN_TIMEOUT)
+    return index
+
+
+def find_user_case(
+    group: ZGWApiGroupConfig, fetch_params: dict, identificatie: str
+) -> Zaak | None:
+    zaak = get_user_case_index(group, fetch_params).get(identificatie)
+    if not zaak:
+        # the case list is limited to the first pages of the user's cases
+        cases = group.zaken_client.fetch_cases(
+            **fetch_params, identificatie=identificatie
+        )
+        if cases:
+            zaak = cases[0]
+
+    if zaak:
+        zaak.zaaktype = group.catalogi_client.fetch_single_case_type(zaak.zaaktype)
+    return zaak
+
+
+def start_case_lookups(
+    executor: Executor, query: str, fetch_params: dict
+) -> list[CaseLookup]:
+    return [
+        (group, executor.submit(find_user_case, group, fetch_params, query))
+        for group in get_case_lookup_groups(query)
+    ]
+
+
+def get_visible_case(
+    lookups: list[CaseLookup],
+) -> tuple[Zaak | None, ZGWApiGroupConfig | None, bool]:
+    """
+    Return the first visible case found by the lookups (in order of the API
+    groups), its API group and whether any of the lookups failed.
+    """
+    has_errors = False
+    for group, future in lookups:
+        try:
+            zaak = future.result()
+        except Exception:
+            logger.exception("Error while looking up case in API group %s", group)
+            has_errors = True
+            continue
+
+        if zaak and is_zaak_visible(zaak):
+            return zaak, group, has_errors
+
+    return None, None, has_errors
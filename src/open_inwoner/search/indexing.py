@@ -0,0 +1,223 @@
+"""
+Rebuild the product search index without downtime.
+
+``ES_INDEX_PRODUCTS`` is an alias of a versioned index. A rebuild populates a
+new index next to the live one and atomically moves the alias when it is done,
+so searches never see a partial or empty index. Products that changed while
+the new index was built are replayed afterwards.
+
+The state of the last run (the indexed products and synonyms) is kept in the
+cache, which allows an incremental update of only the changed products.
+"""
+import json
+import logging
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+from elasticsearch_dsl import Search
+
+from open_inwoner.utils.hash import create_sha256_hash
+
+from .analyzers import synonym_filter
+from .cache import invalidate_autocomplete
+from .documents import ProductDocument
+from .utils import load_synonyms
+
+logger = logging.getLogger(__name__)
+
+INDEX_STATE_CACHE_KEY = "search:products_index:state"
+
+
+@dataclass
+class IndexResult:
+    index: str
+    indexed: int = 0
+    deleted: int = 0
+    rebuilt: bool = False
+
+    def __str__(self):
+        action = "Rebuilt" if self.rebuilt else "Updated"
+        return (
+            f"{action} index '{self.index}': "
+            f"{self.indexed} products indexed, {self.deleted} deleted"
+        )
+
+
+def get_fingerprint(value) -> str:
+    return create_sha256_hash(
+        json.dumps(value, sort_keys=True, cls=DjangoJSONEncoder),
+        salt=settings.SECRET_KEY,
+    )
+
+
+def get_index_state() -> dict | None:
+    return cache.get(INDEX_STATE_CACHE_KEY)
+
+
+def set_index_state(index_name: str, synonyms: str, fingerprints: dict) -> None:
+    cache.set(
+        INDEX_STATE_CACHE_KEY,
+        {
+            "index": index_name,
+            "synonyms": synonyms,
+            "products": fingerprints,
+            "updated_on": timezone.now(),
+        },
+        timeout=None,
+    )
+
+
+def get_alias_indices(alias: str) -> list[str]:
+    connection = ProductDocument._get_connection()
+    if not connection.indices.exists_alias(name=alias):
+        return []
+    return sorted(connection.indices.get_alias(name=alias).keys())
+
+
+def get_indexing_queryset():
+    return (
+        ProductDocument()
+        .get_queryset()
+        .prefetch_related(
+            "categories",
+            "tags__type",
+            "organizations__type",
+            "organizations__neighbourhood",
+        )
+        .order_by("pk")
+    )
+
+
+def get_indexed_ids(index_name: str) -> set[int]:
+    search = Search(using=ProductDocument._get_connection(), index=index_name)
+    return {int(hit.meta.id) for hit in search.source(False).scan()}
+
+
+def sync_products(
+    index_name: str, fingerprints: dict, parallel: bool = False
+) -> tuple[int, int]:
+    """
+    Index the products whose document differs from the given fingerprints and
+    delete the documents of products that are no longer published.
+
+    The fingerprints are updated in place.
+    """
+    document = ProductDocument()
+
+    actions = []
+    for product in get_indexing_queryset():
+        source = document.prepare(product)
+        fingerprint = get_fingerprint(source)
+        if fingerprints.get(product.pk) == fingerprint:
+            continue
+
+        fingerprints[product.pk] = fingerprint
+        actions.append(
+            {
+                "_op_type": "index",
+                "_index": index_name,
+                "_id": product.pk,
+                "_source": source,
+            }
+        )
+
+    if actions and parallel:
+        document.parallel_bulk(actions)
+    elif actions:
+        document.bulk(actions)
+
+    published_ids = set(get_indexing_queryset().values_list("pk", flat=True))
+    stale_ids = (set(fingerprints) | get_indexed_ids(index_name)) - published_ids
+    if stale_ids:
+        document.bulk(
+            (
+                {"_op_type": "delete", "_index": index_name, "_id": pk}
+                for pk in stale_ids
+            ),
+            raise_on_error=False,
+        )
+    for pk in stale_ids:
+        fingerprints.pop(pk, None)
+
+    ProductDocument._get_connection().indices.refresh(index=index_name)
+    return len(actions), len(stale_ids)
+
+
+def switch_alias(alias: str, index_name: str) -> list[str]:
+    """
+    Atomically point the alias to the new index and return the old indices.
+    """
+    connection = ProductDocument._get_connection()
+    old_indices = get_alias_indices(alias)
+
+    actions = [{"add": {"alias": alias, "index": index_name}}]
+    if old_indices:
+        actions.append({"remove": {"alias": alias, "indices": old_indices}})
+    elif connection.indices.exists(index=alias):
+        # replace the plain index created by `search_index --rebuild`
+        actions.append({"remove_index": {"index": alias}})
+
+    connection.indices.update_aliases(body={"actions": actions})
+    return old_indices
+
+
+def rebuild_products_index(
+    parallel: bool = True, keep_old_indices: bool = False
+) -> IndexResult:
+    alias = ProductDocument._index._name
+    index_name = f"{alias}-{timezone.now():%Y%m%d%H%M%S%f}"
+
+    # the synonyms are part of the analysis settings of the index
+    synonyms = load_synonyms()
+    synonym_filter.synonyms = synonyms
+
+    logger.info("building search index '%s'", index_name)
+    ProductDocument._index.clone(name=index_name).create()
+
+    fingerprints = {}
+    indexed, _deleted = sync_products(index_name, fingerprints, parallel=parallel)
+
+    old_indices = switch_alias(alias, index_name)
+    logger.info("search index alias '%s' points to '%s'", alias, index_name)
+
+    # replay the products that changed while the index was built, these were
+    # written to the previous index
+    replayed, deleted = sync_products(index_name, fingerprints)
+    if replayed or deleted:
+        logger.info("replayed %s changed products", replayed + deleted)
+
+    if old_indices and not keep_old_indices:
+        ProductDocument._get_connection().indices.delete(
+            index=",".join(old_indices), ignore=404
+        )
+
+    set_index_state(index_name, get_fingerprint(synonyms), fingerprints)
+    invalidate_autocomplete()
+    return IndexResult(index=index_name, indexed=indexed, deleted=deleted, rebuilt=True)
+
+
+def update_products_index() -> IndexResult:
+    """
+    Only index the products that changed since the last run. A change of the
+    synonyms (or a missing state) requires a full rebuild.
+    """
+    alias = ProductDocument._index._name
+    state = get_index_state()
+    if (
+        not state
+        or state["index"] not in get_alias_indices(alias)
+        or state["synonyms"] != get_fingerprint(load_synonyms())
+    ):
+        return rebuild_products_index()
+
+    fingerprints = state["products"]
+    indexed, deleted = sync_products(state["index"], fingerprints)
+
+    set_index_state(state["index"], state["synonyms"], fingerprints)
+    if indexed or deleted:
+        invalidate_autocomplete()
+    return IndexResult(index=state["index"], indexed=indexed, deleted=deleted)
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+
+from ...indexing import rebuild_products_index, update_products_index
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the product search index in a new index and switch the alias "
+        "when it is done"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Only index the products that changed since the last run.",
+        )
+        parser.add_argument(
+            "--keep-old-indices",
+            action="store_true",
+            help="Do not delete the indices replaced by the rebuild.",
+        )
+        parser.add_argument(
+            "--no-parallel",
+            action="store_false",
+            dest="parallel",
+            help="Index the products in a single thread.",
+        )
+
+    def handle(self, *args, **options):
+        if options["incremental"]:
+            result = update_products_index()
+        else:
+            result = rebuild_products_index(
+                parallel=options["parallel"],
+                keep_old_indices=options["keep_old_indices"],
+            )
+        self.stdout.write(self.style.SUCCESS(str(result)))
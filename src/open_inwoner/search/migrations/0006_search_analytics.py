@@ -0,0 +1,162 @@
+# Generated by Django 4.2.16 on 2026-10-19 12:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("pdc", "0066_category_access_groups"),
+        ("search", "0005_initial_boost"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchEvent",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "uuid",
+                    models.UUIDField(
+                        help_text="Identifies the search in the (buffered) click events",
+                        unique=True,
+                        verbose_name="UUID",
+                    ),
+                ),
+                (
+                    "query",
+                    models.CharField(
+                        db_index=True,
+                        help_text="The normalized search query",
+                        max_length=400,
+                        verbose_name="Query",
+                    ),
+                ),
+                (
+                    "filters",
+                    models.JSONField(
+                        blank=True,
+                        default=dict,
+                        help_text="The facet filters used with the search",
+                        verbose_name="Filters",
+                    ),
+                ),
+                (
+                    "page",
+                    models.PositiveIntegerField(
+                        default=1,
+                        help_text="The page of the search results",
+                        verbose_name="Page",
+                    ),
+                ),
+                (
+                    "result_count",
+                    models.PositiveIntegerField(
+                        help_text="The total number of search results",
+                        verbose_name="Result count",
+                    ),
+                ),
+                (
+                    "latency",
+                    models.PositiveIntegerField(
+                        help_text="The duration of the search in milliseconds",
+                        verbose_name="Latency",
+                    ),
+                ),
+                (
+                    "created_on",
+                    models.DateTimeField(
+                        db_index=True,
+                        help_text="The moment of the search",
+                        verbose_name="Created on",
+                    ),
+                ),
+                (
+                    "clicked_product",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="The search result which was opened",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="pdc.product",
+                        verbose_name="Clicked product",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Search event",
+                "verbose_name_plural": "Search events",
+            },
+        ),
+        migrations.CreateModel(
+            name="SearchQueryStatistic",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField(verbose_name="Date")),
+                (
+                    "query",
+                    models.CharField(
+                        help_text="The normalized search query",
+                        max_length=400,
+                        verbose_name="Query",
+                    ),
+                ),
+                (
+                    "search_count",
+                    models.PositiveIntegerField(default=0, verbose_name="Searches"),
+                ),
+                (
+                    "zero_result_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Searches without results"
+                    ),
+                ),
+                (
+                    "click_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Clicked results"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Search query statistic",
+                "verbose_name_plural": "Top search queries",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="searchquerystatistic",
+            constraint=models.UniqueConstraint(
+                fields=("date", "query"), name="unique_search_query_statistic"
+            ),
+        ),
+        migrations.CreateModel(
+            name="ZeroResultSearchQueryStatistic",
+            fields=[],
+            options={
+                "verbose_name": "Search query without results",
+                "verbose_name_plural": "Search queries without results",
+                "proxy": True,
+                "indexes": [],
+                "constraints": [],
+            },
+            bases=("search.searchquerystatistic",),
+        ),
+    ]
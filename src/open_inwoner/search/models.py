@@ -1,11 +1,11 @@
 from django.core.validators import MinValueValidator
 from django.db import models
-from django.db.models.deletion import CASCADE
+from django.db.models.deletion import CASCADE, SET_NULL
 from django.utils.translation import gettext_lazy as _
 
 from django_jsonform.models.fields import ArrayField
 
-from .query import FieldBoostQueryset
+from .query import FieldBoostQueryset, SearchQueryStatisticQueryset
 
 
 class Synonym(models.Model):
@@ -110,3 +110,99 @@ class FieldBoost(models.Model):
 
     def __str__(self):
         return f"{self.field} - {self.boost}"
+
+
+class SearchEvent(models.Model):
+    uuid = models.UUIDField(
+        verbose_name=_("UUID"),
+        unique=True,
+        help_text=_("Identifies the search in the (buffered) click events"),
+    )
+    query = models.CharField(
+        verbose_name=_("Query"),
+        max_length=400,
+        db_index=True,
+        help_text=_("The normalized search query"),
+    )
+    filters = models.JSONField(
+        verbose_name=_("Filters"),
+        default=dict,
+        blank=True,
+        help_text=_("The facet filters used with the search"),
+    )
+    page = models.PositiveIntegerField(
+        verbose_name=_("Page"),
+        default=1,
+        help_text=_("The page of the search results"),
+    )
+    result_count = models.PositiveIntegerField(
+        verbose_name=_("Result count"),
+        help_text=_("The total number of search results"),
+    )
+    latency = models.PositiveIntegerField(
+        verbose_name=_("Latency"),
+        help_text=_("The duration of the search in milliseconds"),
+    )
+    clicked_product = models.ForeignKey(
+        "pdc.Product",
+        verbose_name=_("Clicked product"),
+        null=True,
+        blank=True,
+        on_delete=SET_NULL,
+        related_name="+",
+        help_text=_("The search result which was opened"),
+    )
+    created_on = models.DateTimeField(
+        verbose_name=_("Created on"),
+        db_index=True,
+        help_text=_("The moment of the search"),
+    )
+
+    class Meta:
+        verbose_name = _("Search event")
+        verbose_name_plural = _("Search events")
+
+    def __str__(self):
+        return self.query
+
+
+class SearchQueryStatistic(models.Model):
+    date = models.DateField(verbose_name=_("Date"))
+    query = models.CharField(
+        verbose_name=_("Query"),
+        max_length=400,
+        help_text=_("The normalized search query"),
+    )
+    search_count = models.PositiveIntegerField(
+        verbose_name=_("Searches"),
+        default=0,
+    )
+    zero_result_count = models.PositiveIntegerField(
+        verbose_name=_("Searches without results"),
+        default=0,
+    )
+    click_count = models.PositiveIntegerField(
+        verbose_name=_("Clicked results"),
+        default=0,
+    )
+
+    objects = SearchQueryStatisticQueryset.as_manager()
+
+    class Meta:
+        verbose_name = _("Search query statistic")
+        verbose_name_plural = _("Top search queries")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["date", "query"], name="unique_search_query_statistic"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.date}: {self.query}"
+
+
+class ZeroResultSearchQueryStatistic(SearchQueryStatistic):
+    class Meta:
+        proxy = True
+        verbose_name = _("Search query without results")
+        verbose_name_plural = _("Search queries without results")
@@ -1,6 +1,42 @@
+from django.db.models import Count, Q
+from django.db.models.functions import TruncDate
 from django.db.models.query import QuerySet
 
 
 class FieldBoostQueryset(QuerySet):
     def as_dict(self) -> dict:
         return {b.field: b.boost for b in self}
+
+
+class SearchQueryStatisticQueryset(QuerySet):
+    def update_from_events(self, event_model, keys: set[tuple]) -> int:
+        """
+        (Re)calculate the statistics of the given (date, query) pairs from the
+        search events.
+        """
+        if not keys:
+            return 0
+
+        dates = {date for date, _query in keys}
+        queries = {query for _date, query in keys}
+        rows = (
+            event_model.objects.filter(created_on__date__in=dates, query__in=queries)
+            .annotate(date=TruncDate("created_on"))
+            .values("date", "query")
+            .annotate(
+                # browsing the pages of the results is a single search
+                search_count=Count("id", filter=Q(page=1)),
+                zero_result_count=Count("id", filter=Q(page=1, result_count=0)),
+                click_count=Count("id", filter=Q(clicked_product__isnull=False)),
+            )
+        )
+        statistics = [
+            self.model(**row) for row in rows if (row["date"], row["query"]) in keys
+        ]
+        self.bulk_create(
+            statistics,
+            update_conflicts=True,
+            unique_fields=["date", "query"],
+            update_fields=["search_count", "zero_result_count", "click_count"],
+        )
+        return len(statistics)
@@ -3,13 +3,15 @@ from dataclasses import dataclass
 from operator import attrgetter
 from typing import Type
 
+from django.conf import settings
 from django.db import models
 
-from elasticsearch_dsl import FacetedResponse
+from elasticsearch_dsl import FacetedResponse, FacetedSearch
 from elasticsearch_dsl.response import Response
 
 from open_inwoner.pdc.models import Product
 
+from .cache import get_facet_names
 from .documents import ProductDocument
 
 
@@ -59,18 +61,17 @@ class Facet:
     @property
     def bucket_mapping(self) -> dict:
         if not hasattr(self, "_mapping"):
-            self._mapping = {m.slug: m.name for m in self.model.objects.all()}
+            self._mapping = get_facet_names(self.model)
         return self._mapping
 
     @property
     def empty_buckets(self) -> list[FacetBucket]:
         if not hasattr(self, "_empty_buckets"):
-            bucket_slugs = [b.slug for b in self.buckets]
-            empty_queryset = self.model.objects.exclude(slug__in=bucket_slugs).order_by(
-                "slug"
-            )
+            bucket_slugs = {b.slug for b in self.buckets}
             self._empty_buckets = [
-                FacetBucket(name=m.name, slug=m.slug) for m in empty_queryset
+                FacetBucket(name=name, slug=slug)
+                for slug, name in self.bucket_mapping.items()
+                if slug not in bucket_slugs
             ]
         return self._empty_buckets
 
@@ -92,17 +93,69 @@ class Facet:
 class ProductSearchResult:
     results: list[ProductDocument]
     facets: list[Facet]
+    total: int = 0
+    offset: int = 0
     _r: FacetedResponse = None
+    _search: FacetedSearch = None
 
     @classmethod
-    def build_from_response(cls, response: FacetedResponse):
+    def build_from_response(
+        cls,
+        response: FacetedResponse,
+        search: FacetedSearch | None = None,
+        offset: int = 0,
+    ):
         facets = []
         for facet_name, facet_buckets in response.facets.to_dict().items():
             model = getattr(Product, facet_name).rel.model
             facet = Facet(name=facet_name, buckets=facet_buckets, model=model)
             facets.append(facet)
 
-        return cls(results=response.hits, facets=facets, _r=response)
+        # hits beyond the result window of the index can't be retrieved
+        total = min(response.hits.total.value, settings.ES_MAX_SIZE)
+
+        return cls(
+            results=response.hits,
+            facets=facets,
+            total=total,
+            offset=offset,
+            _r=response,
+            _search=search,
+        )
+
+
+class PaginatedHits:
+    """
+    The hits of a search as object list for a ``Paginator``.
+
+    The page of hits that was retrieved with the search is returned as is, any
+    other slice (e.g. the last page) is requested from Elasticsearch.
+    """
+
+    def __init__(self, result: ProductSearchResult):
+        self.result = result
+
+    def count(self) -> int:
+        return self.result.total
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            return self[key : key + 1][0]
+
+        start = key.start or 0
+        stop = min(key.stop or self.count(), self.count())
+        hits = list(self.result.results)
+        offset = self.result.offset
+
+        if start == offset and (
+            stop - start <= len(hits) or offset + len(hits) >= self.count()
+        ):
+            return hits[: stop - start]
+
+        return list(self.result._search[start:stop].execute().hits)
 
 
 @dataclass(frozen=True)
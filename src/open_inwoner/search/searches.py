@@ -2,10 +2,11 @@ from django.conf import settings
 
 from elasticsearch_dsl import FacetedSearch, NestedFacet, TermsFacet, query
 
+from .cache import get_cached_autocomplete, get_field_boosts
 from .constants import FacetChoices
 from .documents import ProductDocument
-from .models import FieldBoost
 from .results import AutocompleteResult, ProductSearchResult
+from .utils import normalize_query
 
 
 class ProductSearch(FacetedSearch):
@@ -48,7 +49,7 @@ class ProductSearch(FacetedSearch):
         Add boosts for particular fields which are configured in the FieldBoost model
         """
         boosted_fields = []
-        boost_mapping = FieldBoost.objects.as_dict()
+        boost_mapping = get_field_boosts()
 
         for field in self.fields:
             boosted_field = (
@@ -70,11 +71,22 @@ class ProductSearch(FacetedSearch):
         return search
 
 
-def search_products(query_str: str, filters=None) -> ProductSearchResult:
-    s = ProductSearch(query_str, filters=filters or {})[: settings.ES_MAX_SIZE]
-    response = s.execute()
+def search_products(
+    query_str: str, filters=None, page: int = 1, page_size: int | None = None
+) -> ProductSearchResult:
+    """
+    Search a single page of products, the facets and the total number of hits are
+    returned by the same request.
+    """
+    page_size = page_size or settings.ES_MAX_SIZE
+    # stay within the result window of the index, the paginator rejects pages
+    # beyond the total anyway
+    offset = max(min((page - 1) * page_size, settings.ES_MAX_SIZE - page_size), 0)
+
+    s = ProductSearch(query_str, filters=filters or {})
+    response = s[offset : offset + page_size].execute()
 
-    return ProductSearchResult.build_from_response(response)
+    return ProductSearchResult.build_from_response(response, search=s, offset=offset)
 
 
 def search_autocomplete(query_str: str):
@@ -101,3 +113,14 @@ def search_autocomplete(query_str: str):
     return AutocompleteResult.build_from_response(
         response, order=["name_suggest", "keyword_suggest"]
     )
+
+
+def autocomplete_options(query_str: str) -> list[str]:
+    """
+    The (cached) autocomplete options for the prefix, too short prefixes don't
+    get any options.
+    """
+    return get_cached_autocomplete(
+        normalize_query(query_str),
+        lambda prefix: search_autocomplete(prefix).options,
+    )
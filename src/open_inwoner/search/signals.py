@@ -0,0 +1,21 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from open_inwoner.pdc.models import Category, Organization, Product, Tag
+
+from .cache import invalidate_autocomplete, invalidate_lookups
+from .models import FieldBoost
+
+
+@receiver([post_save, post_delete], sender=FieldBoost)
+@receiver([post_save, post_delete], sender=Category)
+@receiver([post_save, post_delete], sender=Tag)
+@receiver([post_save, post_delete], sender=Organization)
+def invalidate_search_lookups(sender, **kwargs):
+    invalidate_lookups()
+
+
+@receiver([post_save, post_delete], sender=Product)
+def invalidate_search_autocomplete(sender, **kwargs):
+    # the suggestions change when the product is (automatically) reindexed
+    invalidate_autocomplete()
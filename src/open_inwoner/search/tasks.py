@@ -1,9 +1,18 @@
 import io
 import logging
 
+from django.contrib.auth import get_user_model
 from django.core.management import call_command
+from django.utils import translation
+from django.utils.dateparse import parse_datetime
+from django.utils.translation import gettext as _
+
+from timeline_logger.models import TimelineLog
 
 from open_inwoner.celery import app
+from open_inwoner.utils.logentry import LOG_ACTIONS
+
+from . import analytics
 
 logger = logging.getLogger(__name__)
 
@@ -14,8 +23,62 @@ def rebuild_search_index():
 
     out = io.StringIO()
 
-    call_command("search_index", "--rebuild", "-f", stdout=out)
+    call_command("rebuild_search_index", stdout=out)
 
     logger.info("finished rebuild_search_index() task")
 
     return out.getvalue()
+
+
+@app.task
+def update_search_index():
+    logger.info("starting update_search_index() task")
+
+    out = io.StringIO()
+
+    call_command("rebuild_search_index", "--incremental", stdout=out)
+
+    logger.info("finished update_search_index() task")
+
+    return out.getvalue()
+
+
+@app.task
+def flush_search_events():
+    total = analytics.flush_search_events()
+    logger.info("stored %s search events", total)
+    return total
+
+
+@app.task
+def delete_expired_search_events():
+    total = analytics.delete_expired_search_events()
+    logger.info("deleted %s expired search events", total)
+    return total
+
+
+@app.task
+def log_search_query(user_id: int, query: str, timestamp: str, language: str):
+    """
+    Log the search query of a user, outside of the request/response cycle.
+    """
+    user = get_user_model().objects.filter(pk=user_id).first()
+    if user is None:
+        logger.warning("cannot log search query of deleted user %s", user_id)
+        return
+
+    with translation.override(language):
+        message = _("search query: {query}").format(query=query)
+
+    logger.info("User action: %s, %s.", user, message)
+    log = TimelineLog.objects.create(
+        content_object=user,
+        user=user,
+        extra_data={
+            "content_object_repr": str(user),
+            "message": message,
+            "action_flag": LOG_ACTIONS[4],
+        },
+    )
+    # the timestamp is set on creation, use the time of the search instead
+    TimelineLog.objects.filter(pk=log.pk).update(timestamp=parse_datetime(timestamp))
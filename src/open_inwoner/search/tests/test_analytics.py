@@ -0,0 +1,142 @@
+from datetime import date
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from django_webtest import WebTest
+from freezegun import freeze_time
+
+from open_inwoner.pdc.tests.factories import ProductFactory
+from open_inwoner.utils.test import ClearCachesMixin
+
+from ..analytics import (
+    delete_expired_search_events,
+    emit_click_event,
+    emit_search_event,
+    flush_search_events,
+)
+from ..models import SearchEvent, SearchQueryStatistic
+
+
+def flush_buffered_events(**kwargs) -> int:
+    # buffered events are stored by the flush after the one that saw them
+    return flush_search_events(**kwargs) + flush_search_events(**kwargs)
+
+
+@freeze_time("2024-05-01 12:00:00")
+class SearchAnalyticsTests(ClearCachesMixin, TestCase):
+    def test_search_events_are_buffered_until_flushed(self):
+        event_id = emit_search_event(
+            "Parkeer  Vergunning",
+            filters={"tags": ["parkeren"], "categories": []},
+            result_count=3,
+            latency=0.0123,
+        )
+
+        self.assertFalse(SearchEvent.objects.exists())
+
+        self.assertEqual(flush_buffered_events(), 1)
+
+        event = SearchEvent.objects.get()
+        self.assertEqual(str(event.uuid), event_id)
+        self.assertEqual(event.query, "parkeer vergunning")
+        self.assertEqual(event.filters, {"tags": ["parkeren"]})
+        self.assertEqual(event.result_count, 3)
+        self.assertEqual(event.latency, 12)
+        self.assertEqual(event.created_on, timezone.now())
+
+        # flushed events are not stored again
+        self.assertEqual(flush_buffered_events(), 0)
+        self.assertEqual(SearchEvent.objects.count(), 1)
+
+    def test_recently_numbered_events_are_stored_by_the_next_flush(self):
+        emit_search_event("paspoort", {}, result_count=1, latency=0.1)
+
+        # the event might be numbered before it is written to the buffer
+        self.assertEqual(flush_search_events(), 0)
+        self.assertFalse(SearchEvent.objects.exists())
+
+        self.assertEqual(flush_search_events(), 1)
+        self.assertTrue(SearchEvent.objects.exists())
+
+    def test_flush_in_batches(self):
+        for i in range(5):
+            emit_search_event(f"query {i}", filters={}, result_count=1, latency=0.1)
+
+        self.assertEqual(flush_buffered_events(batch_size=2), 5)
+        self.assertEqual(SearchEvent.objects.count(), 5)
+
+    def test_statistics_per_day(self):
+        product = ProductFactory.create()
+        event_id = emit_search_event("Paspoort", {}, result_count=1, latency=0.1)
+        emit_search_event("paspoort", {}, result_count=1, latency=0.1)
+        emit_search_event("paspoort", {}, result_count=1, latency=0.1, page=2)
+        emit_search_event("rijbewijs", {}, result_count=0, latency=0.1)
+        flush_buffered_events()
+
+        emit_click_event(event_id, product.pk)
+        flush_buffered_events()
+
+        statistics = {
+            s.query: s
+            for s in SearchQueryStatistic.objects.filter(date=date(2024, 5, 1))
+        }
+        self.assertEqual(statistics["paspoort"].search_count, 2)
+        self.assertEqual(statistics["paspoort"].zero_result_count, 0)
+        self.assertEqual(statistics["paspoort"].click_count, 1)
+        self.assertEqual(statistics["rijbewijs"].search_count, 1)
+        self.assertEqual(statistics["rijbewijs"].zero_result_count, 1)
+
+        self.assertEqual(
+            SearchEvent.objects.get(uuid=event_id).clicked_product, product
+        )
+
+    @override_settings(SEARCH_EVENTS_RETENTION_DAYS=30)
+    def test_expired_events_are_deleted(self):
+        emit_search_event("paspoort", {}, result_count=1, latency=0.1)
+        flush_buffered_events()
+
+        self.assertEqual(delete_expired_search_events(), 0)
+
+        with freeze_time("2024-06-01 12:00:00"):
+            self.assertEqual(delete_expired_search_events(), 1)
+
+        # the statistics are kept
+        self.assertTrue(SearchQueryStatistic.objects.exists())
+
+
+@override_settings(ROOT_URLCONF="open_inwoner.cms.tests.urls")
+class SearchResultClickTests(ClearCachesMixin, WebTest):
+    def test_click_is_registered_and_redirects_to_product(self):
+        product = ProductFactory.create()
+        event_id = emit_search_event("paspoort", {}, result_count=1, latency=0.1)
+
+        response = self.app.get(
+            reverse(
+                "search:search_click",
+                kwargs={"event_id": event_id, "slug": product.slug},
+            )
+        )
+
+        self.assertRedirects(
+            response,
+            reverse("products:product_detail", kwargs={"slug": product.slug}),
+            fetch_redirect_response=False,
+        )
+
+        flush_buffered_events()
+        self.assertEqual(
+            SearchEvent.objects.get(uuid=event_id).clicked_product, product
+        )
+
+    def test_click_on_unknown_product(self):
+        event_id = emit_search_event("paspoort", {}, result_count=1, latency=0.1)
+
+        self.app.get(
+            reverse(
+                "search:search_click",
+                kwargs={"event_id": event_id, "slug": "unknown"},
+            ),
+            status=404,
+        )
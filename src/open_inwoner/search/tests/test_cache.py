@@ -0,0 +1,56 @@
+from django.test import TestCase, tag
+
+from open_inwoner.pdc.models import Tag
+from open_inwoner.pdc.tests.factories import ProductFactory, TagFactory
+from open_inwoner.utils.test import ClearCachesMixin
+
+from ..cache import get_facet_names, get_field_boosts
+from ..models import FieldBoost
+from ..searches import search_products
+from .utils import ESMixin
+
+
+class SearchLookupsCacheTests(ClearCachesMixin, TestCase):
+    def test_lookups_are_cached(self):
+        TagFactory.create(slug="tag", name="Tag")
+        FieldBoost.objects.create(field="name", boost=2)
+
+        self.assertEqual(get_facet_names(Tag), {"tag": "Tag"})
+        self.assertEqual(get_field_boosts(), {"name": 2})
+
+        with self.assertNumQueries(0):
+            get_facet_names(Tag)
+            get_field_boosts()
+
+    def test_lookups_are_invalidated_on_change(self):
+        tag = TagFactory.create(slug="tag", name="Tag")
+        boost = FieldBoost.objects.create(field="name", boost=2)
+        get_facet_names(Tag)
+        get_field_boosts()
+
+        tag.name = "Renamed"
+        tag.save()
+        boost.delete()
+
+        self.assertEqual(get_facet_names(Tag), {"tag": "Renamed"})
+        self.assertEqual(get_field_boosts(), {})
+
+
+@tag("elastic")
+class SearchLookupsQueriesTests(ClearCachesMixin, ESMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+
+        product = ProductFactory.create(name="Name")
+        product.tags.add(TagFactory.create())
+        TagFactory.create()
+        FieldBoost.objects.create(field="name", boost=2)
+        self.update_index()
+
+    def test_search_does_not_query_database(self):
+        search_products("Name")
+
+        with self.assertNumQueries(0):
+            result = search_products("Name")
+            for facet in result.facets:
+                facet.total_choices()
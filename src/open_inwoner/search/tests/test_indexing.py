@@ -0,0 +1,121 @@
+from unittest.mock import patch
+
+from django.test import TestCase, tag
+
+from open_inwoner.pdc.tests.factories import ProductFactory
+from open_inwoner.utils.test import ClearCachesMixin
+
+from ..analyzers import synonym_filter
+from ..documents import ProductDocument
+from ..indexing import (
+    get_alias_indices,
+    rebuild_products_index,
+    switch_alias,
+    update_products_index,
+)
+from ..models import Synonym
+from ..searches import search_products
+from .utils import ESMixin
+
+
+@tag("elastic")
+class ProductsIndexTests(ClearCachesMixin, ESMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.alias = ProductDocument._index._name
+        self.addCleanup(
+            ProductDocument._get_connection().indices.delete,
+            index=f"{self.alias}-*",
+            ignore=404,
+        )
+        self.addCleanup(setattr, synonym_filter, "synonyms", synonym_filter.synonyms)
+
+        self.product1 = ProductFactory.create(name="Parkeervergunning")
+        self.product2 = ProductFactory.create(name="Paspoort")
+
+    def assertFound(self, query, products):
+        results = search_products(query).results
+        self.assertEqual(
+            {int(result.meta.id) for result in results},
+            {product.id for product in products},
+        )
+
+    def test_rebuild_switches_alias_to_new_index(self):
+        first = rebuild_products_index()
+
+        self.assertEqual(get_alias_indices(self.alias), [first.index])
+        self.assertEqual(first.indexed, 2)
+        self.assertFound("parkeervergunning", [self.product1])
+
+        second = rebuild_products_index()
+
+        self.assertNotEqual(first.index, second.index)
+        self.assertEqual(get_alias_indices(self.alias), [second.index])
+        self.assertFalse(
+            ProductDocument._get_connection().indices.exists(index=first.index)
+        )
+        self.assertFound("parkeervergunning", [self.product1])
+
+    def test_rebuild_keeps_old_indices(self):
+        first = rebuild_products_index()
+        rebuild_products_index(keep_old_indices=True)
+
+        self.assertTrue(
+            ProductDocument._get_connection().indices.exists(index=first.index)
+        )
+
+    def test_changes_during_rebuild_are_replayed(self):
+        def change_products(alias, index_name):
+            self.product1.name = "Bewonersvergunning"
+            self.product1.save()
+            self.product2.published = False
+            self.product2.save()
+            return switch_alias(alias, index_name)
+
+        with patch(
+            "open_inwoner.search.indexing.switch_alias", side_effect=change_products
+        ):
+            result = rebuild_products_index()
+
+        self.assertEqual(result.deleted, 1)
+        self.assertFound("bewonersvergunning", [self.product1])
+        self.assertFound("paspoort", [])
+
+    def test_incremental_update_only_indexes_changed_products(self):
+        rebuild_products_index()
+
+        self.product1.name = "Bewonersvergunning"
+        self.product1.save()
+        self.product2.delete()
+        product3 = ProductFactory.create(name="Rijbewijs")
+
+        result = update_products_index()
+
+        self.assertFalse(result.rebuilt)
+        self.assertEqual(result.indexed, 2)
+        self.assertEqual(result.deleted, 1)
+        self.assertFound("bewonersvergunning", [self.product1])
+        self.assertFound("rijbewijs", [product3])
+        self.assertFound("paspoort", [])
+
+        result = update_products_index()
+
+        self.assertEqual(result.indexed, 0)
+        self.assertEqual(result.deleted, 0)
+
+    def test_incremental_update_rebuilds_without_state(self):
+        result = update_products_index()
+
+        self.assertTrue(result.rebuilt)
+        self.assertEqual(get_alias_indices(self.alias), [result.index])
+
+    def test_incremental_update_rebuilds_on_changed_synonyms(self):
+        first = rebuild_products_index()
+        Synonym.objects.create(term="auto", synonyms=["parkeervergunning"])
+
+        result = update_products_index()
+
+        self.assertTrue(result.rebuilt)
+        self.assertNotEqual(first.index, result.index)
+        self.assertFound("auto", [self.product1])
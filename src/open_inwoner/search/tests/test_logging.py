@@ -1,5 +1,6 @@
-from django.test import tag
+from django.test import TestCase, override_settings, tag
 from django.urls import reverse
+from django.utils import translation
 from django.utils.translation import gettext as _
 
 from django_webtest import WebTest
@@ -9,17 +10,20 @@ from timeline_logger.models import TimelineLog
 from open_inwoner.accounts.tests.factories import UserFactory
 from open_inwoner.utils.logentry import LOG_ACTIONS
 
+from ..tasks import log_search_query
 from .utils import ESMixin
 
 
 @tag("elastic")
 @freeze_time("2021-10-18 13:00:00")
+@override_settings(CELERY_TASK_ALWAYS_EAGER=True)
 class TestLogging(ESMixin, WebTest):
     def test_search_query_of_logged_in_user_is_logged(self):
         user = UserFactory()
         form = self.app.get(reverse("search:search"), user=user).forms["search-form"]
         form["query"] = "search for something"
-        form.submit()
+        with self.captureOnCommitCallbacks(execute=True):
+            form.submit()
 
         log_entry = TimelineLog.objects.all()[1]
 
@@ -41,8 +45,30 @@ class TestLogging(ESMixin, WebTest):
     def test_search_query_of_anonymous_user_is_not_logged(self):
         form = self.app.get(reverse("search:search")).forms["search-form"]
         form["query"] = "search for something"
-        form.submit()
+        with self.captureOnCommitCallbacks(execute=True):
+            form.submit()
 
         log_entries = TimelineLog.objects.count()
 
         self.assertEqual(log_entries, 0)
+
+
+class TestLogSearchQueryTask(TestCase):
+    def test_query_is_logged_with_the_time_and_language_of_the_search(self):
+        user = UserFactory()
+
+        with translation.override("en"):
+            log_search_query(user.pk, "something", "2021-10-18T13:00:00+00:00", "nl")
+
+        log_entry = TimelineLog.objects.get()
+        self.assertEqual(log_entry.user, user)
+        self.assertEqual(log_entry.content_object, user)
+        self.assertEqual(log_entry.timestamp.isoformat(), "2021-10-18T13:00:00+00:00")
+        with translation.override("nl"):
+            message = _("search query: {query}").format(query="something")
+        self.assertEqual(log_entry.extra_data["message"], message)
+
+    def test_query_of_deleted_user_is_not_logged(self):
+        log_search_query(0, "something", "2021-10-18T13:00:00+00:00", "nl")
+
+        self.assertFalse(TimelineLog.objects.exists())
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from django.test import override_settings, tag
 from django.urls import reverse_lazy
 
@@ -17,6 +19,7 @@ from ...configurations.models import SiteConfiguration
 from ...utils.test import ClearCachesMixin
 from ...utils.tests.playwright import PlaywrightSyncLiveServerTestCase
 from ..constants import FacetChoices
+from ..searches import ProductSearch
 from .utils import ESMixin
 
 
@@ -130,6 +133,37 @@ class SearchPageTests(ClearCachesMixin, ESMixin, WebTest):
                 link["href"], f"?query=content&tags={self.tag.slug}&page=2"
             )
 
+    def test_pagination_retrieves_requested_page(self):
+        products = ProductFactory.create_batch(20, content="content")
+        self.tag.products.add(*products)
+        self.update_index()
+
+        response = self.app.get(
+            self.url, {"query": "content", "tags": self.tag.slug, "page": 2}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["paginator"].count, 21)
+        self.assertEqual(len(response.context["page_obj"].object_list), 1)
+
+        # hits, facets and total of the page come from a single search request
+        with patch.object(
+            ProductSearch,
+            "execute",
+            autospec=True,
+            side_effect=ProductSearch.execute,
+        ) as m_execute:
+            response = self.app.get(
+                self.url, {"query": "content", "tags": self.tag.slug, "page": 1}
+            )
+        m_execute.assert_called_once()
+
+        self.assertEqual(len(response.context["page_obj"].object_list), 20)
+
+        self.app.get(
+            self.url, {"query": "content", "tags": self.tag.slug, "page": 3}, status=404
+        )
+
     def test_search_filter_configuration(self):
         config = SiteConfiguration.get_solo()
 
@@ -97,6 +97,22 @@ class SearchQueryTests(ESMixin, TestCase):
         self.assertEqual(len(results), 1)
         self.assertEqual(int(results[0].meta.id), self.product1.id)
 
+    def test_search_product_page(self):
+        products = [
+            ProductFactory.create(name="Name", slug=f"name-{i}") for i in range(3)
+        ]
+        self.update_index()
+
+        result = search_products("Name", page=2, page_size=3)
+
+        self.assertEqual(result.total, 4)
+        self.assertEqual(result.offset, 3)
+        self.assertEqual(len(result.results), 1)
+        self.assertIn(
+            int(result.results[0].meta.id),
+            [self.product1.id] + [product.id for product in products],
+        )
+
 
 @tag("elastic")
 class SearchFacetTests(ESMixin, TestCase):
@@ -4,7 +4,7 @@ from django.test import TestCase
 
 from open_inwoner.celery import app as celery_app
 
-from ..tasks import rebuild_search_index
+from ..tasks import rebuild_search_index, update_search_index
 
 
 class SearchTaskTest(TestCase):
@@ -28,4 +28,14 @@ class SearchTaskTest(TestCase):
         rebuild_search_index()
 
         mock.assert_called_once()
-        self.assertEqual(mock.call_args.args, ("search_index", "--rebuild", "-f"))
+        self.assertEqual(mock.call_args.args, ("rebuild_search_index",))
+
+    @patch("open_inwoner.search.tasks.call_command")
+    def test_update_search_index_task_calls_command(
+        self,
+        mock: Mock,
+    ):
+        update_search_index()
+
+        mock.assert_called_once()
+        self.assertEqual(mock.call_args.args, ("rebuild_search_index", "--incremental"))
@@ -17,7 +17,7 @@ from open_inwoner.openzaak.tests.shared import (
     CATALOGI_ROOT,
     ZAKEN_ROOT,
 )
-from open_inwoner.utils.test import paginated_response
+from open_inwoner.utils.test import ClearCachesMixin, paginated_response
 
 from ...openzaak.tests.helpers import generate_oas_component_cached
 from .utils import ESMixin
@@ -26,7 +26,7 @@ from .utils import ESMixin
 @requests_mock.Mocker()
 @override_settings(ROOT_URLCONF="open_inwoner.cms.tests.urls")
 @tag("elastic")
-class TestSearchView(ESMixin, TransactionTestCase):
+class TestSearchView(ClearCachesMixin, ESMixin, TransactionTestCase):
     def setUp(self):
         super().setUp()
 
@@ -373,3 +373,65 @@ class TestSearchView(ESMixin, TransactionTestCase):
                 },
             ),
         )
+
+    def _zaken_requests(self, m):
+        return [r for r in m.request_history if r.url.startswith(f"{ZAKEN_ROOT}zaken")]
+
+    def test_search_free_text_does_not_look_up_cases(self, m):
+        self._setUpMocks(m)
+
+        self.client.force_login(self.user)
+        params = urlencode({"query": "parkeervergunning"}, doseq=True)
+        response = self.client.get(f'{reverse("search:search")}?{params}')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._zaken_requests(m), [])
+
+    def test_search_case_lookup_disabled_by_empty_pattern(self, m):
+        self._setUpMocks(m)
+        self.api_group.case_identification_pattern = ""
+        self.api_group.save()
+
+        self.client.force_login(self.user)
+        params = urlencode({"query": "ZAAK-2022-0000000001"}, doseq=True)
+        response = self.client.get(f'{reverse("search:search")}?{params}')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._zaken_requests(m), [])
+
+    def test_search_case_identificatie_found_in_case_list(self, m):
+        self._setUpMocks(m)
+        m.get(
+            furl(f"{ZAKEN_ROOT}zaken")
+            .add(
+                {
+                    "rol__betrokkeneIdentificatie__natuurlijkPersoon__inpBsn": self.user.bsn,
+                    "maximaleVertrouwelijkheidaanduiding": VertrouwelijkheidsAanduidingen.beperkt_openbaar,
+                }
+            )
+            .url,
+            json=paginated_response([self.zaak1, self.new_zaak]),
+        )
+
+        self.client.force_login(self.user)
+        search_url = reverse("search:search")
+        params = urlencode({"query": "ZAAK-2022-0000000001"}, doseq=True)
+        for _i in range(2):
+            response = self.client.get(f"{search_url}?{params}")
+
+            self.assertEqual(response.status_code, 302)
+            self.assertEqual(
+                response.url,
+                reverse(
+                    "cases:case_detail",
+                    kwargs={
+                        "object_id": "d8bbdeb7-770f-4ca9-b1ea-77b4730bf67d",
+                        "api_group_id": self.api_group.id,
+                    },
+                ),
+            )
+
+        # the case list is fetched once, no identificatie specific requests
+        zaken_requests = self._zaken_requests(m)
+        self.assertEqual(len(zaken_requests), 1)
+        self.assertNotIn("identificatie", zaken_requests[0].qs)
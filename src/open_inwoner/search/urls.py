@@ -1,8 +1,13 @@
 from django.urls import path
 
-from .views import SearchView
+from .views import SearchResultClickView, SearchView
 
 app_name = "search"
 urlpatterns = [
     path("search/", SearchView.as_view(), name="search"),
+    path(
+        "search/click/<uuid:event_id>/<slug:slug>/",
+        SearchResultClickView.as_view(),
+        name="search_click",
+    ),
 ]
@@ -1,4 +1,5 @@
 import logging
+import re
 
 from django.db.utils import DatabaseError
 
@@ -17,3 +18,9 @@ def load_synonyms() -> list:
         return []
 
     return synonyms
+
+
+def normalize_query(value: str) -> str:
+    # the completion fields are (lowercase) analyzed with the simple analyzer,
+    # and case and whitespace don't matter for the search statistics either
+    return re.sub(r"\s+", " ", value).strip().lower()
@@ -1,24 +1,33 @@
 import logging
+import time
+from functools import partial
 
 from django.contrib import messages
 from django.core.paginator import InvalidPage, Paginator
+from django.db import transaction
 from django.http import Http404
 from django.http.response import HttpResponseRedirect
+from django.shortcuts import get_object_or_404
 from django.urls import reverse, reverse_lazy
+from django.utils import timezone, translation
 from django.utils.translation import gettext as _
-from django.views.generic import FormView
+from django.views.generic import FormView, RedirectView
 
 from furl import furl
+from zgw_consumers.concurrent import parallel
 
 from open_inwoner.configurations.models import SiteConfiguration
-from open_inwoner.openzaak.clients import MultiZgwClientProxy, build_zaken_clients
-from open_inwoner.openzaak.models import ZGWApiGroupConfig
-from open_inwoner.openzaak.utils import get_user_fetch_parameters, is_zaak_visible
+from open_inwoner.openzaak.utils import get_user_fetch_parameters
+from open_inwoner.pdc.models import Product
 from open_inwoner.utils.mixins import PaginationMixin
 from open_inwoner.utils.views import CommonPageMixin, LoginMaybeRequiredMixin, LogMixin
 
+from .analytics import emit_click_event, emit_search_event
+from .cases import get_visible_case, start_case_lookups
 from .forms import FeedbackForm, SearchForm
+from .results import PaginatedHits
 from .searches import search_products
+from .tasks import log_search_query
 
 logger = logging.getLogger(__name__)
 
@@ -62,51 +71,56 @@ class SearchView(
         if not query:
             return self.render_to_response(context)
 
-        # log search query of authenticated users
+        # log search query of authenticated users, in the background
         user = self.request.user
         if user.is_authenticated:
-            self.log_user_action(user, _("search query: {query}").format(query=query))
-
-        # Check if the query exactly matches with a case that belongs to the user
-        if search_params := get_user_fetch_parameters(self.request):
-            clients = build_zaken_clients()
-            proxy_result = MultiZgwClientProxy(clients)
-            proxy_result = proxy_result.fetch_cases(
-                **search_params,
-                identificatie=query,
+            transaction.on_commit(
+                partial(
+                    log_search_query.delay,
+                    user.pk,
+                    query,
+                    timezone.now().isoformat(),
+                    translation.get_language(),
+                )
+            )
+
+        page = self.get_page_number()
+
+        # Look up the query as identification of one of the user's cases,
+        # concurrently with the product search
+        case_lookups = []
+        with parallel() as executor:
+            if search_params := get_user_fetch_parameters(self.request):
+                case_lookups = start_case_lookups(executor, query, search_params)
+
+            started = time.monotonic()
+            results = search_products(
+                query, filters=data, page=page, page_size=self.paginate_by
+            )
+            latency = time.monotonic() - started
+
+        # the search is stored for the statistics in the background
+        context["search_event_id"] = emit_search_event(
+            query,
+            filters=data,
+            result_count=results.total,
+            latency=latency,
+            page=page,
+        )
+
+        zaak, api_group, has_errors = get_visible_case(case_lookups)
+        if has_errors:
+            self.log_system_action("unable to retrieve cases", user=user)
+        if zaak:
+            return HttpResponseRedirect(
+                reverse(
+                    "cases:case_detail",
+                    kwargs={
+                        "object_id": str(zaak.uuid),
+                        "api_group_id": api_group.id,
+                    },
+                )
             )
-            if proxy_result.has_errors:
-                self.log_system_action("unable to retrieve cases", user=user)
-
-            # TODO: We should simply return multiple cases in the search results,
-            # rather than redirect. For now, we maintain the existing behavior
-            # by returning and redirect to the first case found, if any.
-            if len(proxy_result.join_results()) > 1:
-                logger.error("found multiple cases for a single set of search params")
-
-            for case_result in proxy_result.successful_responses:
-                if case_result.result:
-                    api_group = ZGWApiGroupConfig.objects.resolve_group_from_hints(
-                        client=case_result.client
-                    )
-                    zaak = proxy_result.responses[0].result[0]
-                    zaaktype = api_group.catalogi_client.fetch_single_case_type(
-                        zaak.zaaktype
-                    )
-                    zaak.zaaktype = zaaktype
-                    if is_zaak_visible(zaak):
-                        return HttpResponseRedirect(
-                            reverse(
-                                "cases:case_detail",
-                                kwargs={
-                                    "object_id": str(zaak.uuid),
-                                    "api_group_id": api_group.id,
-                                },
-                            )
-                        )
-
-        # perform search
-        results = search_products(query, filters=data)
 
         # update form fields with choices
         for facet in results.facets:
@@ -114,12 +128,23 @@ class SearchView(
                 form.fields[facet.name].choices = facet.total_choices()
 
         # paginate
-        paginator_dict = self.paginate_with_context(results.results)
+        paginator_dict = self.paginate_with_context(PaginatedHits(results))
 
         context.update(paginator_dict)
 
         return self.render_to_response(context)
 
+    def get_page_number(self) -> int:
+        """
+        The requested page, to retrieve only its hits. Invalid page numbers are
+        handled by the paginator.
+        """
+        page = self.kwargs.get(self.page_kwarg) or self.request.GET.get(self.page_kwarg)
+        try:
+            return max(int(page), 1)
+        except (TypeError, ValueError):
+            return 1
+
     def paginate_object_list(self, object_list, page_size):
         """copy past of MultipleObjectMixin.paginate_queryset method"""
         paginator = self.paginator_class(object_list, page_size)
@@ -200,3 +225,16 @@ class SearchView(
             not self.request.user.is_authenticated
             and config.hide_categories_from_anonymous_users
         )
+
+
+class SearchResultClickView(RedirectView):
+    """
+    Register the click on a search result, before redirecting to the product.
+    """
+
+    def get_redirect_url(self, *args, **kwargs):
+        product = get_object_or_404(
+            Product.objects.published(), slug=self.kwargs["slug"]
+        )
+        emit_click_event(str(self.kwargs["event_id"]), product.pk)
+        return reverse("products:product_detail", kwargs={"slug": product.slug})
@@ -120,6 +120,7 @@ urlpatterns = [
     path("faq/", FAQView.as_view(), name="general_faq"),
     path("apimock/", include("open_inwoner.apimock.urls")),
     path("kvk/", include("open_inwoner.kvk.urls")),
+    path("exports/", include("open_inwoner.utils.urls", namespace="export")),
     path("", include("open_inwoner.search.urls", namespace="search")),
     re_path(r"^", include("cms.urls")),
 ]
@@ -7,6 +7,8 @@ class UserFeedConfig(AppConfig):
     verbose_name = "User Feed"
 
     def ready(self):
+        from .signals import invalidate_feed_on_change, sync_user_tasks_on_login  # noqa
+
         auto_import_adapters()
 
 
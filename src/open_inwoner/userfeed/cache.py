@@ -0,0 +1,21 @@
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+def get_feed_cache_key(user_id: int, language: str) -> str:
+    return f"userfeed:{user_id}:{language}"
+
+
+def invalidate_feed_cache(user_ids: Iterable[int]) -> None:
+    """
+    Drop the cached feeds of the given users (for all languages)
+    """
+    keys = [
+        get_feed_cache_key(user_id, language)
+        for user_id in set(user_ids)
+        for language, _name in settings.LANGUAGES
+    ]
+    if keys:
+        cache.delete_many(keys)
@@ -1,8 +1,11 @@
 import dataclasses
 from collections.abc import Iterable
 
+from django.conf import settings
+from django.core.cache import cache
 from django.db.models import Q
 from django.utils.html import escape, format_html
+from django.utils.translation import get_language
 
 from open_inwoner.accounts.models import User
 from open_inwoner.cms.utils.page_display import get_active_app_names
@@ -11,7 +14,7 @@ from open_inwoner.userfeed.adapters import (
     get_item_adapter_class,
     get_types_for_unpublished_cms_apps,
 )
-from open_inwoner.userfeed.hooks.external_task import update_user_tasks
+from open_inwoner.userfeed.cache import get_feed_cache_key
 from open_inwoner.userfeed.models import FeedItemData
 from open_inwoner.userfeed.summarize import SUMMARIES
 
@@ -41,12 +44,26 @@ def wrap_items(items: Iterable[FeedItemData]) -> Iterable[FeedItem]:
 
 
 def get_feed(user: User) -> Feed:
+    """
+    Return the feed of the user, served from the per-user feed cache.
+
+    The cache is invalidated on every write to the user's `FeedItemData` (see
+    `FeedItemQueryset` and the model signals).
+    """
     if not user or user.is_anonymous:
         # empty feed
         return Feed()
 
-    update_user_tasks(user)
+    cache_key = get_feed_cache_key(user.pk, get_language())
+    if (feed := cache.get(cache_key)) is not None:
+        return feed
+
+    feed = build_feed(user)
+    cache.set(cache_key, feed, timeout=settings.CACHE_USERFEED_TIMEOUT)
+    return feed
+
 
+def build_feed(user: User) -> Feed:
     # core filters
     display_filter = Q(completed_at__isnull=True)
 
@@ -1,5 +1,8 @@
 import logging
 
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
 from django.utils.translation import gettext_lazy as _
 
 from requests import RequestException
@@ -97,4 +100,30 @@ def update_user_tasks(user: User):
                 update_external_task_items(user, tasks)
 
 
+def get_user_tasks_synced_key(user: User) -> str:
+    return f"userfeed:external_tasks_synced:{user.pk}"
+
+
+def schedule_user_tasks_update(user: User) -> bool:
+    """
+    Schedule a background sync of the open tasks of `user`, unless the tasks were
+    synced (or scheduled to be synced) within `USERFEED_TASKS_SYNC_DEBOUNCE` seconds.
+    """
+    if user.login_type != LoginTypeChoices.digid:
+        return False
+
+    # the marker doubles as debounce lock: `add()` only succeeds if it is absent
+    if not cache.add(
+        get_user_tasks_synced_key(user),
+        True,
+        timeout=settings.USERFEED_TASKS_SYNC_DEBOUNCE,
+    ):
+        return False
+
+    from ..tasks import sync_user_tasks
+
+    transaction.on_commit(lambda: sync_user_tasks.delay(user.pk))
+    return True
+
+
 register_item_adapter(OpenTaskFeedItem, FeedItemType.external_task)
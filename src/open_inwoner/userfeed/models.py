@@ -10,6 +10,7 @@ from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 from open_inwoner.accounts.models import User
+from open_inwoner.userfeed.cache import invalidate_feed_cache
 from open_inwoner.userfeed.choices import FeedItemType
 
 
@@ -50,6 +51,29 @@ class FeedItemManager(models.Manager):
 
 
 class FeedItemQueryset(models.QuerySet):
+    """
+    Bulk writes bypass the model signals, so these invalidate the cached feeds of
+    the affected users themselves.
+    """
+
+    def update(self, **kwargs):
+        user_ids = set(self.values_list("user_id", flat=True))
+        rows = super().update(**kwargs)
+        if rows:
+            invalidate_feed_cache(user_ids)
+        return rows
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = super().bulk_create(objs, *args, **kwargs)
+        invalidate_feed_cache(obj.user_id for obj in objs)
+        return objs
+
+    def bulk_update(self, objs, *args, **kwargs):
+        objs = list(objs)
+        rows = super().bulk_update(objs, *args, **kwargs)
+        invalidate_feed_cache(obj.user_id for obj in objs)
+        return rows
+
     def mark_completed(self, force: bool = False):
         qs = self
         if not force:
@@ -0,0 +1,17 @@
+from django.contrib.auth.signals import user_logged_in
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_feed_cache
+from .hooks.external_task import schedule_user_tasks_update
+from .models import FeedItemData
+
+
+@receiver(user_logged_in)
+def sync_user_tasks_on_login(sender, user, request, *args, **kwargs):
+    schedule_user_tasks_update(user)
+
+
+@receiver([post_save, post_delete], sender=FeedItemData)
+def invalidate_feed_on_change(sender, instance, **kwargs):
+    invalidate_feed_cache([instance.user_id])
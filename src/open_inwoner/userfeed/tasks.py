@@ -0,0 +1,54 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from open_inwoner.accounts.choices import LoginTypeChoices
+from open_inwoner.accounts.models import User
+from open_inwoner.celery import app
+
+from .hooks.external_task import (
+    get_user_tasks_synced_key,
+    schedule_user_tasks_update,
+    update_user_tasks,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@app.task
+def sync_user_tasks(user_id: int):
+    try:
+        user = User.objects.get(pk=user_id)
+    except User.DoesNotExist:
+        return
+
+    update_user_tasks(user)
+
+    # restart the debounce window from the moment the sync actually happened
+    cache.set(
+        get_user_tasks_synced_key(user),
+        timezone.now(),
+        timeout=settings.USERFEED_TASKS_SYNC_DEBOUNCE,
+    )
+
+
+@app.task
+def sync_active_user_tasks():
+    """
+    Periodically sync the open tasks of DigiD users who logged in recently
+    """
+    since = timezone.now() - timedelta(seconds=settings.USERFEED_TASKS_SYNC_ACTIVE)
+    users = User.objects.filter(
+        login_type=LoginTypeChoices.digid, last_login__gte=since, is_active=True
+    )
+
+    scheduled = 0
+    for user in users.iterator():
+        if schedule_user_tasks_update(user):
+            scheduled += 1
+
+    logger.info("scheduled open tasks sync for %d users", scheduled)
+    return scheduled
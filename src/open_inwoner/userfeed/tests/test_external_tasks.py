@@ -1,24 +1,32 @@
-from unittest.mock import call, patch
+from datetime import timedelta
+from unittest.mock import patch
 
-from django.test import TestCase
+from django.contrib.auth.signals import user_logged_in
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils import timezone
 from django.utils.translation import gettext as _
 
 import requests_mock
 from requests import RequestException
 
-from open_inwoner.accounts.tests.factories import DigidUserFactory
+from open_inwoner.accounts.tests.factories import DigidUserFactory, UserFactory
 from open_inwoner.cms.plugins.cms_plugins import UserFeedPlugin
 from open_inwoner.cms.tests import cms_tools
 from open_inwoner.openzaak.tests.factories import ZGWApiGroupConfigFactory
 from open_inwoner.openzaak.tests.mocks import ESuiteTaskData
 from open_inwoner.openzaak.tests.shared import FORMS_ROOT
 from open_inwoner.userfeed.choices import FeedItemType
-from open_inwoner.userfeed.hooks.external_task import update_user_tasks
+from open_inwoner.userfeed.hooks.external_task import (
+    schedule_user_tasks_update,
+    update_user_tasks,
+)
 from open_inwoner.userfeed.models import FeedItemData
+from open_inwoner.userfeed.tasks import sync_active_user_tasks, sync_user_tasks
 from open_inwoner.userfeed.tests.factories import FeedItemDataFactory
+from open_inwoner.utils.test import ClearCachesMixin
 
 
-class UserFeedExternalTasksTestCase(TestCase):
+class UserFeedExternalTasksTestCase(ClearCachesMixin, TestCase):
     def setUp(self):
         super().setUp()
 
@@ -29,7 +37,9 @@ class UserFeedExternalTasksTestCase(TestCase):
             form_service__api_root=FORMS_ROOT,
         )
 
-    def test_userfeed_plugin_render_triggers_update_open_tasks(self):
+    @requests_mock.Mocker()
+    def test_userfeed_plugin_render_does_not_update_open_tasks(self, m):
+        ESuiteTaskData().install_mocks(m)
         FeedItemDataFactory.create(
             type=FeedItemType.external_task,
             user=self.user,
@@ -42,17 +52,19 @@ class UserFeedExternalTasksTestCase(TestCase):
             },
         )
 
-        with patch("open_inwoner.userfeed.feed.update_user_tasks") as mock:
-            html, context = cms_tools.render_plugin(
-                UserFeedPlugin, plugin_data={}, user=self.user
-            )
+        with patch.object(sync_user_tasks, "delay") as mock_delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                html, context = cms_tools.render_plugin(
+                    UserFeedPlugin, plugin_data={}, user=self.user
+                )
 
-            # `cms_tools.render_plugin` renders twice
-            mock.assert_has_calls([call(self.user), call(self.user)])
+        # open tasks are synced in the background, not while rendering
+        self.assertFalse(m.called)
+        mock_delay.assert_not_called()
 
-            self.assertIn(f"{_('Open task')} 4321-2023", html)
-            self.assertIn(f"({_('Case number')}: 6789-2024)", html)
-            self.assertIn("Aanvullende informatie gewenst", html)
+        self.assertIn(f"{_('Open task')} 4321-2023", html)
+        self.assertIn(f"({_('Case number')}: 6789-2024)", html)
+        self.assertIn("Aanvullende informatie gewenst", html)
 
     @requests_mock.Mocker()
     def test_update_user_tasks_create(self, m):
@@ -189,3 +201,55 @@ class UserFeedExternalTasksTestCase(TestCase):
                 "zaak_identificatie": "6789-2024",
             },
         )
+
+
+@override_settings(USERFEED_TASKS_SYNC_DEBOUNCE=60)
+@patch("open_inwoner.userfeed.tasks.sync_user_tasks.delay")
+class UserFeedExternalTasksSyncTestCase(ClearCachesMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.user = DigidUserFactory.create(bsn="111111110")
+
+    def test_login_schedules_sync(self, mock_delay):
+        request = RequestFactory().get("/")
+        request.user = self.user
+
+        with self.captureOnCommitCallbacks(execute=True):
+            user_logged_in.send(self.user.__class__, user=self.user, request=request)
+
+        mock_delay.assert_called_once_with(self.user.pk)
+
+    def test_sync_is_debounced(self, mock_delay):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertTrue(schedule_user_tasks_update(self.user))
+            self.assertFalse(schedule_user_tasks_update(self.user))
+
+        mock_delay.assert_called_once_with(self.user.pk)
+
+    def test_sync_not_scheduled_for_non_digid_users(self, mock_delay):
+        user = UserFactory.create()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertFalse(schedule_user_tasks_update(user))
+
+        mock_delay.assert_not_called()
+
+    def test_periodic_sync_only_for_recently_active_users(self, mock_delay):
+        self.user.last_login = timezone.now()
+        self.user.save()
+        DigidUserFactory.create(
+            bsn="222222220", last_login=timezone.now() - timedelta(days=1)
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            scheduled = sync_active_user_tasks()
+
+        self.assertEqual(scheduled, 1)
+        mock_delay.assert_called_once_with(self.user.pk)
+
+    @patch("open_inwoner.userfeed.tasks.update_user_tasks")
+    def test_sync_task_updates_tasks(self, mock_update, mock_delay):
+        sync_user_tasks(self.user.pk)
+
+        mock_update.assert_called_once_with(self.user)
@@ -9,9 +9,10 @@ from open_inwoner.userfeed.feed import get_feed
 from open_inwoner.userfeed.hooks.common import simple_message
 from open_inwoner.userfeed.models import FeedItemData
 from open_inwoner.userfeed.tests.factories import FeedItemDataFactory
+from open_inwoner.utils.test import ClearCachesMixin
 
 
-class FeedTests(TestCase):
+class FeedTests(ClearCachesMixin, TestCase):
     @classmethod
     def setUpTestData(cls):
         cls.user = UserFactory()
@@ -56,3 +57,41 @@ class FeedTests(TestCase):
         # not visible anymore
         feed = get_feed(self.user)
         self.assertEqual(feed.total_items, 0)
+
+    def test_get_feed_is_cached(self):
+        simple_message(self.user, "Hello", title="Test message")
+        get_feed(self.user)
+
+        with self.assertNumQueries(0):
+            feed = get_feed(self.user)
+
+        self.assertEqual(feed.total_items, 1)
+
+    def test_get_feed_cache_is_invalidated_by_writes(self):
+        simple_message(self.user, "Hello", title="Test message")
+        self.assertEqual(get_feed(self.user).total_items, 1)
+
+        with self.subTest("create"):
+            simple_message(self.user, "Hello again", title="Test message")
+            self.assertEqual(get_feed(self.user).total_items, 2)
+
+        with self.subTest("queryset update"):
+            FeedItemData.objects.filter(user=self.user).mark_completed()
+            self.assertEqual(get_feed(self.user).total_items, 0)
+
+        with self.subTest("bulk create"):
+            FeedItemData.objects.bulk_create(
+                [FeedItemDataFactory.build(user=self.user)]
+            )
+            self.assertEqual(get_feed(self.user).total_items, 1)
+
+        with self.subTest("delete"):
+            FeedItemData.objects.filter(user=self.user).delete()
+            self.assertEqual(get_feed(self.user).total_items, 0)
+
+    def test_get_feed_cache_is_per_user(self):
+        other_user = UserFactory()
+        simple_message(self.user, "Hello", title="Test message")
+
+        self.assertEqual(get_feed(self.user).total_items, 1)
+        self.assertEqual(get_feed(other_user).total_items, 0)
@@ -0,0 +1,68 @@
+"""
+Versioned caching.
+
+Cached data derived from (several) models is stored under a key that contains
+a version kept in the shared cache. Bumping the version invalidates all the
+data at once, in every process, without having to know the individual keys.
+"""
+import time
+from functools import partial
+from threading import Lock
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+
+def get_cache_version(key: str) -> str:
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid4().hex, timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_cache_version(key: str) -> None:
+    cache.set(key, uuid4().hex, timeout=None)
+
+
+def bump_cache_version_on_commit(key: str) -> None:
+    """
+    Bump the version now and again when the transaction is committed, other
+    processes rebuild the data from the old state until then.
+    """
+    bump_cache_version(key)
+    transaction.on_commit(partial(bump_cache_version, key))
+
+
+class LocalVersionedCache:
+    """
+    In-process cache of (rarely changing) data, which is rebuilt by every
+    process when the version in the shared cache is bumped, or when it is older
+    than ``CACHE_LOCAL_TIMEOUT`` (in case a bump was missed).
+    """
+
+    def __init__(self, version_key: str):
+        self.version_key = version_key
+        self._lock = Lock()
+        self._version = None
+        self._expires = 0.0
+        self._data = {}
+
+    def get(self, name: str, build):
+        version = get_cache_version(self.version_key)
+        now = time.monotonic()
+        with self._lock:
+            if self._version != version or now >= self._expires:
+                self._version = version
+                self._expires = now + settings.CACHE_LOCAL_TIMEOUT
+                self._data = {}
+            data = self._data
+
+        if name not in data:
+            data[name] = build()
+        return data[name]
+
+    def invalidate(self) -> None:
+        bump_cache_version_on_commit(self.version_key)
@@ -1,9 +1,18 @@
+import json
+
+from django.conf import settings
+from django.core.cache import cache
 from django.utils.text import slugify
-from django.utils.translation import gettext as _
+from django.utils.translation import get_language, gettext as _
 
 import markdown
 from bs4 import BeautifulSoup
 
+from .hash import create_sha256_hash
+
+# change this when the rendering changes, to ignore the previously cached content
+RENDERER_VERSION = 1
+
 CLASS_ADDERS = [
     ("h1", "utrecht-heading-1"),
     ("h2", "utrecht-heading-2"),
@@ -39,10 +48,36 @@ def convert_first_row_to_th(html_tables):
                 cell.replace_with(th)
 
 
+def get_cached_render(kind: str, source: dict, render):
+    """
+    Cache the result of rendering the source, keyed by the hash of the source.
+    """
+    source_hash = create_sha256_hash(
+        json.dumps([RENDERER_VERSION, source], sort_keys=True),
+        salt=settings.SECRET_KEY,
+    )
+    key = f"rendered_content:{kind}:{source_hash}"
+
+    rendered = cache.get(key)
+    if rendered is None:
+        rendered = render()
+        cache.set(key, rendered, timeout=settings.CACHE_RENDERED_CONTENT_TIMEOUT)
+    return rendered
+
+
 def get_rendered_content(content: str) -> str:
     """
     Takes object's content as an input and returns the rendered one.
     """
+    if not content:
+        return ""
+
+    return get_cached_render(
+        "content", {"content": content}, lambda: render_content(content)
+    )
+
+
+def render_content(content: str) -> str:
     md = markdown.Markdown(extensions=["tables"])
     # remove weird undocumented \\< escape/prefix generated by CKeditor
     content = content.replace("\\<", "<")
@@ -58,10 +93,23 @@ def get_rendered_content(content: str) -> str:
     return str(soup)
 
 
-def get_product_rendered_content(product):
+def get_product_rendered_content(product) -> str:
     """
     Takes product's content as an input and returns the rendered one.
     """
+    source = {
+        "content": product.content,
+        "link": product.link,
+        "form": product.form,
+        "slug": product.slug,
+        "button_text": product.button_text,
+        # the content contains translated texts
+        "language": get_language(),
+    }
+    return get_cached_render("product", source, lambda: render_product_content(product))
+
+
+def render_product_content(product) -> str:
     md = markdown.Markdown(extensions=["tables"])
     # remove weird undocumented \\< escape/prefix generated by CKeditor
     content = product.content.replace("\\<", "<")
@@ -136,4 +184,4 @@ def get_product_rendered_content(product):
                 element.append(icon)
                 element.append(screen_reader_only_text)
 
-    return soup
+    return str(soup)
@@ -1,22 +1,38 @@
 from django.conf import settings as django_settings
 
+from open_inwoner.configurations.cache import get_site_configuration_data
 from open_inwoner.configurations.models import SiteConfiguration
+from open_inwoner.pdc.cache import get_category_tree_lookup
+from open_inwoner.pdc.managers import get_category_visibility
 from open_inwoner.pdc.models import Category, Question
 from open_inwoner.search.forms import SearchForm
 
 
-def settings(request):
-    public_settings = (
-        "GOOGLE_ANALYTICS_ID",
-        "ENVIRONMENT",
-        "SHOW_ALERT",
-        "PROJECT_NAME",
-        "DIGID_ENABLED",
+def get_menu_categories(visibility: str) -> list[Category]:
+    # the categories in the menu are the same for all users of a visibility
+    def build():
+        return list(Category.get_root_nodes().published().visible_for(visibility))
+
+    if not django_settings.CACHE_SITE_CONTEXT:
+        return build()
+    return get_category_tree_lookup(f"menu_categories:{visibility}", build)
+
+
+def has_general_faq_questions() -> bool:
+    if not django_settings.CACHE_SITE_CONTEXT:
+        return Question.objects.general().exists()
+    return get_category_tree_lookup(
+        "has_general_faq_questions", lambda: Question.objects.general().exists()
     )
 
+
+def get_site_context() -> dict:
+    """
+    The part of the context that only depends on the site configuration.
+    """
     config = SiteConfiguration.get_solo()
 
-    context = {
+    return {
         "site_name": config.name,
         "theming": {
             "primary": config.get_primary_color,
@@ -81,16 +97,9 @@ def settings(request):
         "theme_stylesheet": (
             config.theme_stylesheet.url if config.theme_stylesheet else None
         ),
-        "menu_categories": (
-            Category.get_root_nodes().published().visible_for_user(request.user)
-        ),
-        # default SearchForm, might be overwritten by actual SearchView
-        "search_form": SearchForm(auto_id=False),
         "search_filter_categories": config.search_filter_categories,
         "search_filter_tags": config.search_filter_tags,
         "search_filter_organizations": config.search_filter_organizations,
-        "has_general_faq_questions": Question.objects.general().exists(),
-        "settings": {k: getattr(django_settings, k, None) for k in public_settings},
         "hide_categories_from_anonymous_users": config.hide_categories_from_anonymous_users,
         "warning_banner_enabled": config.warning_banner_enabled,
         "warning_banner_text": config.warning_banner_text,
@@ -100,6 +109,39 @@ def settings(request):
         "contactmoment_contact_form_enabled": config.contactmoment_contact_form_enabled,
     }
 
+
+def settings(request):
+    public_settings = (
+        "GOOGLE_ANALYTICS_ID",
+        "ENVIRONMENT",
+        "SHOW_ALERT",
+        "PROJECT_NAME",
+        "DIGID_ENABLED",
+    )
+
+    if django_settings.CACHE_SITE_CONTEXT:
+        site_context = get_site_configuration_data("context", get_site_context)
+    else:
+        site_context = get_site_context()
+
+    visibility = get_category_visibility(request.user)
+    if (
+        visibility == "anonymous"
+        and site_context["hide_categories_from_anonymous_users"]
+    ):
+        menu_categories = []
+    else:
+        menu_categories = get_menu_categories(visibility)
+
+    context = {
+        **site_context,
+        "menu_categories": menu_categories,
+        # default SearchForm, might be overwritten by actual SearchView
+        "search_form": SearchForm(auto_id=False),
+        "has_general_faq_questions": has_general_faq_questions(),
+        "settings": {k: getattr(django_settings, k, None) for k in public_settings},
+    }
+
     if hasattr(django_settings, "SENTRY_CONFIG"):
         context.update(dsn=django_settings.SENTRY_CONFIG.get("public_dsn", ""))
 
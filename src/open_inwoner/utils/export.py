@@ -1,14 +1,169 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
 from django.contrib.staticfiles import finders
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.db import transaction
 from django.template.loader import render_to_string
+from django.utils import timezone
 
+from privates.storages import PrivateMediaFileSystemStorage
 from weasyprint import CSS, HTML
 
+from .hash import create_sha256_hash
 
-def render_pdf(template_name, context, base_url=None, request=None) -> bytes:
-    html_string = render_to_string(template_name, context, request)
+logger = logging.getLogger(__name__)
+
+EXPORT_DIR = "exports"
+
+
+class ExportJobStatus:
+    pending = "pending"
+    done = "done"
+    failed = "failed"
+
+
+def html_to_pdf(html_string: str, base_url=None) -> bytes:
     html = HTML(string=html_string, base_url=base_url)
 
     # add styling
     css_pdf_p = finders.find("bundles/pdf-p.css")
     css_web = finders.find("bundles/open_inwoner-css.css")
     return html.write_pdf(stylesheets=[CSS(css_pdf_p), CSS(css_web)])
+
+
+def render_pdf(template_name, context, base_url=None, request=None) -> bytes:
+    html_string = render_to_string(template_name, context, request)
+    return html_to_pdf(html_string, base_url=base_url)
+
+
+#
+# asynchronous export jobs
+#
+
+
+def get_export_storage() -> PrivateMediaFileSystemStorage:
+    return PrivateMediaFileSystemStorage()
+
+
+def get_export_job_id(user_id: int, filename: str, html_string: str) -> str:
+    """
+    The job id is derived from the rendered document, so identical exports
+    (same user, same data) share a job and are only rendered once.
+    """
+    return create_sha256_hash(
+        f"{user_id}:{filename}:{html_string}", salt=settings.SECRET_KEY
+    )
+
+
+def get_export_job_cache_key(job_id: str) -> str:
+    return f"export_job:{job_id}"
+
+
+def get_export_job(job_id: str) -> dict | None:
+    return cache.get(get_export_job_cache_key(job_id))
+
+
+def _set_export_job(job_id: str, job: dict) -> None:
+    cache.set(get_export_job_cache_key(job_id), job, timeout=settings.EXPORT_PDF_EXPIRY)
+
+
+def get_or_create_export_job(
+    user_id: int, filename: str, html_string: str, base_url=None
+) -> tuple[str, dict]:
+    """
+    Schedule rendering the HTML to PDF, unless the same export is already
+    pending or available.
+    """
+    from .tasks import render_pdf_export
+
+    job_id = get_export_job_id(user_id, filename, html_string)
+    job = {
+        "user_id": user_id,
+        "filename": filename,
+        "status": ExportJobStatus.pending,
+        "path": "",
+        "base_url": base_url,
+    }
+
+    existing = get_export_job(job_id)
+    if existing:
+        if existing["status"] != ExportJobStatus.failed:
+            return job_id, existing
+        # retry failed exports
+        _set_export_job(job_id, job)
+    elif not cache.add(
+        get_export_job_cache_key(job_id), job, timeout=settings.EXPORT_PDF_EXPIRY
+    ):
+        # a concurrent request scheduled the same export
+        return job_id, get_export_job(job_id) or job
+
+    # the document contains personal data, keep it out of the task broker
+    _save_export_file(f"{EXPORT_DIR}/{job_id}.html", html_string.encode("utf-8"))
+
+    transaction.on_commit(lambda: render_pdf_export.delay(job_id))
+    return job_id, job
+
+
+def _save_export_file(path: str, content: bytes) -> str:
+    storage = get_export_storage()
+    if storage.exists(path):
+        storage.delete(path)
+    return storage.save(path, ContentFile(content))
+
+
+def _pop_export_source(job_id: str) -> str:
+    storage = get_export_storage()
+    path = f"{EXPORT_DIR}/{job_id}.html"
+    try:
+        with storage.open(path) as source:
+            return source.read().decode("utf-8")
+    finally:
+        if storage.exists(path):
+            storage.delete(path)
+
+
+def complete_export_job(job_id: str) -> None:
+    job = get_export_job(job_id)
+    try:
+        html_string = _pop_export_source(job_id)
+    except FileNotFoundError:
+        html_string = None
+
+    if not job:
+        logger.warning("export job %s expired before it was rendered", job_id)
+        return
+
+    try:
+        if html_string is None:
+            raise FileNotFoundError(f"the document of export job {job_id} is missing")
+        file = html_to_pdf(html_string, base_url=job["base_url"])
+    except Exception:
+        logger.exception("failed to render export job %s", job_id)
+        job["status"] = ExportJobStatus.failed
+        _set_export_job(job_id, job)
+        return
+
+    path = f"{EXPORT_DIR}/{job_id}.pdf"
+    job["path"] = _save_export_file(path, file)
+    job["status"] = ExportJobStatus.done
+    _set_export_job(job_id, job)
+
+
+def delete_expired_exports() -> int:
+    storage = get_export_storage()
+    if not storage.exists(EXPORT_DIR):
+        return 0
+
+    expired_before = timezone.now() - timedelta(seconds=settings.EXPORT_PDF_EXPIRY)
+    _dirs, files = storage.listdir(EXPORT_DIR)
+
+    total = 0
+    for name in files:
+        path = f"{EXPORT_DIR}/{name}"
+        if storage.get_modified_time(path) < expired_before:
+            storage.delete(path)
+            total += 1
+    return total
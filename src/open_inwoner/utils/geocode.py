@@ -1,12 +1,17 @@
+import concurrent.futures
 import logging
+import re
+from typing import Iterable
 
 from django.conf import settings
 from django.contrib.gis.geos import GEOSGeometry, Point
 from django.utils.module_loading import import_string
 
 from furl import furl
+from geopy.exc import GeopyError
 from geopy.geocoders.base import DEFAULT_SENTINEL, Geocoder
 from geopy.location import Location
+from zgw_consumers.concurrent import parallel
 
 logger = logging.getLogger(__name__)
 
@@ -94,3 +99,42 @@ def geocode_address(address: str) -> Point | None:
 
     coordinates = (location.longitude, location.latitude)
     return Point(coordinates)
+
+
+def normalize_address(address: str) -> str:
+    """
+    Normalize the address for the lookup of its geocoded location, differences
+    in case, whitespace and the space in the postcode don't matter.
+    """
+    address = " ".join(address.split()).casefold()
+    address = re.sub(r"\s*,\s*", ", ", address)
+    return re.sub(r"\b(\d{4}) ([a-z]{2})\b", r"\1\2", address).strip(", ")
+
+
+def geocode_addresses(
+    addresses: Iterable[str], max_workers: int | None = None
+) -> dict[str, Point | None]:
+    """
+    Geocode the addresses with at most `max_workers` concurrent requests to the
+    geocoder. The addresses that failed to geocode are left out.
+    """
+    addresses = list(dict.fromkeys(addresses))
+    results = {}
+    if not addresses:
+        return results
+
+    with parallel(max_workers=max_workers or settings.GEOCODE_MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(geocode_address, address): address for address in addresses
+        }
+        for future in concurrent.futures.as_completed(futures):
+            address = futures[future]
+            try:
+                results[address] = future.result()
+            except IndexError:
+                # the geocoder didn't find the address
+                results[address] = None
+            except GeopyError:
+                logger.exception("failed to geocode address %r", address)
+
+    return results
@@ -2,13 +2,17 @@ from collections.abc import Iterable
 from time import time
 from typing import Any, TypedDict
 
+from django.conf import settings
 from django.core.cache import caches
 from django.core.exceptions import PermissionDenied
 from django.core.paginator import InvalidPage, Page, Paginator
 from django.http import Http404, HttpResponse
+from django.template.loader import render_to_string
+from django.template.response import TemplateResponse
+from django.urls import reverse
 from django.utils.translation import gettext as _
 
-from .export import render_pdf
+from .export import get_or_create_export_job, render_pdf
 
 
 class ThrottleMixin:
@@ -173,12 +177,30 @@ class UUIDAdminFirstInOrder:
 
 
 class ExportMixin:
+    """
+    Render the view's template as PDF.
+
+    By default the HTML is rendered in the request and converted to PDF by a celery
+    worker: the response is a page that polls the export job until the file can be
+    downloaded. Set ``export_async = False`` to return the PDF in the response.
+    """
+
+    export_async = True
+    export_job_template_name = "export/export_job.html"
+
     def get_filename(self):
         return f"{self.model.__name__.lower()}_{self.object.uuid}.pdf"
 
     def render_to_response(self, context, **response_kwargs):
         context["request"] = self.request
 
+        if (
+            self.export_async
+            and settings.EXPORT_PDF_ASYNC
+            and self.request.user.is_authenticated
+        ):
+            return self.render_export_job(context)
+
         file = render_pdf(
             self.template_name,
             context,
@@ -196,6 +218,28 @@ class ExportMixin:
 
         return response
 
+    def render_export_job(self, context):
+        html_string = render_to_string(self.template_name, context, self.request)
+        job_id, job = get_or_create_export_job(
+            self.request.user.pk,
+            self.get_filename(),
+            html_string,
+            base_url=self.request.build_absolute_uri(),
+        )
+        self.log_export_action()
+
+        return TemplateResponse(
+            self.request,
+            self.export_job_template_name,
+            {
+                "job": job,
+                "status_url": reverse("export:job_status", kwargs={"job_id": job_id}),
+                "download_url": reverse(
+                    "export:job_download", kwargs={"job_id": job_id}
+                ),
+            },
+        )
+
     def log_export_action(self):
         object = self.request.user
         self.log_user_action(
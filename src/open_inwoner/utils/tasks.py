@@ -0,0 +1,19 @@
+import logging
+
+from open_inwoner.celery import app
+
+from .export import complete_export_job, delete_expired_exports as _delete_expired
+
+logger = logging.getLogger(__name__)
+
+
+@app.task
+def render_pdf_export(job_id: str):
+    complete_export_job(job_id)
+
+
+@app.task
+def delete_expired_exports():
+    total = _delete_expired()
+    logger.info("deleted %s expired PDF exports", total)
+    return total
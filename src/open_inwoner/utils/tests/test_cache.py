@@ -0,0 +1,37 @@
+from django.test import TestCase, override_settings
+
+from freezegun import freeze_time
+
+from ..cache import LocalVersionedCache, bump_cache_version_on_commit, get_cache_version
+from ..test import ClearCachesMixin
+
+VERSION_CACHE_KEY = "tests:version"
+
+
+class VersionedCacheTests(ClearCachesMixin, TestCase):
+    def test_version_is_bumped_again_on_commit(self):
+        local_cache = LocalVersionedCache(VERSION_CACHE_KEY)
+        local_cache.get("data", lambda: "old")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            bump_cache_version_on_commit(VERSION_CACHE_KEY)
+            version = get_cache_version(VERSION_CACHE_KEY)
+
+            # another process rebuilds the data before the commit
+            self.assertEqual(local_cache.get("data", lambda: "old"), "old")
+
+        self.assertNotEqual(get_cache_version(VERSION_CACHE_KEY), version)
+        self.assertEqual(local_cache.get("data", lambda: "new"), "new")
+
+    @override_settings(CACHE_LOCAL_TIMEOUT=60)
+    def test_local_data_expires(self):
+        local_cache = LocalVersionedCache(VERSION_CACHE_KEY)
+
+        with freeze_time("2024-05-01 12:00:00") as frozen_time:
+            local_cache.get("data", lambda: "old")
+
+            frozen_time.tick(59)
+            self.assertEqual(local_cache.get("data", lambda: "new"), "old")
+
+            frozen_time.tick(1)
+            self.assertEqual(local_cache.get("data", lambda: "new"), "new")
@@ -0,0 +1,76 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from open_inwoner.pdc.tests.factories import CategoryFactory, ProductFactory
+from open_inwoner.pdc.utils import extract_subheadings, render_subheadings
+
+from ..ckeditor import (
+    get_product_rendered_content,
+    get_rendered_content,
+    render_content,
+    render_product_content,
+)
+from ..test import ClearCachesMixin
+
+
+class RenderedContentCacheTests(ClearCachesMixin, TestCase):
+    def test_content_is_rendered_once(self):
+        with patch(
+            "open_inwoner.utils.ckeditor.render_content", wraps=render_content
+        ) as mock_render:
+            first = get_rendered_content("## Paspoort\n\nlorem ipsum")
+            second = get_rendered_content("## Paspoort\n\nlorem ipsum")
+            get_rendered_content("## Rijbewijs")
+
+        self.assertEqual(first, second)
+        self.assertIn('class="utrecht-heading-2"', first)
+        self.assertEqual(mock_render.call_count, 2)
+
+    def test_product_content_is_rendered_per_product_data(self):
+        product = ProductFactory.create(
+            content="[CTABUTTON]", link="https://example.com"
+        )
+
+        with patch(
+            "open_inwoner.utils.ckeditor.render_product_content",
+            wraps=render_product_content,
+        ) as mock_render:
+            get_product_rendered_content(product)
+            get_product_rendered_content(product)
+            self.assertEqual(mock_render.call_count, 1)
+
+            product.link = "https://example.org"
+            rendered = get_product_rendered_content(product)
+            self.assertEqual(mock_render.call_count, 2)
+
+        self.assertIn('href="https://example.org"', rendered)
+
+    def test_subheadings_are_extracted_once(self):
+        with patch(
+            "open_inwoner.pdc.utils.render_subheadings", wraps=render_subheadings
+        ) as mock_render:
+            extract_subheadings("## Paspoort", tag="h2")
+            subheadings = extract_subheadings("## Paspoort", tag="h2")
+
+        self.assertEqual(subheadings, [("#subheading-paspoort", "Paspoort")])
+        self.assertEqual(mock_render.call_count, 1)
+
+    def test_command_renders_content_into_cache(self):
+        product = ProductFactory.create(content="## Paspoort")
+        category = CategoryFactory.create(description="## Rijbewijs")
+        out = StringIO()
+
+        call_command("cache_rendered_content", stdout=out)
+
+        self.assertIn("1 products, 1 categories", out.getvalue())
+        with patch("open_inwoner.utils.ckeditor.render_content") as mock_render, patch(
+            "open_inwoner.utils.ckeditor.render_product_content"
+        ) as mock_render_product:
+            get_product_rendered_content(product)
+            get_rendered_content(category.description)
+
+        mock_render.assert_not_called()
+        mock_render_product.assert_not_called()
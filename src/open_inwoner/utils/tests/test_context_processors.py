@@ -0,0 +1,117 @@
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory, TestCase, override_settings
+
+from open_inwoner.accounts.tests.factories import (
+    DigidUserFactory,
+    UserFactory,
+    eHerkenningUserFactory,
+)
+from open_inwoner.configurations.models import SiteConfiguration
+from open_inwoner.pdc.models import Category
+from open_inwoner.pdc.tests.factories import CategoryFactory, QuestionFactory
+
+from ..context_processors import settings as settings_context_processor
+from ..test import ClearCachesMixin
+
+
+@override_settings(CACHE_SITE_CONTEXT=True)
+class SiteContextCacheTests(ClearCachesMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.config = SiteConfiguration.get_solo()
+        self.config.name = "Mijn Gemeente"
+        self.config.save()
+
+        self.anonymous = CategoryFactory(
+            path="0001", name="Anonymous", visible_for_anonymous=True
+        )
+        self.citizens = CategoryFactory(
+            path="0002",
+            name="Citizens",
+            visible_for_anonymous=False,
+            visible_for_citizens=True,
+            visible_for_companies=False,
+        )
+        self.companies = CategoryFactory(
+            path="0003",
+            name="Companies",
+            visible_for_anonymous=False,
+            visible_for_citizens=False,
+            visible_for_companies=True,
+        )
+
+    def get_context(self, user=None):
+        request = RequestFactory().get("/")
+        request.user = user or AnonymousUser()
+        return settings_context_processor(request)
+
+    def test_context_is_cached(self):
+        self.get_context()
+
+        with self.assertNumQueries(0):
+            context = self.get_context()
+
+        self.assertEqual(context["site_name"], "Mijn Gemeente")
+        self.assertEqual(context["menu_categories"], [self.anonymous])
+        self.assertFalse(context["has_general_faq_questions"])
+
+    def test_menu_categories_per_visibility(self):
+        for user, expected in [
+            (None, [self.anonymous]),
+            (DigidUserFactory(), [self.anonymous, self.citizens]),
+            (eHerkenningUserFactory(), [self.anonymous, self.companies]),
+            (
+                UserFactory(is_staff=True),
+                [self.anonymous, self.citizens, self.companies],
+            ),
+        ]:
+            with self.subTest(user=user):
+                self.assertEqual(self.get_context(user)["menu_categories"], expected)
+                # the same categories as the category list page
+                self.assertEqual(
+                    list(
+                        Category.get_root_nodes()
+                        .published()
+                        .visible_for_user(user or AnonymousUser())
+                    ),
+                    expected,
+                )
+
+    def test_configuration_change_invalidates_context(self):
+        self.get_context()
+
+        self.config.name = "Onze Gemeente"
+        self.config.hide_categories_from_anonymous_users = True
+        self.config.save()
+
+        context = self.get_context()
+
+        self.assertEqual(context["site_name"], "Onze Gemeente")
+        self.assertEqual(context["menu_categories"], [])
+
+    def test_category_change_invalidates_menu(self):
+        self.get_context()
+
+        self.anonymous.published = False
+        self.anonymous.save()
+        QuestionFactory()
+
+        context = self.get_context()
+
+        self.assertEqual(context["menu_categories"], [])
+        self.assertTrue(context["has_general_faq_questions"])
+
+    def test_menu_built_before_the_commit_is_refreshed(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.anonymous.name = "Wonen"
+            self.anonymous.save()
+
+            # another process caches the menu before the change is committed
+            self.get_context()
+
+        # the menu categories and the general questions are queried again
+        with self.assertNumQueries(2):
+            context = self.get_context()
+
+        self.assertEqual(context["menu_categories"][0].name, "Wonen")
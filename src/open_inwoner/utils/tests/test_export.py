@@ -0,0 +1,140 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from django_webtest import WebTest
+from freezegun import freeze_time
+from privates.test import temp_private_root
+
+from open_inwoner.accounts.tests.factories import UserFactory
+from open_inwoner.plans.tests.factories import PlanFactory
+
+from ..export import (
+    EXPORT_DIR,
+    complete_export_job,
+    delete_expired_exports,
+    get_export_job,
+    get_export_storage,
+)
+from ..test import ClearCachesMixin
+
+
+@temp_private_root()
+@override_settings(
+    ROOT_URLCONF="open_inwoner.cms.tests.urls",
+    EXPORT_PDF_ASYNC=True,
+    CELERY_TASK_ALWAYS_EAGER=True,
+)
+@patch("open_inwoner.utils.export.html_to_pdf", return_value=b"%PDF-1.7 test")
+class ExportJobTests(ClearCachesMixin, WebTest):
+    def setUp(self):
+        super().setUp()
+
+        self.user = UserFactory()
+        self.plan = PlanFactory(created_by=self.user)
+        self.plan.plan_contacts.add(self.user)
+        self.export_url = reverse(
+            "collaborate:plan_export", kwargs={"uuid": self.plan.uuid}
+        )
+
+    def test_export_is_rendered_in_the_background(self, m_pdf):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.app.get(self.export_url, user=self.user)
+
+        self.assertTemplateUsed(response, "export/export_job.html")
+        self.assertTrue(response.pyquery("#export-job"))
+        status_url = response.context["status_url"]
+        m_pdf.assert_called_once()
+
+        response = self.app.get(
+            status_url, user=self.user, headers={"HX-Request": "true"}
+        )
+        self.assertEqual(response.context["job"]["status"], "done")
+
+        response = self.app.get(response.context["download_url"], user=self.user)
+
+        self.assertEqual(response.content_type, "application/pdf")
+        self.assertIn(
+            f'filename="plan_{self.plan.uuid}.pdf"', response["Content-Disposition"]
+        )
+        self.assertEqual(response.body, b"%PDF-1.7 test")
+
+    def test_pending_export_is_polled(self, m_pdf):
+        with patch("open_inwoner.utils.tasks.render_pdf_export.delay"):
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.app.get(self.export_url, user=self.user)
+
+        job_element = response.pyquery("#export-job")
+        self.assertEqual(job_element.attr("hx-get"), response.context["status_url"])
+
+        self.app.get(response.context["download_url"], user=self.user, status=404)
+
+    def test_document_is_not_sent_to_the_task(self, m_pdf):
+        with patch("open_inwoner.utils.tasks.render_pdf_export.delay") as m_delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.app.get(self.export_url, user=self.user)
+
+        job_id = response.context["status_url"].strip("/").split("/")[-1]
+        m_delay.assert_called_once_with(job_id)
+
+        source_path = f"{EXPORT_DIR}/{job_id}.html"
+        storage = get_export_storage()
+        self.assertTrue(storage.exists(source_path))
+
+        complete_export_job(job_id)
+
+        m_pdf.assert_called_once()
+        self.assertIn(self.plan.title, m_pdf.call_args.args[0])
+        self.assertFalse(storage.exists(source_path))
+        self.assertEqual(get_export_job(job_id)["status"], "done")
+
+    def test_identical_exports_are_deduplicated(self, m_pdf):
+        with patch("open_inwoner.utils.tasks.render_pdf_export.delay") as m_delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                first = self.app.get(self.export_url, user=self.user)
+                second = self.app.get(self.export_url, user=self.user)
+
+        self.assertEqual(first.context["status_url"], second.context["status_url"])
+        m_delay.assert_called_once()
+
+        # a change in the data creates a new export
+        self.plan.title = "Changed"
+        self.plan.save()
+        with patch("open_inwoner.utils.tasks.render_pdf_export.delay") as m_delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                third = self.app.get(self.export_url, user=self.user)
+
+        self.assertNotEqual(first.context["status_url"], third.context["status_url"])
+        m_delay.assert_called_once()
+
+    def test_export_job_is_private(self, m_pdf):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.app.get(self.export_url, user=self.user)
+
+        other_user = UserFactory()
+        self.app.get(
+            response.context["status_url"],
+            user=other_user,
+            headers={"HX-Request": "true"},
+            status=404,
+        )
+        self.app.get(response.context["download_url"], user=other_user, status=404)
+
+    def test_expired_exports_are_deleted(self, m_pdf):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.app.get(self.export_url, user=self.user)
+
+        job_id = response.context["status_url"].strip("/").split("/")[-1]
+        path = get_export_job(job_id)["path"]
+        self.assertTrue(path.startswith(f"{EXPORT_DIR}/"))
+
+        self.assertEqual(delete_expired_exports(), 0)
+        self.assertTrue(get_export_storage().exists(path))
+
+        with freeze_time(timezone.now() + timedelta(hours=2)):
+            self.assertEqual(delete_expired_exports(), 1)
+
+        self.assertFalse(get_export_storage().exists(path))
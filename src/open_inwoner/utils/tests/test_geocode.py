@@ -0,0 +1,53 @@
+from unittest.mock import patch
+
+from django.contrib.gis.geos import Point
+from django.test import SimpleTestCase, override_settings
+
+from geopy.exc import GeocoderTimedOut
+
+from ..geocode import geocode_addresses, normalize_address
+
+
+class NormalizeAddressTests(SimpleTestCase):
+    def test_normalize_address(self):
+        for address in [
+            "Keizersgracht 117, 1015CJ Amsterdam",
+            "keizersgracht 117,1015 cj AMSTERDAM",
+            "  Keizersgracht   117 , 1015 CJ  Amsterdam ",
+        ]:
+            with self.subTest(address=address):
+                self.assertEqual(
+                    normalize_address(address), "keizersgracht 117, 1015cj amsterdam"
+                )
+
+    def test_empty_address(self):
+        self.assertEqual(normalize_address(" ,  "), "")
+
+
+@override_settings(GEOCODE_MAX_WORKERS=2)
+class GeocodeAddressesTests(SimpleTestCase):
+    @patch("open_inwoner.utils.geocode.geocode_address")
+    def test_geocode_addresses(self, mock_geocode):
+        def geocode(address):
+            if address == "Onbekend 1":
+                raise IndexError
+            if address == "Storing 1":
+                raise GeocoderTimedOut
+            return Point(5, 52)
+
+        mock_geocode.side_effect = geocode
+
+        result = geocode_addresses(
+            ["Keizersgracht 117", "Onbekend 1", "Storing 1", "Keizersgracht 117"]
+        )
+
+        self.assertEqual(
+            result, {"Keizersgracht 117": Point(5, 52), "Onbekend 1": None}
+        )
+        # duplicates are only geocoded once
+        self.assertEqual(mock_geocode.call_count, 3)
+
+    @patch("open_inwoner.utils.geocode.geocode_address")
+    def test_no_addresses(self, mock_geocode):
+        self.assertEqual(geocode_addresses([]), {})
+        mock_geocode.assert_not_called()
@@ -0,0 +1,14 @@
+from django.urls import path
+
+from .views import ExportJobDownloadView, ExportJobStatusView
+
+app_name = "export"
+
+urlpatterns = [
+    path("<str:job_id>/", ExportJobStatusView.as_view(), name="job_status"),
+    path(
+        "<str:job_id>/download/",
+        ExportJobDownloadView.as_view(),
+        name="job_download",
+    ),
+]
@@ -1,3 +1,4 @@
+import re
 from typing import TYPE_CHECKING, Protocol
 
 from django.core.exceptions import ValidationError
@@ -198,3 +199,13 @@ def validate_array_contents_non_empty(list_: list) -> None:
         raise ValidationError(
             _("Valid strings must include at least one non-space character")
         )
+
+
+def validate_regex(value: str) -> None:
+    try:
+        re.compile(value)
+    except re.error as exc:
+        raise ValidationError(
+            _("Invalid regular expression: {error}").format(error=exc),
+            code="invalid",
+        )
@@ -1,11 +1,17 @@
 from django import http
-from django.contrib.auth.mixins import AccessMixin
+from django.contrib.auth.mixins import AccessMixin, LoginRequiredMixin
 from django.template import TemplateDoesNotExist, loader
+from django.urls import reverse
 from django.views.decorators.csrf import requires_csrf_token
 from django.views.defaults import ERROR_500_TEMPLATE_NAME
+from django.views.generic import TemplateView, View
 
+from django_sendfile import sendfile
 from view_breadcrumbs import DetailBreadcrumbMixin
 
+from open_inwoner.htmx.mixins import RequiresHtmxMixin
+
+from .export import ExportJobStatus, get_export_job, get_export_storage
 from .logentry import addition, change, deletion, system_action, user_action
 
 
@@ -119,3 +125,45 @@ class LogMixin:
         Log system events not related to a specific user.
         """
         system_action(message, content_object=instance, user=user)
+
+
+class ExportJobMixin(LoginRequiredMixin):
+    def get_job(self) -> dict:
+        job = get_export_job(self.kwargs["job_id"])
+        if not job or job["user_id"] != self.request.user.pk:
+            raise http.Http404
+        return job
+
+
+class ExportJobStatusView(RequiresHtmxMixin, ExportJobMixin, TemplateView):
+    template_name = "export/export_job_status.html"
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        job_id = self.kwargs["job_id"]
+        context.update(
+            {
+                "job": self.get_job(),
+                "status_url": reverse("export:job_status", kwargs={"job_id": job_id}),
+                "download_url": reverse(
+                    "export:job_download", kwargs={"job_id": job_id}
+                ),
+            }
+        )
+        return context
+
+
+class ExportJobDownloadView(ExportJobMixin, View):
+    def get(self, request, *args, **kwargs):
+        job = self.get_job()
+        storage = get_export_storage()
+        if job["status"] != ExportJobStatus.done or not storage.exists(job["path"]):
+            raise http.Http404
+
+        return sendfile(
+            request,
+            storage.path(job["path"]),
+            attachment=True,
+            attachment_filename=job["filename"],
+            mimetype="application/pdf",
+        )